@@ -0,0 +1,18 @@
+"""
+    Benchmarks for the engine hot paths
+
+    Run them from the repository root (no window or sound card needed):
+
+        python -m benchmarks.micro              # all the microbenchmarks, results as JSON
+        python -m benchmarks.micro noise region # just some of them
+        python -m benchmarks.shader
+        python -m benchmarks.scenarios          # whole game loop scenarios, results as JSON
+        python -m benchmarks.allocations        # GC collections and pauses with 200 mobs
+        python -m benchmarks.compare BASELINE   # flag regressions of the latest results
+"""
+
+import os
+
+# Headless SDL, before anything imports pygame
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
@@ -0,0 +1,103 @@
+""" GC pressure of the game loop with 200 mobs: collections, GC pauses and allocations per tick """
+
+import gc
+import random
+from argparse import ArgumentParser
+from time import perf_counter
+
+from benchmarks import harness
+from benchmarks.scenarios import BUDGET, SEED, fill, spawn
+from source.core.headless import Headless
+
+
+def run(ticks: int = 2048, mobs: int = 200) -> dict:
+    """
+        Run the night scenario, counting the collections of each generation
+
+        - CPython has no counter of all the allocations, but a gen 0 collection
+          runs each gc.get_threshold()[0] container objects (lists, dicts, tuples
+          and class instances) allocated and not freed yet, that is what we count
+        - pygame vectors aren't tracked by the GC, they only cost allocation time
+    """
+    random.seed(SEED)
+
+    headless = Headless()
+    headless.initialize(SEED, populate = False)
+    headless.run(1) # Load the chunks around the player
+
+    headless.game.updater.ticks = 40000 # Night
+    fill(headless, headless.world.tiles.grass.id, 12)
+    spawn(headless, mobs)
+
+    collections = [0, 0, 0]
+    pauses = []
+    started = 0.0
+
+    def callback(phase: str, info: dict) -> None:
+        nonlocal started
+        if phase == 'start':
+            started = perf_counter()
+        else:
+            collections[info['generation']] += 1
+            pauses.append((perf_counter() - started) * 1000)
+
+    threshold = gc.get_threshold()[0]
+    times = []
+    game = headless.game
+
+    gc.collect()
+    gc.callbacks.append(callback)
+    try:
+        for _ in range(ticks):
+            start = perf_counter()
+            game.update()
+            times.append((perf_counter() - start) * 1000)
+
+        pending = gc.get_count()[0]
+    finally:
+        gc.callbacks.remove(callback)
+
+    entities = len(headless.world.entities)
+    headless.quit()
+
+    times.sort()
+    last = len(times) - 1
+
+    return {
+        'name': f"night ({mobs} mobs)",
+        'ticks': ticks,
+        'entities': entities,
+        'gen0': collections[0],
+        'gen1': collections[1],
+        'gen2': collections[2],
+        'gen0_per_1000_ticks': collections[0] * 1000 / ticks,
+        'allocations_per_tick': (sum(collections) * threshold + pending) / ticks,
+        'gc_ms': sum(pauses),
+        'gc_worst': max(pauses, default = 0.0),
+        'p50': times[int(last * 0.50)],
+        'p99': times[int(last * 0.99)],
+        'worst': times[last],
+        'over_budget': sum(time > BUDGET for time in times),
+    }
+
+
+def main() -> None:
+    parser = ArgumentParser(description = "Minicraft GC pressure benchmark")
+    parser.add_argument('--ticks', type = int, default = 2048, help = "ticks to run (2048 by default)")
+    parser.add_argument('--mobs', type = int, default = 200, help = "mobs around the player (200 by default)")
+    parser.add_argument('--output', '-o', metavar = 'FILE', help = "JSON results file (timestamped in ./profiles by default)")
+    args = parser.parse_args()
+
+    result = run(args.ticks, args.mobs)
+
+    print(f"> {result['name']}, {result['ticks']} ticks")
+    print(f"  collections: gen0 {result['gen0']}, gen1 {result['gen1']}, gen2 {result['gen2']} ({result['gen0_per_1000_ticks']:.1f} gen0 per 1000 ticks)")
+    print(f"  net container allocations: {result['allocations_per_tick']:.1f} per tick")
+    print(f"  GC pauses: {result['gc_ms']:.2f} ms in total, worst {result['gc_worst']:.2f} ms")
+    print(f"  ticks: p50 {result['p50']:.2f}, p99 {result['p99']:.2f}, worst {result['worst']:.2f} ms ({result['over_budget']} over budget)")
+
+    print(f"> results saved to {harness.save('allocations', [result], args.output)}")
+
+
+if __name__ == "__main__":
+    main()
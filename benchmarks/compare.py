@@ -0,0 +1,107 @@
+""" Compare benchmark results against a baseline, and flag the regressions """
+
+import glob
+import json
+import os
+import sys
+from argparse import ArgumentParser
+
+from source.utils.profiler import Profiler
+
+
+# Compared metrics of each suite, and if higher values are worse
+METRICS: dict[str, dict[str, bool]] = {
+    'micro': {
+        'best': True,
+    },
+    'scenarios': {
+        'p50': True,
+        'p95': True,
+        'p99': True,
+        'worst': True,
+        'chunks_per_second': False,
+        'peak_rss_mb': True,
+    },
+    'allocations': {
+        'gen0_per_1000_ticks': True,
+        'allocations_per_tick': True,
+        'gc_ms': True,
+        'p50': True,
+        'p99': True,
+    },
+}
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """
+        Compare two results files (of the same suite)
+
+        Arguments:
+            baseline: Stored results
+            current: New results
+            threshold: Allowed change (0.10 is 10% worse)
+
+        Returns:
+            The regressions, one line each
+    """
+    metrics = METRICS[current['suite']]
+    before = {result['name']: result for result in baseline['results']}
+    regressions = []
+
+    for result in current['results']:
+        old = before.get(result['name'])
+        if not old:
+            print(f"  {result['name']}: not in the baseline")
+            continue
+
+        for metric, higher_worse in metrics.items():
+            if not old.get(metric) or result.get(metric) is None:
+                continue
+
+            change = (result[metric] - old[metric]) / old[metric]
+            worse = change > threshold if higher_worse else change < -threshold
+
+            line = f"{result['name']} {metric}: {old[metric]:.2f} -> {result[metric]:.2f} ({change:+.1%})"
+            print(f"  {'REGRESSION ' if worse else ''}{line}")
+
+            if worse:
+                regressions.append(line)
+
+    return regressions
+
+
+def main() -> None:
+    parser = ArgumentParser(description = "Compare benchmark results against a baseline")
+    parser.add_argument('baseline', help = "baseline results (JSON from benchmarks.micro, benchmarks.scenarios or benchmarks.allocations)")
+    parser.add_argument('current', nargs = '?', help = "new results (the latest of the same suite in ./profiles by default)")
+    parser.add_argument('--threshold', type = float, default = 0.10, help = "allowed change before flagging, 0.10 by default (10%%)")
+    args = parser.parse_args()
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+
+    current = args.current
+    if current is None:
+        found = sorted(glob.glob(os.path.join(Profiler.PROFILES_DIR, f"{baseline['suite']}-*.json")))
+        if not found:
+            parser.error(f"no {baseline['suite']} results in {Profiler.PROFILES_DIR}")
+        current = found[-1]
+
+    with open(current) as file:
+        results = json.load(file)
+
+    if results['suite'] != baseline['suite']:
+        parser.error(f"can't compare {results['suite']} results with a {baseline['suite']} baseline")
+
+    print(f"> {current} against {args.baseline} (threshold {args.threshold:.0%})")
+    regressions = compare(baseline, results, args.threshold)
+
+    if regressions:
+        print(f"> {len(regressions)} regressions")
+        sys.exit(1)
+
+    print("> no regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+""" Timing helpers and JSON results for the benchmarks """
+
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from statistics import median
+from time import perf_counter
+from typing import Callable
+
+import pygame
+
+from source.utils.profiler import Profiler
+
+
+def environment() -> dict:
+    """ Where the benchmarks ran (to compare runs over time) """
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output = True, text = True, timeout = 5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+
+    return {
+        'time': datetime.now().isoformat(timespec = 'seconds'),
+        'commit': commit,
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'pygame': pygame.version.ver,
+        'sdl': ".".join(map(str, pygame.get_sdl_version())),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def measure(name: str, function: Callable[[], object], number: int, setup: Callable[[], object] = None, repeat: int = 5, per: int = 1, unit: str = 'call') -> dict:
+    """
+        Time a function, only the calls (not their setup)
+
+        Arguments:
+            name: Benchmark name
+            function: What to time
+            number: Calls per round
+            setup: Called before each call, not timed
+            repeat: Rounds (the best one is the least noisy)
+            per: Operations done by each call, the results are per operation
+            unit: What an operation is (call, chunk, tile, sample ...)
+
+        Returns:
+            The result, times in microseconds per operation
+    """
+    rounds = []
+
+    for _ in range(repeat):
+        total = 0.0
+
+        for _ in range(number):
+            if setup:
+                setup()
+
+            start = perf_counter()
+            function()
+            total += perf_counter() - start
+
+        rounds.append(total * 1_000_000 / (number * per))
+
+    result = {
+        'name': name,
+        'unit': unit,
+        'best': min(rounds),
+        'median': median(rounds),
+        'worst': max(rounds),
+        'number': number,
+        'repeat': repeat,
+        'per': per,
+    }
+
+    print(f"  {name:<32} {result['best']:>12.2f} us/{unit} (median {result['median']:.2f})")
+    return result
+
+
+def save(suite: str, results: list[dict], filename: str = None) -> str:
+    """
+        Save the results with the environment as JSON
+
+        Arguments:
+            suite: Suite name (micro, scenarios ...)
+            results: The measured results
+            filename: Where to save them, a timestamped file in the profiles directory if not given
+
+        Returns:
+            The filename
+    """
+    if filename is None:
+        os.makedirs(Profiler.PROFILES_DIR, exist_ok = True)
+        filename = os.path.join(Profiler.PROFILES_DIR, datetime.now().strftime(f'{suite}-%Y%m%d-%H%M%S.json'))
+
+    with open(filename, 'w') as file:
+        json.dump({'suite': suite, 'environment': environment(), 'results': results}, file, indent = 4)
+
+    return filename
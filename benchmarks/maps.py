@@ -0,0 +1,95 @@
+""" Canned tile maps for the pathfinding benchmarks """
+
+from random import Random
+
+from source.utils.constants import CHUNK_SIZE
+from source.world.chunk import Chunk
+from source.world.world import World
+
+# Map characters
+OPEN = '.'
+WALL = '#'
+WATER = '~'
+
+
+def open_map(size: int = 48) -> list[str]:
+    """ An open field with a pond in the middle, walled around """
+    rows = []
+
+    for y in range(size):
+        row = ""
+        for x in range(size):
+            if x == 0 or y == 0 or x == size - 1 or y == size - 1:
+                row += WALL
+            elif abs(x - size // 2) < size // 8 and abs(y - size // 2) < size // 8:
+                row += WATER
+            else:
+                row += OPEN
+        rows.append(row)
+
+    return rows
+
+
+def maze_map(cells: int = 10, seed: int = 0) -> list[str]:
+    """
+        A perfect maze, corridors are 3 tiles wide (mobs need the 4 tiles around
+        them free) and the walls 1 tile, so the cell (i, j) center is at (4i + 2, 4j + 2)
+    """
+    size = cells * 4 + 1
+    grid = [[WALL] * size for _ in range(size)]
+
+    def carve(cx: int, cy: int, dx: int = 0, dy: int = 0) -> None:
+        for y in range(4 * cy + 1 - (dy < 0) * 4, 4 * cy + 4 + (dy > 0) * 4):
+            for x in range(4 * cx + 1 - (dx < 0) * 4, 4 * cx + 4 + (dx > 0) * 4):
+                grid[y][x] = OPEN
+
+    # Iterative backtracker, deterministic for a seed
+    random = Random(seed)
+    visited = {(0, 0)}
+    stack = [(0, 0)]
+    carve(0, 0)
+
+    while stack:
+        cx, cy = stack[-1]
+        around = [
+            (dx, dy) for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))
+            if 0 <= cx + dx < cells and 0 <= cy + dy < cells and (cx + dx, cy + dy) not in visited
+        ]
+
+        if not around:
+            stack.pop()
+            continue
+
+        dx, dy = random.choice(around)
+        carve(cx, cy, dx, dy)
+
+        visited.add((cx + dx, cy + dy))
+        stack.append((cx + dx, cy + dy))
+
+    return ["".join(row) for row in grid]
+
+
+def load(world: World, rows: list[str]) -> None:
+    """ Replace the world chunks with a map, its top-left corner at (0, 0), padded with walls """
+    tiles = {
+        OPEN: world.tiles.grass,
+        WALL: world.tiles.stone,
+        WATER: world.tiles.water
+    }
+
+    height = -(-len(rows) // CHUNK_SIZE)
+    width = -(-max(len(row) for row in rows) // CHUNK_SIZE)
+
+    world.chunks.clear()
+
+    for cy in range(height):
+        for cx in range(width):
+            chunk_tiles = [
+                [
+                    tiles[(rows[y][x] if y < len(rows) and x < len(rows[y]) else WALL)].clone()
+                    for x in range(cx * CHUNK_SIZE, (cx + 1) * CHUNK_SIZE)
+                ]
+                for y in range(cy * CHUNK_SIZE, (cy + 1) * CHUNK_SIZE)
+            ]
+
+            world.chunks[(cx, cy)] = Chunk(cx, cy, chunk_tiles)
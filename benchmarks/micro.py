@@ -0,0 +1,251 @@
+""" Microbenchmarks for the engine hot paths (world generation, rendering, storage and AI) """
+
+import os
+from argparse import ArgumentParser
+from random import Random
+
+from pygame import Vector2
+
+from benchmarks import harness, maps, shader
+from source.core.headless import Headless
+from source.entity.mob.zombie import Zombie
+from source.utils.constants import CHUNK_SIZE, SCREEN_HALF, TILE_SIZE
+from source.utils.region import Region
+from source.utils.saveload import Saveload
+from source.world.chunk import Chunk
+from source.world.collision import Collision
+from source.world.noise import Noise
+
+
+SEED: int = 12345
+
+# Noise samples per call
+SAMPLES: int = 1000
+
+
+def noise(headless: Headless) -> list[dict]:
+    perm = headless.world.perm
+    points = [(x * 0.037, y * 0.041) for x in range(40) for y in range(SAMPLES // 40)]
+
+    return [
+        harness.measure(f"noise.{field.__name__}", lambda field = field: [field(perm, x, y) for x, y in points], 5, per = SAMPLES, unit = 'sample')
+        for field in (Noise.heightmap, Noise.humidity, Noise.temperature, Noise.noise)
+    ]
+
+
+def generator(headless: Headless) -> list[dict]:
+    world = headless.world
+    chunks = iter(range(1_000_000))
+
+    # Always a new chunk (far from the spawn), the noise cost depends on the place
+    def make_chunk() -> None:
+        index = next(chunks)
+        world.generator.make_chunk(1000 + index % 97, 1000 + index // 97, world.perm)
+
+    return [harness.measure("generator.make_chunk", make_chunk, 10, unit = 'chunk')]
+
+
+def tilemap(headless: Headless) -> list[dict]:
+    world = headless.world
+    chunk: Chunk = world.chunks[(world.player.cx, world.player.cy)]
+    base_x, base_y = chunk.x * CHUNK_SIZE, chunk.y * CHUNK_SIZE
+
+    def connectors() -> None:
+        for y, row in enumerate(chunk.tiles):
+            for x, tile in enumerate(row):
+                world.tilemap.connector(world, tile, base_x + x, base_y + y)
+
+    return [harness.measure("tilemap.connector", connectors, 20, per = CHUNK_SIZE * CHUNK_SIZE, unit = 'tile')]
+
+
+def render(headless: Headless) -> list[dict]:
+    world = headless.world
+    chunk: Chunk = world.chunks[(world.player.cx, world.player.cy)]
+
+    # Same camera as the world render
+    camera_x = int(SCREEN_HALF[0] - (world.player.position.x * TILE_SIZE))
+    camera_y = int(SCREEN_HALF[1] - (world.player.position.y * TILE_SIZE))
+
+    return [harness.measure("chunk.render", lambda: chunk.render(world, camera_x, camera_y), 50, setup = world.surfaces.clear, unit = 'chunk')]
+
+
+def region(headless: Headless) -> list[dict]:
+    world = headless.world
+    data = {'tiles': world.chunks[(world.player.cx, world.player.cy)].data()}
+
+    region = Region(os.path.join(world.save_dir, 'bench'), 0, 0)
+
+    slots = iter(range(1_000_000))
+    def write() -> None:
+        index = next(slots) % (Region.REGION_SIZE * Region.REGION_SIZE)
+        region.write_chunk(index % Region.REGION_SIZE, index // Region.REGION_SIZE, data)
+
+    results = [harness.measure("region.write_chunk", write, 64)]
+
+    slots = iter(range(1_000_000))
+    def read() -> None:
+        index = next(slots) % (Region.REGION_SIZE * Region.REGION_SIZE)
+        region.read_chunk(index % Region.REGION_SIZE, index // Region.REGION_SIZE)
+
+    results.append(harness.measure("region.read_chunk", read, 64))
+    return results
+
+
+def saveload(headless: Headless, dirty: int = 32) -> list[dict]:
+    world = headless.world
+    chunks = list(world.chunks.values())[:dirty]
+
+    def modify() -> None:
+        for chunk in chunks:
+            chunk.modified = True
+
+    return [harness.measure(f"saveload.save ({len(chunks)} dirty chunks)", lambda: Saveload.save(headless.game.updater), 5, setup = modify, unit = 'save')]
+
+
+def pathfinding(headless: Headless) -> list[dict]:
+    world = headless.world
+    brain = Zombie().brain
+    results = []
+
+    # Keep the generated world, the maps replace it
+    chunks = dict(world.chunks)
+
+    open_size = 48
+    maze_cells = 10
+    cases = (
+        ("open", maps.open_map(open_size), Vector2(2, 2), Vector2(open_size - 3, open_size - 3)),
+        ("maze", maps.maze_map(maze_cells, SEED), Vector2(2, 2), Vector2(maze_cells * 4 - 2, maze_cells * 4 - 2)),
+    )
+
+    for name, rows, start, end in cases:
+        maps.load(world, rows)
+        results.append(harness.measure(f"brain.find_path ({name})", lambda: brain.find_path(world, start, end), 5, unit = 'path'))
+
+    world.chunks = chunks
+    return results
+
+
+def flowfield(headless: Headless) -> list[dict]:
+    world = headless.world
+    player = world.player
+    chunks = dict(world.chunks)
+    position = Vector2(player.position)
+
+    # The player in the middle of the open map, the mobs in its chase range
+    size = 48
+    maps.load(world, maps.open_map(size))
+    player.position.update(size // 2 + 0.5, 8.5)
+
+    random = Random(SEED)
+    results = []
+
+    # A rebuild (the player moved) and the step of each mob, per mob
+    for mobs in (10, 50, 200):
+        positions = [Vector2(player.position.x + random.uniform(-4, 4), player.position.y + random.uniform(-4, 4)) for _ in range(mobs)]
+
+        def chase() -> None:
+            world.flow.dirty = True
+            for mob in positions:
+                world.flow.toward(mob)
+
+        results.append(harness.measure(f"flowfield.chase ({mobs} mobs)", chase, 20, per = mobs, unit = 'mob'))
+
+    player.position.update(position)
+    world.chunks = chunks
+    world.flow.dirty = True
+    return results
+
+
+def collision(headless: Headless, bodies: int = 200) -> list[dict]:
+    world = headless.world
+    chunks = dict(world.chunks)
+
+    # The bodies on the open map, each one walking to the opposite side (through the pond)
+    size = 48
+    maps.load(world, maps.open_map(size))
+
+    random = Random(SEED)
+    starts = [Vector2(random.uniform(2, size - 3), random.uniform(2, size - 3)) for _ in range(bodies)]
+    zombies = [Zombie() for _ in range(bodies)]
+    moves = [(zombie, size - start.x, size - start.y) for zombie, start in zip(zombies, starts)]
+
+    def reset() -> None:
+        for zombie, start in zip(zombies, starts):
+            zombie.position.update(start)
+
+    def move() -> None:
+        for body, mx, my in moves:
+            Collision.move(world, body, mx, my, body.speed)
+
+    result = harness.measure(f"collision.move ({bodies} bodies)", move, 100, setup = reset, per = bodies, unit = 'body')
+
+    world.chunks = chunks
+    return [result]
+
+
+def tiles(headless: Headless) -> list[dict]:
+    world = headless.world
+    tiles = world.tiles
+
+    # Half dirt and half grass, so the grass spreads
+    random = Random(SEED)
+    original = [
+        [(tiles.grass if random.random() < 0.5 else tiles.dirt).clone() for _ in range(CHUNK_SIZE)]
+        for _ in range(CHUNK_SIZE)
+    ]
+
+    chunk = Chunk(1000, 1000, [row[:] for row in original])
+    world.chunks[(chunk.x, chunk.y)] = chunk
+
+    def reset() -> None:
+        chunk.fill([row[:] for row in original])
+
+    result = harness.measure("world.update_tiles", lambda: world.update_tiles(chunk, tiles.dirt, tiles.grass, [tiles.grass, tiles.flower]), 200, setup = reset, unit = 'chunk')
+
+    del world.chunks[(chunk.x, chunk.y)]
+    return [result]
+
+
+BENCHMARKS = {
+    'noise': noise,
+    'generator': generator,
+    'tilemap': tilemap,
+    'render': render,
+    'region': region,
+    'saveload': saveload,
+    'pathfinding': pathfinding,
+    'collision': collision,
+    'flowfield': flowfield,
+    'tiles': tiles,
+    'shader': lambda headless: shader.benchmarks(),
+}
+
+
+def main() -> None:
+    parser = ArgumentParser(description = "Minicraft engine microbenchmarks")
+    parser.add_argument('names', nargs = '*', metavar = 'NAME', help = f"benchmarks to run (all by default): {', '.join(BENCHMARKS)}")
+    parser.add_argument('--output', '-o', metavar = 'FILE', help = "JSON results file (timestamped in ./profiles by default)")
+    args = parser.parse_args()
+
+    if unknown := set(args.names) - set(BENCHMARKS):
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    headless = Headless()
+    headless.initialize(SEED, populate = False)
+
+    # Load the chunks around the player
+    headless.run(1)
+
+    print(f"> microbenchmarks (seed {SEED}, best of 5 rounds)")
+
+    results = []
+    for name in args.names or BENCHMARKS:
+        results.extend(BENCHMARKS[name](headless))
+
+    headless.quit()
+
+    print(f"> results saved to {harness.save('micro', results, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
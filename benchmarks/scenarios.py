@@ -0,0 +1,210 @@
+""" End-to-end scenarios through the headless game loop, with tick-time budgets """
+
+import json
+import random
+import subprocess
+import sys
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Callable
+
+import pygame
+
+from benchmarks import harness
+from source.core.headless import Headless
+from source.core.input import ScriptedInput
+from source.utils.constants import GAME_TICKS
+from source.utils.profiler import Profiler
+from source.utils.tests import Tests
+
+try:
+    import resource
+except ImportError: # Windows
+    resource = None
+
+
+SEED: int = 12345
+
+# A tick over this is a dropped frame
+BUDGET: float = 1000 / GAME_TICKS
+
+
+def fill(headless: Headless, tile: int, radius: int) -> None:
+    """ Fill a square around the player (so the scenario doesn't depend on the terrain) """
+    x, y = int(headless.world.player.position.x), int(headless.world.player.position.y)
+
+    for ty in range(y - radius, y + radius + 1):
+        for tx in range(x - radius, x + radius + 1):
+            headless.world.set_tile(tx, ty, tile)
+
+
+def spawn(headless: Headless, count: int) -> None:
+    """ Spawn mobs around the player like SHIFT+G does """
+    world = headless.world
+
+    for _ in range(count * 10):
+        if len(world.entities) >= count:
+            break
+        Tests.spawn_mobs(world, world.player)
+
+
+def walk(headless: Headless) -> tuple[int, Callable[[int], None]]:
+    """
+        Hold RIGHT for 4096 ticks into fresh terrain, through the input, Player.move and its collisions
+
+        - The seed spawns the player at sea, so it swims at half speed (about 100 tiles, 13 chunks)
+    """
+    headless.game.input = ScriptedInput(lambda ticks: {pygame.K_RIGHT})
+    return 4096, lambda tick: None
+
+
+def night(headless: Headless) -> tuple[int, Callable[[int], None]]:
+    """ Idle at night, near 200 mobs """
+    headless.game.updater.ticks = 40000
+
+    fill(headless, headless.world.tiles.grass.id, 12)
+    spawn(headless, 200)
+
+    return 1024, lambda tick: None
+
+
+def breaking(headless: Headless) -> tuple[int, Callable[[int], None]]:
+    """ Break a 24x24 stone area around the player, 8 hits per tick """
+    world = headless.world
+    radius = 12
+
+    fill(headless, world.tiles.stone.id, radius)
+
+    x, y = int(world.player.position.x), int(world.player.position.y)
+    targets = [
+        (tx, ty)
+        for ty in range(y - radius, y + radius)
+        for tx in range(x - radius, x + radius)
+        if (tx, ty) != (x, y)
+    ]
+
+    def update(tick: int) -> None:
+        for index in range(tick * 8, tick * 8 + 8):
+            tx, ty = targets[(index // 3) % len(targets)] # 3 hits break a stone
+            if tile := world.get_tile(tx, ty):
+                tile.hurt(world, tx, ty, 8)
+
+    return 1024, update
+
+
+def autosave(headless: Headless) -> tuple[int, Callable[[int], None]]:
+    """ Autosaves (every 1024 ticks) with 100 mobs and all the chunks modified """
+    world = headless.world
+    headless.game.updater.ticks = 1
+
+    fill(headless, world.tiles.grass.id, 12)
+    spawn(headless, 100)
+
+    def update(tick: int) -> None:
+        if tick % 256 == 0:
+            for chunk in world.chunks.values():
+                chunk.modified = True
+
+    return 4096, update
+
+
+SCENARIOS = {
+    'walk': walk,
+    'night': night,
+    'breaking': breaking,
+    'autosave': autosave,
+}
+
+
+def run(name: str) -> dict:
+    """ Run a scenario (in this process) """
+    random.seed(SEED)
+
+    headless = Headless()
+    headless.initialize(SEED, populate = False)
+    headless.run(1) # Load the chunks around the player
+
+    ticks, update = SCENARIOS[name](headless)
+    entities = len(headless.world.entities)
+
+    # The profiler counts the generated chunks
+    Profiler.reset()
+    Profiler.enabled = True
+
+    times = []
+    game = headless.game
+
+    start = perf_counter()
+    for tick in range(ticks):
+        update(tick)
+
+        tick_start = perf_counter()
+        game.update()
+        times.append((perf_counter() - tick_start) * 1000)
+
+    elapsed = perf_counter() - start
+
+    generate = Profiler.scopes.get('chunk.generate')
+    generated = generate.count if generate else 0
+
+    chunks = len(headless.world.chunks)
+    headless.quit()
+
+    times.sort()
+    last = len(times) - 1
+
+    return {
+        'name': name,
+        'ticks': ticks,
+        'entities': entities,
+        'p50': times[int(last * 0.50)],
+        'p95': times[int(last * 0.95)],
+        'p99': times[int(last * 0.99)],
+        'worst': times[last],
+        'over_budget': sum(time > BUDGET for time in times),
+        'chunks_generated': generated,
+        'chunks_per_second': generated / elapsed,
+        'chunks_loaded': chunks,
+        # Kilobytes on Linux, bytes on macOS
+        'peak_rss_mb': (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 if sys.platform != 'darwin' else 1048576)) if resource else None,
+    }
+
+
+def main() -> None:
+    parser = ArgumentParser(description = "Minicraft scenario benchmarks (each one in its own process)")
+    parser.add_argument('names', nargs = '*', metavar = 'NAME', help = f"scenarios to run (all by default): {', '.join(SCENARIOS)}")
+    parser.add_argument('--output', '-o', metavar = 'FILE', help = "JSON results file (timestamped in ./profiles by default)")
+    parser.add_argument('--child', action = 'store_true', help = "run a single scenario and print its result (used internally)")
+    args = parser.parse_args()
+
+    if unknown := set(args.names) - set(SCENARIOS):
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    if args.child:
+        print(json.dumps(run(args.names[0])))
+        return
+
+    print(f"> scenarios (seed {SEED}, tick budget {BUDGET:.2f} ms)")
+
+    results = []
+    for name in args.names or SCENARIOS:
+        # A fresh process per scenario, so the peak RSS is its own
+        child = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.scenarios', '--child', name],
+            capture_output = True, text = True, check = True
+        )
+
+        result = json.loads(child.stdout.strip().splitlines()[-1])
+        results.append(result)
+
+        print(
+            f"  {name:<10} {result['ticks']:>5} ticks: p50 {result['p50']:.2f}, p95 {result['p95']:.2f}, p99 {result['p99']:.2f}, "
+            f"worst {result['worst']:.2f} ms ({result['over_budget']} over budget), "
+            f"{result['chunks_per_second']:.1f} chunks/s, peak RSS {result['peak_rss_mb'] or 0:.0f} MB"
+        )
+
+    print(f"> results saved to {harness.save('scenarios', results, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
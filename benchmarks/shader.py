@@ -0,0 +1,51 @@
+""" Per-frame cost of the scanline shader at the game resolution """
+
+import pygame
+from pygame import Surface
+from pygame.draw import line
+
+from benchmarks import harness
+from source.screen.shader import Shader
+from source.utils.constants import SCREEN_SIZE
+
+
+FRAMES: int = 500
+
+
+def legacy_filter() -> Surface:
+    """ The old SRCALPHA filter, for comparison """
+    surface = Surface(SCREEN_SIZE, pygame.SRCALPHA, 32).convert_alpha()
+    surface.fill((14, 14, 14, 255))
+
+    for x in range(0, SCREEN_SIZE[0], 2):
+        line(surface, (14, 14, 14, 32), (x, 0), (x, SCREEN_SIZE[1]), 1)
+
+    surface.set_alpha(96, pygame.RLEACCEL)
+    return surface
+
+
+def benchmarks() -> list[dict]:
+    """ Legacy filter against the multiply mask (needs a display) """
+    buffer = pygame.display.get_surface() or pygame.display.set_mode(SCREEN_SIZE, pygame.SRCALPHA, 32)
+    buffer.fill((120, 160, 80))
+
+    legacy = legacy_filter()
+    shader = Shader()
+
+    return [
+        harness.measure("shader (legacy alpha blend)", lambda: buffer.blit(legacy), FRAMES, repeat = 3, unit = 'frame'),
+        harness.measure("shader (multiply mask)", lambda: buffer.blit(shader.filter, special_flags = pygame.BLEND_RGB_MULT), FRAMES, repeat = 3, unit = 'frame'),
+    ]
+
+
+def main() -> None:
+    pygame.init()
+
+    print(f"> shader cost at {SCREEN_SIZE[0]}x{SCREEN_SIZE[1]} ({FRAMES} frames)")
+    benchmarks()
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,108 @@
+from argparse import ArgumentParser, Namespace
+
+import pygame
+
+from source.core.headless import Headless
+from source.core.input import Input, RecordInput, ReplayInput, ScriptedInput
 from source.core.initializer import Initializer
+from source.utils.profiler import Profiler
+
+
+def arguments() -> Namespace:
+    parser = ArgumentParser(description = "Minicraft Potato Edition")
+
+    # Headless mode (no window, no sound)
+    parser.add_argument('--headless', action = 'store_true', help = "run the world simulation without window nor sound")
+    parser.add_argument('--ticks', type = int, default = 1024, help = "ticks to run in headless mode")
+    parser.add_argument('--seed', default = "0", help = "world seed for headless mode")
+    parser.add_argument('--hold', action = 'append', default = [], metavar = 'KEY', help = "key held during the headless run (pygame name, like d or UP)")
+
+    # Input recordings (for reproducible runs)
+    parser.add_argument('--record', metavar = 'FILE', help = "record the keys of each tick into FILE (new worlds only: the replay generates the world again from its seed, so loaded saves and mods worlds aren't saved)")
+    parser.add_argument('--replay', metavar = 'FILE', help = "replay an input recording in headless mode")
+    parser.add_argument('--run-seed', type = int, default = 0, help = "random seed for the recorded run")
+
+    # Profiling
+    parser.add_argument('--profile', action = 'store_true', help = "enable the subsystem profiler (SHIFT+P in game), logs the p50/p95/p99 times")
+    parser.add_argument('--trace', type = float, metavar = 'SECONDS', help = "record a Chrome trace of the first SECONDS (SHIFT+T in game)")
+    parser.add_argument('--profile-ticks', type = int, metavar = 'N', help = "run cProfile for the first N headless ticks (SHIFT+F in game)")
+
+    return parser.parse_args()
+
+
+def headless(args: Namespace) -> None:
+    headless = Headless()
+
+    if args.replay:
+        replay = ReplayInput(args.replay)
+        headless.initialize(replay.seed)
+
+        if args.profile_ticks:
+            Profiler.start_capture(args.profile_ticks)
+
+        ticks = len(replay)
+        elapsed = headless.replay(replay)
+    else:
+        keys = {getattr(pygame, f'K_{name}') for name in args.hold}
+        headless.initialize(args.seed)
+
+        headless.game.input = ScriptedInput(lambda ticks: keys)
+        if args.record:
+            headless.game.input = RecordInput(headless.game.input, args.run_seed)
+
+        if args.profile_ticks:
+            Profiler.start_capture(args.profile_ticks)
+
+        ticks = args.ticks
+        elapsed = headless.run(ticks)
+
+    world = headless.world
+
+    print(f"> {ticks} ticks in {elapsed:.2f} s ({ticks / elapsed:.0f} ticks/s)")
+    print(f"> player: ({world.player.position.x:.2f}, {world.player.position.y:.2f}), chunks: {len(world.chunks)}, entities: {len(world.entities)}")
+
+    if Profiler.tracing():
+        print(f"> trace saved to {Profiler.stop_trace()}")
+
+    if Profiler.capturing():
+        print(f"> profile saved to {Profiler.stop_capture()}")
+
+    if Profiler.enabled:
+        print(Profiler.line())
+
+    if args.record and not args.replay:
+        headless.game.input.save(args.record, world.seed)
+
+    headless.quit()
+
 
 def main() -> None:
+    args = arguments()
+    Profiler.enabled = args.profile
+
+    if args.trace:
+        Profiler.start_trace(args.trace)
+
+    if args.headless or args.replay:
+        headless(args)
+        return
+
     initializer = Initializer()
     initializer.initialize()
+
+    if args.record:
+        initializer.game.input = RecordInput(Input(), args.run_seed)
+
     initializer.run()
 
+    if args.record:
+        world = initializer.world
+
+        # Only the seed goes in the recording, the rest of a save would be lost on the replay
+        if world.from_save or world.is_custom:
+            print("> recording not saved: the world was loaded, a replay can only start from a new one")
+        else:
+            initializer.game.input.save(args.record, world.seed)
+
 if __name__ == "__main__":
     main()
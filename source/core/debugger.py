@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import gc
+from array import array
+from collections import Counter
 from typing import TYPE_CHECKING
 
-from pygame import Rect
+from pygame import Rect, Surface, time
 from pygame.draw import rect
 
 from source.screen.color import Color
+from source.utils.memory import Memory
+from source.utils.profiler import Profiler
 from source.utils.region import Region
 
 from source.utils.constants import (
-    TILE_SIZE, CHUNK_SIZE, RENDER_SIZE,
-    SCREEN_HALF, DIRECTIONS
+    TILE_SIZE, CHUNK_SIZE, RENDER_SIZE, FRAME_RATE, GAME_TICKS,
+    SCREEN_WIDTH, SCREEN_HALF, DIRECTIONS
 )
 
 if TYPE_CHECKING:
@@ -20,6 +25,45 @@ if TYPE_CHECKING:
     from source.world.world import World
 
 
+class Graph:
+    """ A scrolling time graph, each sample is drawn once as a new column """
+
+    __slots__ = ('samples', 'index', 'budget', 'surface')
+
+    def __init__(self, width: int, height: int, budget: float) -> None:
+        # Ring buffer of the last samples (one per column)
+        self.samples: array = array('f', [0.0] * width)
+        self.index: int = 0
+
+        # Time budget in milliseconds (at the half of the graph height)
+        self.budget: float = budget
+
+        self.surface: Surface = Surface((width, height)).convert()
+        self.surface.fill(Color.BLACK)
+
+
+    def add(self, ms: float) -> None:
+        self.samples[self.index] = ms
+        self.index = (self.index + 1) % len(self.samples)
+
+        width, height = self.surface.get_size()
+        bar = min(height, int(ms * height / (self.budget * 2)))
+
+        # Scroll and draw just the new column
+        self.surface.scroll(-1, 0)
+        self.surface.fill(Color.BLACK, (width - 1, 0, 1, height))
+        self.surface.fill(Color.RED if ms > self.budget else Color.GREEN, (width - 1, height - bar, 1, bar))
+        self.surface.set_at((width - 1, height // 2), Color.GRAY) # Budget line
+
+
+    def average(self) -> float:
+        return sum(self.samples) / len(self.samples)
+
+
+    def peak(self) -> float:
+        return max(self.samples)
+
+
 class Debugger:
 
     def __init__(self, game: Game):
@@ -36,16 +80,36 @@ class Debugger:
         self.RENDER_WIDTH = range(-(RENDER_SIZE[0] + 1), RENDER_SIZE[0] + 2)
         self.RENDER_HEIGHT = range(-RENDER_SIZE[1], RENDER_SIZE[1] + 1)
 
-        self.shadow_offsets = {
+        self.shadow_offsets = (
             (-1, -1), ( 1,  1),
             ( 0, -1), ( 0,  1),
             (-1,  1), ( 1, -1),
             (-1,  0), ( 1,  0),
-        }
+        )
 
         self.chunk_rect = Rect(0, 0, self.CHUNK_PIXELS, self.CHUNK_PIXELS)
 
+        # Performance panel (right side), rebuilt a few times per second so
+        # drawing it doesn't eat the frame times it shows
+        self.PANEL_WIDTH = 296
+        self.PANEL_RATE = 250 # ms
+        self.PANEL_X = SCREEN_WIDTH - self.PANEL_WIDTH - 3
+        self.BAR_WIDTH = 96
+
+        self.panel: Surface = None
+        self.panel_time: int = -self.PANEL_RATE
+
+        # Last memory report and tracemalloc snapshot (SHIFT+M), the report walks all the
+        # chunks and sprites, too slow for the frames the panel measures
+        self.memory: dict[str, int] = None
+        self.snapshot = None
+
+        # Frame and tick times, in milliseconds
+        self.frames = Graph(self.PANEL_WIDTH, 40, 1000 / (FRAME_RATE or 60))
+        self.ticks = Graph(self.PANEL_WIDTH, 40, 1000 / GAME_TICKS)
 
+
+    @Profiler.timed('debug')
     def info(self, screen: Screen) -> None:
 
         self.custom = self.game.custom.enabled
@@ -68,19 +132,135 @@ class Debugger:
             f"Ticks: {self.world.ticks}",
             f"Light: {self.world.daylight()}",
             f"Seed: {self.world.seed}",
+            "",
+
+            # Renderer
+            f"FPS: {self.game.fps} (skipped {self.game.skipped_frames}, dropped {self.game.dropped_ticks} ticks)",
+            f"Native: {screen.native} (F4)",
+            f"Shader: {self.game.shader.enabled} (F5)",
         ]
 
-        for i, msg in enumerate(text):
-            y = i * 16
+        # Text and shadows come already composed (and cached) from the screen
+        screen.buffer.fblits([
+            (screen.shadowed(screen.font, msg, Color.WHITE, Color.BLACK, self.shadow_offsets), (3, (i * 16) - 1))
+            for i, msg in enumerate(text) if msg
+        ])
+
+
+    def frame(self, ms: float) -> None:
+        """ Record the time between two frames """
+        self.frames.add(ms)
+
+
+    def tick(self, ms: float) -> None:
+        """ Record the time of a game tick """
+        self.ticks.add(ms)
+
+
+    @Profiler.timed('debug.perf')
+    def performance(self, screen: Screen) -> None:
+        """ Frame and tick graphs, subsystem times, entities, chunks and GC """
+
+        now = time.get_ticks()
+        if (now - self.panel_time) >= self.PANEL_RATE:
+            self.panel = self._panel(screen)
+            self.panel_time = now
+
+        x = self.PANEL_X
+        screen.buffer.fblits([
+            (self.frames.surface, (x, 19)),
+            (self.ticks.surface, (x, 79)),
+            (self.panel, (x - 1, -1))
+        ])
+
+
+    def _panel(self, screen: Screen) -> Surface:
+        """ Build the text (and bars) of the performance panel """
+
+        lines = [
+            f"Frame: {self.frames.average():.1f} ms (max {self.frames.peak():.1f})",
+            "", "", "",
+            f"Tick: {self.ticks.average():.1f} ms (max {self.ticks.peak():.1f})",
+            "", "", "",
+        ]
+
+        # Subsystems (p95 of the profiler scopes)
+        report = Profiler.report() if Profiler.enabled else {}
+        bars = len(lines)
+
+        if Profiler.enabled:
+            lines.append("Subsystems (p95 ms):")
+            bars += 1
+            lines.extend(f"{name[:14]:<14}{stats['p95']:6.2f}" for name, stats in report.items())
+        else:
+            lines.append("Profiler: off (SHIFT+P)")
+
+        lines.append("")
+
+        # Entities by type
+        types = Counter(type(entity).__name__ for entity in self.world.entities.values())
+        lines.append(f"Entities: {len(self.world.entities)}, particles: {len(self.world.particles)}")
+        lines.extend(f"  {name}: {count}" for name, count in types.most_common(4))
+
+        tiers = self.world.tiers
+        lines.append(f"Simulated: {tiers['near']} near, {tiers['mid']} mid")
+        lines.append(f"  {tiers['sleeping']} sleeping, {tiers['frozen']} frozen")
+
+        # Memory, from the last report
+        if memory := self.memory:
+            lines.append(f"Memory: chunks {memory['chunk_bytes'] / 1048576:.1f} MB ({memory['tiles']} tiles)")
+            lines.append(f"  sprites {memory['sprite_bytes'] / 1048576:.1f} MB, caches {memory['screen_cache_bytes'] / 1048576:.1f} MB")
+        else:
+            lines.append("Memory: no report (SHIFT+M)")
+
+        # Chunks (pending ones get loaded on the next world update)
+        cx, cy = self.player.cx, self.player.cy
+        pending = sum(
+            (x, y) not in self.world.chunks
+            for x in range(cx - 4, cx + 4)
+            for y in range(cy - 3, cy + 3)
+        )
+        dirty = sum(chunk.modified for chunk in self.world.chunks.values())
+
+        lines.append(f"Chunks: {len(self.world.chunks)} ({pending} pending, {dirty} dirty)")
+
+        # Garbage collector
+        collections = "/".join(str(generation['collections']) for generation in gc.get_stats())
+        lines.append(f"GC: {collections} (gen 0/1/2)")
+
+        panel = Surface((self.PANEL_WIDTH + 2, len(lines) * 16 + 2)).convert()
+        panel.fill(Color.MAGENTA)
+        panel.set_colorkey(Color.MAGENTA)
+
+        panel.fblits([
+            (screen.shadowed(screen.font, line, Color.WHITE), (0, i * 16))
+            for i, line in enumerate(lines) if line
+        ])
+
+        # Bars are relative to the tick budget
+        for i, stats in enumerate(report.values()):
+            width = min(self.BAR_WIDTH, int(stats['p95'] * self.BAR_WIDTH / self.ticks.budget))
+            panel.fill(Color.YELLOW, (self.PANEL_WIDTH - self.BAR_WIDTH, (bars + i) * 16 + 5, max(1, width), 8))
+
+        return panel
+
+
+    def memory_report(self) -> None:
+        """ Print the memory report, and what grew since the last call (tracemalloc, slow once started) """
+        snapshot = Memory.snapshot()
+
+        self.memory = Memory.report(self.game)
+
+        print("> memory report:")
+        for name, value in self.memory.items():
+            print(f"  {name}: {value}")
 
-            # Render shadow
-            shadow_surface = screen.font.render(msg, False, Color.BLACK).convert()
-            for xo, yo in self.shadow_offsets:
-                screen.buffer.blit(shadow_surface, (4 + xo, y + yo))
+        if self.snapshot:
+            print("> memory growth since the last report:")
+            for line in Memory.diff(self.snapshot, snapshot):
+                print(f"  {line}")
 
-            # Render text
-            text_surface = screen.font.render(msg, False, Color.WHITE).convert()
-            screen.buffer.blit(text_surface, (4, y))
+        self.snapshot = snapshot
 
 
     def grid(self, screen: Screen) -> None:
@@ -89,8 +269,8 @@ class Debugger:
         cy = self.player.cy
 
         # Offset for chunks grid
-        xo = int(SCREEN_HALF[0] - ((self.player.position.x - cx * CHUNK_SIZE) * TILE_SIZE))
-        yo = int(SCREEN_HALF[1]- ((self.player.position.y - cy * CHUNK_SIZE) * TILE_SIZE))
+        xo = int(SCREEN_HALF[0] - ((self.world.camera.x - cx * CHUNK_SIZE) * TILE_SIZE))
+        yo = int(SCREEN_HALF[1] - ((self.world.camera.y - cy * CHUNK_SIZE) * TILE_SIZE))
 
         current_chunk_color = Color.YELLOW
         missing_chunk_color = Color.RED
@@ -133,21 +313,21 @@ class Debugger:
                 self.chunk_rect.inflate_ip(2, 2) # Restore original size
 
                 # Render chunk coordinates
-                text_surface = screen.font.render(
+                text_surface = screen.text(
+                    screen.font,
                     f"C: {xc},{yc}",
-                    False,
                     Color.WHITE,
                     Color.BLACK
-                ).convert()
+                )
                 screen.buffer.blit(text_surface, (xr + 2, yr + 2))
 
                 # And region coordinates
-                text_surface = screen.font.render(
+                text_surface = screen.text(
+                    screen.font,
                     f"R: {xc // Region.REGION_SIZE},{yc // Region.REGION_SIZE}",
-                    False,
                     Color.WHITE,
                     Color.BLACK
-                ).convert()
+                )
                 screen.buffer.blit(text_surface, (xr + 2, yr + 18))
 
         # Draw current region boundary
@@ -5,11 +5,13 @@ from typing import TYPE_CHECKING
 import pygame
 
 from source.core.debugger import Debugger
+from source.core.input import Input
 from source.core.updater import Updater
 from source.screen.color import Color
 from source.screen.hotbar import Hotbar
 from source.screen.shader import Shader
 from source.utils.constants import SCREEN_HALF
+from source.utils.profiler import Profiler
 from source.utils.saveload import Saveload
 
 if TYPE_CHECKING:
@@ -40,6 +42,7 @@ class Game:
         self.menu: Menu = None
         self.world: World = None # World manager
 
+        self.input: Input = Input()
         self.updater: Updater = None
         self.hotbar: Hotbar = None
         self.shader: Shader = None
@@ -47,6 +50,11 @@ class Game:
         self.tick_time: int = 0
         self.game_time: int = 0
 
+        # Main loop stats (updated once per second)
+        self.fps: int = 0
+        self.skipped_frames: int = 0
+        self.dropped_ticks: int = 0
+
         self.custom: Custom = None
 
 
@@ -74,10 +82,11 @@ class Game:
             self.menu = None
 
 
+    @Profiler.timed('game.update')
     def update(self) -> None:
         self.tick_time += 1
 
-        if not pygame.key.get_focused():
+        if not self.input.focused():
             return
 
         if self.menu:
@@ -89,27 +98,29 @@ class Game:
             self.hotbar.update()
 
 
-    def render(self) -> None:
+    @Profiler.timed('game.render')
+    def render(self, alpha: float = 1.0) -> None:
+        """ Render a frame, alpha is how far we are between the last tick and the next """
         self.screen.buffer.fill(0)
 
         if self.world.loaded:
-            self.world.render(self.screen)
+            self.world.render(self.screen, alpha)
 
             if self.debug:
                 # Chunks grid
                 self.debugger.grid(self.screen)
                 self.debugger.info(self.screen)
+                self.debugger.performance(self.screen)
 
             self.hotbar.render(self.screen)
 
         if self.menu:
             self.menu.render(self.screen)
 
-        if not pygame.key.get_focused():
+        if not self.input.focused():
             self.focus_nagger(self.screen)
 
-        # NOTE: render the shader drops FPS!
-        # self.shader.render(self.screen)
+        self.shader.render(self.screen)
 
 
     def focus_nagger(self, screen: Screen):
@@ -129,13 +140,8 @@ class Game:
 
         text_position = (SCREEN_HALF[0], SCREEN_HALF[1] - 7)
 
-        # Create shadow text
-        shadow = screen.font.render(text, False, Color.BLACK).convert()
-        shadow_rect = shadow.get_rect(center = (text_position[0] + 1, text_position[1] + 1))
-        sprites.append((shadow, (shadow_rect.x, shadow_rect.y)))
-
-        # Create main text
-        message = screen.font.render(text, False, color).convert()
+        # Main text with its shadow
+        message = screen.shadowed(screen.font, text, color)
         message_rect = message.get_rect(center = text_position)
         sprites.append((message, (message_rect.x, message_rect.y)))
 
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import shutil
+import tempfile
+from time import perf_counter
+from typing import Callable, Iterable
+
+import pygame
+
+from source.core.game import Game
+from source.core.input import ReplayInput, ScriptedInput
+from source.core.player import Player
+from source.core.sound import NullSound
+from source.custom.custom import Custom
+from source.screen.screen import NullScreen
+from source.screen.sprites import Sprites
+from source.world.tiles import Tiles
+from source.world.world import World
+
+
+class Headless:
+    """ Runs the world simulation without window nor sound (servers, CI and benchmarks) """
+
+    def __init__(self) -> None:
+        self.screen: NullScreen = None
+        self.sprites: Sprites = None
+        self.sound: NullSound = None
+        self.game: Game = None
+        self.world: World = None
+        self.custom: Custom = None
+
+        # Temporary save directory (removed on quit)
+        self.temporary: str = None
+
+
+    def initialize(self, seed = 0, save_dir: str = None, populate: bool = True) -> None:
+        """
+            Initialize all game systems and generate the world
+
+            Arguments:
+                seed: World seed
+                save_dir: Where the world is saved, a temporary directory if not given
+                populate: Spawn the initial mobs
+        """
+
+        # We make the game object
+        self.game = Game()
+
+        # Core systems first (same order as the Initializer)
+        self.screen = NullScreen()
+        self.sprites = Sprites()
+        self.sound = NullSound()
+
+        self.sprites.initialize()
+        self.sound.initialize()
+        self.screen.initialize(self.sprites)
+
+        # Setup game objects
+        tiles = Tiles(self.sprites)
+        player = Player(self.sprites, self.game)
+        self.world = World(self.game, self.sprites, tiles, player)
+
+        # Never touch the player saves unless asked to
+        if save_dir is None:
+            save_dir = self.temporary = tempfile.mkdtemp(prefix = 'minicraft-')
+        self.world.save_dir = save_dir
+
+        # Mods subsystem
+        self.custom = Custom(self.sprites, tiles)
+
+        # Initialize game, without menus and scripted input
+        self.game.initialize(self)
+        self.game.input = ScriptedInput()
+
+        self.world.initialize(seed, populate)
+
+
+    def run(self, ticks: int, script: Callable[[int], Iterable[int]] = None) -> float:
+        """
+            Fast-forward the game as fast as possible
+
+            Arguments:
+                ticks: Number of ticks to run
+                script: Gives the pressed keys for each tick (updater ticks), keeps the current input if not given
+
+            Returns:
+                Elapsed time in seconds
+        """
+        if script:
+            self.game.input = ScriptedInput(script)
+
+        start = perf_counter()
+        for _ in range(ticks):
+            self.game.update()
+
+        return perf_counter() - start
+
+
+    def replay(self, replay: ReplayInput) -> float:
+        """
+            Run a whole input recording, the world must be initialized with its seed
+
+            Returns:
+                Elapsed time in seconds
+        """
+        self.game.input = replay
+        self.game.updater.ticks = replay.start
+
+        return self.run(len(replay))
+
+
+    def quit(self) -> None:
+        """ Quit the game, and remove the temporary saves """
+        pygame.quit()
+
+        if self.temporary:
+            shutil.rmtree(self.temporary, ignore_errors = True)
+            self.temporary = None
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from time import perf_counter
+
 import pygame
 from pygame import KEYDOWN, QUIT, TEXTINPUT, display, event, time
 
@@ -10,7 +12,8 @@ from source.custom.custom import Custom
 from source.screen.menu.titlemenu import TitleMenu
 from source.screen.screen import Screen
 from source.screen.sprites import Sprites
-from source.utils.constants import GAME_TICKS
+from source.utils.constants import FRAME_RATE, GAME_TICKS, MAX_TICKS
+from source.utils.profiler import Profiler
 from source.world.tiles import Tiles
 from source.world.world import World
 
@@ -67,6 +70,9 @@ class Initializer:
 
         self.running = True
 
+        # Ticks run at a fixed rate, frames as fast as the display (or the cap) allows
+        frame_rate = FRAME_RATE or display.get_current_refresh_rate() or 60
+
         clock = time.Clock()
         timer = time.get_ticks()
         delta = 0.00
@@ -74,39 +80,72 @@ class Initializer:
         this_time: int = time.get_ticks()
         last_time: int = time.get_ticks()
         frame_time = 1000 // GAME_TICKS
+        last_frame = perf_counter()
+
+        # Counters for the last second
+        frames: int = 0
+        skipped: int = 0
+        dropped: int = 0
+        render_time: int = 0
 
         while self.running:
             this_time = time.get_ticks()
             delta += this_time - last_time
             last_time = this_time
 
-            drawing = False
+            for _ in event.get(QUIT):
+                self.running = False
 
             # Game logic update
-            while delta >= frame_time:
-                for _ in event.get(QUIT):
-                    self.running = False
-
+            updates = 0
+            while delta >= frame_time and updates < MAX_TICKS:
+                tick_start = perf_counter()
                 self.game.update()
+
+                if self.game.debug:
+                    self.game.debugger.tick((perf_counter() - tick_start) * 1000)
+
                 delta -= frame_time
-                drawing = True
+                updates += 1
+
+            # If we are still behind, we give up on those ticks
+            if delta >= frame_time:
+                dropped += int(delta // frame_time)
+                delta %= frame_time
+
+            # More than one tick in this frame, so we skipped the frames between them
+            if updates > 1:
+                skipped += updates - 1
 
             # Screen update
-            if drawing:
-                render_start = time.get_ticks() if self.game.debug else 0
+            render_start = time.get_ticks() if self.game.debug else 0
+
+            self.game.render(min(1.0, delta / frame_time))
+            display.flip()
+            frames += 1
+
+            if self.game.debug:
+                self.game.debugger.frame((perf_counter() - last_frame) * 1000)
+            last_frame = perf_counter()
+
+            if self.game.debug:
+                render_time = time.get_ticks() - render_start
+
+            clock.tick(frame_rate)
 
-                self.game.render()
-                display.flip()
+            # Stats (and debug output)
+            if (time.get_ticks() - timer) >= 1000:
+                self.game.fps = frames
+                self.game.skipped_frames = skipped
+                self.game.dropped_ticks = dropped
 
                 if self.game.debug:
-                    render_time = time.get_ticks() - render_start
+                    print(f"> render time: {render_time} ms, fps: {frames}, skipped frames: {skipped}, dropped ticks: {dropped}")
 
-            clock.tick(GAME_TICKS)
+                if Profiler.enabled:
+                    print(Profiler.line())
 
-            # Debug output
-            if self.game.debug and (time.get_ticks() - timer) >= 1000:
-                if drawing:
-                    print(f"> render time: {render_time} ms")
+                frames = skipped = dropped = 0
                 timer = time.get_ticks()
 
         self.game.quit()
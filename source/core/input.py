@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import pickle
+import pickletools
+import random
+from typing import Callable, Iterable
+
+import pygame
+
+
+class Keys:
+    """ A set of pressed keys, indexable like pygame.key.get_pressed() """
+
+    __slots__ = ('keys',)
+
+    def __init__(self, keys: Iterable[int] = ()) -> None:
+        self.keys: frozenset[int] = frozenset(keys)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.keys
+
+
+class Input:
+    """ Keyboard input for the game ticks (the real keyboard) """
+
+    def focused(self) -> bool:
+        return pygame.key.get_focused()
+
+    def pressed(self, ticks: int):
+        """ Keys state for the given tick """
+        return pygame.key.get_pressed()
+
+
+class ScriptedInput(Input):
+    """ Keyboard input from a script, a function that gives the pressed keys for each tick """
+
+    def __init__(self, script: Callable[[int], Iterable[int]] = None) -> None:
+        self.script = script
+
+    def focused(self) -> bool:
+        return True
+
+    def pressed(self, ticks: int) -> Keys:
+        if not self.script:
+            return Keys()
+        return Keys(self.script(ticks))
+
+
+# Keys used by the game ticks, the bit order of the recordings (only append!)
+RECORDED_KEYS: tuple[int, ...] = (
+    pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT,
+    pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d,
+    pygame.K_c, pygame.K_g, pygame.K_h, pygame.K_k,
+    pygame.K_LSHIFT, pygame.K_F3, pygame.K_F4, pygame.K_F5,
+    pygame.K_p, pygame.K_t, pygame.K_f, pygame.K_m,
+)
+
+
+class RecordInput(Input):
+    """
+        Records the keys state of each tick from another input
+
+        - The global random is seeded with the run seed on the first tick, the same
+          thing the replay does, so both runs draw the same random numbers
+    """
+
+    def __init__(self, source: Input, run_seed: int = 0) -> None:
+        self.source = source
+        self.run_seed = run_seed
+
+        self.start: int = None
+
+        # Run-length encoded key masks: [[mask, ticks], ...]
+        self.runs: list[list[int]] = []
+
+
+    def focused(self) -> bool:
+        return self.source.focused()
+
+
+    def pressed(self, ticks: int) -> Keys:
+        if self.start is None:
+            self.start = ticks
+            random.seed(self.run_seed)
+
+        keys = self.source.pressed(ticks)
+
+        mask = 0
+        for bit, key in enumerate(RECORDED_KEYS):
+            if keys[key]:
+                mask |= 1 << bit
+
+        if self.runs and self.runs[-1][0] == mask:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([mask, 1])
+
+        # The game only sees what the replay will see
+        return Keys(key for bit, key in enumerate(RECORDED_KEYS) if mask & (1 << bit))
+
+
+    def save(self, filename: str, seed) -> None:
+        """ Save the recording, seed is the world seed """
+        data = {
+            'header': {
+                'seed': seed,
+                'run_seed': self.run_seed,
+                'start': self.start or 0,
+                'keys': RECORDED_KEYS
+            },
+            'runs': self.runs
+        }
+
+        with open(filename, 'wb') as file:
+            file.write(b'MCIN')  # Magic number for security
+            file.write(pickletools.optimize(pickle.dumps(data, protocol=5)))
+
+
+class ReplayInput(Input):
+    """ Replays a recording made with RecordInput (no keys after its end) """
+
+    def __init__(self, filename: str) -> None:
+        with open(filename, 'rb') as file:
+            # Verify magic number
+            if file.read(4) != b'MCIN':
+                raise ValueError("Invalid input recording format")
+
+            data = pickle.load(file)
+
+        header = data['header']
+        self.seed = header['seed']
+        self.run_seed: int = header['run_seed']
+        self.start: int = header['start']
+        self.keys: tuple[int, ...] = header['keys']
+
+        # One mask per tick
+        self.masks: list[int] = [mask for mask, count in data['runs'] for _ in range(count)]
+
+        self.seeded: bool = False
+
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+
+    def focused(self) -> bool:
+        return True
+
+
+    def pressed(self, ticks: int) -> Keys:
+        if not self.seeded:
+            random.seed(self.run_seed)
+            self.seeded = True
+
+        index = ticks - self.start
+        if not (0 <= index < len(self.masks)):
+            return Keys()
+
+        mask = self.masks[index]
+        return Keys(key for bit, key in enumerate(self.keys) if mask & (1 << bit))
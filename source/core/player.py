@@ -8,7 +8,7 @@ import pygame
 from pygame import Vector2
 
 from source.entity.furniture.furniture import Furniture
-from source.entity.particle.text import TextParticle
+from source.world.collision import Collision
 
 from source.utils.constants import (
     TILE_SIZE, CHUNK_SIZE, SCREEN_HALF,
@@ -34,6 +34,9 @@ class Player:
         # Player's world coordinates
         self.position: Vector2 = Vector2(0, 0)
 
+        # Position on the previous tick, for the render interpolation
+        self.previous: Vector2 = Vector2(0, 0)
+
         # World grid offset (used by hitbox and tile highlight)
         self.offset: Vector2 = Vector2(0, 0)
 
@@ -77,6 +80,7 @@ class Player:
         self.tiles = self.world.tiles
 
         self.position = spawn
+        self.previous.update(spawn)
 
         self.cx = int(self.position.x) // CHUNK_SIZE
         self.cy = int(self.position.y) // CHUNK_SIZE
@@ -88,13 +92,7 @@ class Player:
         tile_x = int(self.position.x * TILE_BITS) >> POSITION_SHIFT
         tile_y = int(self.position.y * TILE_BITS) >> POSITION_SHIFT
 
-        # Get the tile at the calculated position
-        tile: Tile = self.world.get_tile(tile_x, tile_y)
-        if not tile:
-            return False
-
-        # Return whether the tile is liquid
-        return tile.liquid
+        return Collision.liquid(self.world, tile_x, tile_y)
 
 
     def move(self, mx: float, my: float) -> None:
@@ -103,29 +101,13 @@ class Player:
         # how this works, but is easy to broke
         # and hard to fix, so i will keep this
 
-        # Calculate deltas in regular coordinates first
-        dx = mx - self.position.x
-        dy = my - self.position.y
-
         # In mob.py this is diferent, since that this
         # broke the A.I for some reason, so i will
         # keep this as is, but i will fix the mob.py
-        if dx == 0 and dy == 0:
+        if not (step := Collision.step(self.position, mx, my, self.speed)):
             return
 
-        # Normalize the movement vector and apply speed uniformly
-        length = hypot(dx, dy)
-        if length > 0:
-            dx = (dx / length) * self.speed
-            dy = (dy / length) * self.speed
-
-        # Convert movement to bit-shifted format
-        new_x = int((self.position.x + dx) * TILE_BITS)
-        new_y = int((self.position.y + dy) * TILE_BITS)
-
-        # Convert to tile coordinates for collision
-        tile_x = new_x >> POSITION_SHIFT
-        tile_y = new_y >> POSITION_SHIFT
+        dx, dy, tile_x, tile_y = step
 
         # Check collision
         tile: Tile = self.world.get_tile(tile_x, tile_y)
@@ -149,33 +131,23 @@ class Player:
             return
 
         # Check if an entity blocks the player movement
-        for entity in self.world.entities:
+        for entity in self.world.index.query_radius(self.position, 0.60):
             if isinstance(entity, Furniture):
-                if entity.position.distance_to(self.position) < 0.60:
-                    entity.touched_by(self)
-                    # Only block movement if we're trying to move into the entity's space
-                    next_pos = Vector2(self.position.x + dx, self.position.y + dy)
-                    if entity.position.distance_to(next_pos) < 0.60:
-                        return
+                entity.touched_by(self)
+                # Only block movement if we're trying to move into the entity's space
+                if hypot(entity.position.x - (self.position.x + dx), entity.position.y - (self.position.y + dy)) < 0.60:
+                    return
 
         # Store the fractional part to prevent error accumulation (Yeah, sucks)
-        self.position.x += dx
-        self.position.y += dy
+        Collision.apply(self, dx, dy, tile_x, tile_y)
 
         # Calculate offset for rendering
         self.offset.x = (self.position.x - int(self.position.x)) * TILE_SIZE
         self.offset.y = (self.position.y - int(self.position.y)) * TILE_SIZE
 
-        # Update facing direction
-        self.facing = Vector2(dx, dy).normalize()
-
         self.xd = int(tile_x + self.facing.x)
         self.yd = int(tile_y + self.facing.y)
 
-        # Update chunk position
-        self.cx = tile_x // CHUNK_SIZE
-        self.cy = tile_y // CHUNK_SIZE
-
 
     def attack(self): # type: () -> None
         """ Break the tile in the specified direction """
@@ -193,19 +165,14 @@ class Player:
 
         # Tile highlight
         if self.cursor:
-            # Calculate highlight position
-            tile_x = self.xd - int(self.position.x)
-            tile_y = self.yd - int(self.position.y)
+            # Calculate highlight position (relative to the interpolated camera)
+            camera = self.world.camera
 
             highlight = Vector2(
-                (SCREEN_HALF[0] + (tile_x * TILE_SIZE)),
-                (SCREEN_HALF[1] + (tile_y * TILE_SIZE))
+                (SCREEN_HALF[0] + ((self.xd - camera.x) * TILE_SIZE)),
+                (SCREEN_HALF[1] + ((self.yd - camera.y) * TILE_SIZE))
             )
 
-            # Adjust for tile offset
-            highlight.x -= self.offset.x
-            highlight.y -= self.offset.y
-
             sprites.append((self.sprites.HIGHLIGHT, (highlight.x, highlight.y, highlight.y + 8)))
 
         rx = SCREEN_HALF[0] - 15
@@ -213,9 +180,8 @@ class Player:
 
         # Player rendering
         if self.swimming():
-            half_sprite = self.sprite.subsurface((0, 0, self.sprite.get_width(), self.sprite.get_height() // 2))
             sprites.append((self.sprites.WATER_SWIM[0 if self.cursor else 1], (rx, ry + 2, ry + 2)))
-            sprites.append((half_sprite, (rx, ry + 4, ry + 4)))
+            sprites.append((self.sprites.top_half(self.sprite), (rx, ry + 4, ry + 4)))
         else:
             sprites.append((self.sprite, (rx, ry, ry)))
 
@@ -299,7 +265,7 @@ class Player:
             return
 
         self.game.sound.play("playerHurt")
-        self.world.add(TextParticle(str(damage), self.position.x, self.position.y, (168, 54, 146)))
+        self.world.particles.text(str(damage), self.position.x, self.position.y, (168, 54, 146))
         self.health = max(0, self.health - damage)
 
         self.hurt_time = 8
@@ -39,3 +39,19 @@ class Sound:
             self.sounds[sound_name].stop()
         else:
             print(f"[STOP] Sound '{sound_name}' not found!")
+
+
+class NullSound(Sound):
+    """ Sound manager without audio device (for headless runs) """
+
+    def initialize(self) -> None:
+        pass
+
+    def quit(self) -> None:
+        pass
+
+    def play(self, sound_name: str) -> None:
+        pass
+
+    def stop(self, sound_name: str) -> None:
+        pass
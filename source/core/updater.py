@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING
 import pygame
 from pygame import Vector2
 
+from source.utils.constants import GAME_TICKS
+from source.utils.profiler import Profiler
 from source.utils.saveload import Saveload
 from source.utils.tests import Tests
 
@@ -29,30 +31,35 @@ class Updater:
         self.world: World = game.world
         self.player: Player = game.world.player
 
-        # Add cooldown timers
-        self.last_shift: float = 0.00
-        self.last_attack: float = 0.00
+        # Add cooldown timers (in ticks, so replays behave the same)
+        self.last_shift: int = 0
+        self.last_attack: int = 0
 
         self.SHIFT_TIME: float = 0.50
+        self.TRACE_TIME: float = 10.0 # seconds
+        self.CAPTURE_TICKS: int = 1024
         self.ATTACK_TIME: float = 0.05
         self.held_attack: bool = False
 
         self.movement = Vector2(0, 0)
 
 
-    def _cooldown(self, last: float, time: float) -> bool:
-        now = pygame.time.get_ticks() / 1000  # Convert to seconds
-        return now - last >= time
+    def _cooldown(self, last: int, time: float) -> bool:
+        elapsed = self.ticks - last # In ticks, and time in seconds
+        return elapsed < 0 or elapsed >= time * GAME_TICKS
 
 
     def update(self) -> None:
 
+        # Positions of the last tick, for the render interpolation
+        self.world.snapshot()
+
         # Autosave
         if self.world.loaded and (self.ticks % 1024) == 0:
             Saveload.save(self)
 
         ### Keyboard input handling ###
-        event = pygame.key.get_pressed()
+        event = self.game.input.pressed(self.ticks)
 
         # Calculate movement vector
         self.movement.update(0, 0)
@@ -91,7 +98,7 @@ class Updater:
 
         # Handle attack (press-release check)
         if event[pygame.K_c]:
-            now = pygame.time.get_ticks() / 1000
+            now = self.ticks
 
             if not self.held_attack and self._cooldown(self.last_attack, self.ATTACK_TIME):
                 self.player.attack()
@@ -103,16 +110,34 @@ class Updater:
 
         # Handle F3 debug toggle
         if event[pygame.K_F3]:
-            now = pygame.time.get_ticks() / 1000
+            now = self.ticks
 
             if self._cooldown(self.last_shift, self.SHIFT_TIME):
                 self.game.debug = not self.game.debug
                 self.last_shift = now
 
 
+        # Handle F4 native resolution toggle
+        if event[pygame.K_F4]:
+            now = self.ticks
+
+            if self._cooldown(self.last_shift, self.SHIFT_TIME):
+                self.game.screen.toggle_native()
+                self.last_shift = now
+
+
+        # Handle F5 shader toggle
+        if event[pygame.K_F5]:
+            now = self.ticks
+
+            if self._cooldown(self.last_shift, self.SHIFT_TIME):
+                self.game.shader.toggle()
+                self.last_shift = now
+
+
         # Handle SHIFT+ combinations
         if event[pygame.K_LSHIFT]:
-            now = pygame.time.get_ticks() / 1000
+            now = self.ticks
 
             if self._cooldown(self.last_shift, self.SHIFT_TIME):
                 if event[pygame.K_s]:
@@ -131,6 +156,28 @@ class Updater:
                     Tests.clear_mobs(self.world, self.player)
                     self.game.sound.play("eventSound")
 
+                elif event[pygame.K_p]:
+                    Profiler.toggle()
+                    self.game.sound.play("eventSound")
+
+                elif event[pygame.K_t]:
+                    if Profiler.tracing():
+                        print(f"> trace saved to {Profiler.stop_trace()}")
+                    else:
+                        Profiler.start_trace(self.TRACE_TIME)
+                    self.game.sound.play("eventSound")
+
+                elif event[pygame.K_f]:
+                    if Profiler.capturing():
+                        print(f"> profile saved to {Profiler.stop_capture()}")
+                    else:
+                        Profiler.start_capture(self.CAPTURE_TICKS)
+                    self.game.sound.play("eventSound")
+
+                elif event[pygame.K_m]:
+                    self.game.debugger.memory_report()
+                    self.game.sound.play("eventSound")
+
 
                 self.last_shift = now
 
@@ -139,6 +186,10 @@ class Updater:
         self.world.update(self.ticks)
         self.player.update(self.ticks)
 
+        # Traces and captures stop by themselves
+        for kind, filename in Profiler.update():
+            print(f"> {kind} saved to {filename}")
+
         # THIS IS IMPORTANT!
         # (If you don't call this, the game will not update)
         self.ticks += 1
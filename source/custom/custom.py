@@ -351,6 +351,7 @@ class Custom:
 
             chunk: Chunk = Chunk(cx, cy, chunk_tiles)
             chunk.modified = False # Loaded chunks start unmodified
+            chunk.entities = chunk_data.get('entities', [])
 
             return chunk
 
@@ -389,7 +390,8 @@ class Custom:
         region = Region(str(self.mods_saves), rx, ry)
 
         data = {
-            'tiles': chunk.data()
+            'tiles': chunk.data(),
+            'entities': chunk.entities
         }
 
         region.write_chunk(lcx, lcy, data)
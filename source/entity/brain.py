@@ -1,18 +1,18 @@
 from __future__ import annotations
 
-import heapq
 from enum import IntEnum
 from random import uniform
-from math import hypot, pi, cos, sin
+from math import pi, cos, sin
 from typing import TYPE_CHECKING
 
 from pygame import Vector2
 from source.utils.autoslots import auto_slots
-from source.utils.constants import DIRECTIONS
+from source.utils.profiler import Profiler
+from source.world.collision import Collision
+from source.world.pathfinder import Pathfinder
 
 if TYPE_CHECKING:
     from source.entity.mob.mob import Mob
-    from source.world.tile import Tile
     from source.world.world import World
 
 
@@ -30,30 +30,23 @@ class Brain:
         self.state: State = State.IDLE # Initially, mob is idle
         self.target_pos: Vector2 = Vector2(0, 0) # No target yet
 
-        self.base_speed: float = self.mob.speed
+        # Updates this one stands for, more on the mid tier (set by Mob.update, see World.tier)
+        self.updates: int = 1
 
-        self.path: list[Vector2] = []
+        self.base_speed: float = self.mob.speed
 
     def update(self, world: World) -> None:
         pass
 
 
-    def valid_position(self, world: World, x: float, y: float) -> bool:
-        # Check current tile ...
-        tile: Tile = world.get_tile(int(x), int(y))
-        if not tile or tile.solid or tile.liquid:
-            return False
-
-        # Only check adjacent tiles
-        for dx, dy in DIRECTIONS:
-            check_x = int(x) + dx
-            check_y = int(y) + dy
+    def idle_ticks(self) -> int:
+        """ Ticks the mob can sleep for, with nothing to do (0 if busy) """
+        return 0
 
-            nearby: Tile = world.get_tile(check_x, check_y)
-            if not nearby or nearby.solid:
-                return False
 
-        return True
+    def valid_position(self, world: World, x: float, y: float) -> bool:
+        """ Check if the mob can stand on a position (see World.walkable) """
+        return world.walkable(int(x), int(y))
 
 
     def interpolate(self, path: list[Vector2]) -> list[Vector2]:
@@ -71,97 +64,45 @@ class Brain:
             interpolated.append(current)
 
             # Calculate 3 intermediate points between current and next
-            for t in [0.25, 0.5, 0.75]:
-                intermediate = Vector2(
-                    current.x + (next_point.x - current.x) * t,
-                    current.y + (next_point.y - current.y) * t
-                )
-                interpolated.append(intermediate)
+            x, y = current.x, current.y
+            dx, dy = next_point.x - x, next_point.y - y
+
+            interpolated.append(Vector2(x + dx * 0.25, y + dy * 0.25))
+            interpolated.append(Vector2(x + dx * 0.50, y + dy * 0.50))
+            interpolated.append(Vector2(x + dx * 0.75, y + dy * 0.75))
 
         # Add the final point
         interpolated.append(path[-1])
         return interpolated
 
 
+    @Profiler.timed('entity.path')
     def find_path(self, world: World, start: Vector2, end: Vector2) -> list[Vector2]:
-        start_pos: tuple[int, int] = (int(start.x), int(start.y))
-        end_pos: tuple[int, int] = (int(end.x), int(end.y))
-
-        # Check if the start position is in a loaded chunk
-        if not world.get_tile(start_pos[0], start_pos[1]):
-            return []
-
-        # Check if the final position is valid, else find nearest valid position
-        if not self.valid_position(world, end_pos[0], end_pos[1]):
-            best_pos = None
-            min_distance = float('inf')
-
-            # Search on an circular pattern
-            for angle in range(0, 360, 45):
-                for dist in range(1, 4):
-                    dx = int(cos(angle * pi / 180) * dist)
-                    dy = int(sin(angle * pi / 180) * dist)
-                    test_pos = (end_pos[0] + dx, end_pos[1] + dy)
-
-                    if world.get_tile(test_pos[0], test_pos[1]) and self.valid_position(world, test_pos[0], test_pos[1]):
-                        current_dist = hypot(dx, dy) # Euclidean distance
-
-                        if current_dist < min_distance:
-                            min_distance = current_dist
-                            best_pos = test_pos
-
-            if not best_pos:
-                return [] # No valid path found
-            end_pos = best_pos
-
-        # A* implementation :D
-        frontier: list = [(0, start_pos)]
-        came_from: dict = {start_pos: None}
-        cost_so_far: dict = {start_pos: 0}
-
-        while frontier:
-            # Get the next position to explore
-            _, current = heapq.heappop(frontier) # Pop the tile with the lowest cost
-
-            # We've found the goal
-            if current == end_pos:
-                break
-
-            # Explore all adjacent tiles (on any direction)
-            for angle in range(0, 360, 45):
-                dx = round(cos(angle * pi / 180))
-                dy = round(sin(angle * pi / 180))
-                next_pos = (current[0] + dx, current[1] + dy)
-
-                # Check if next position is in a loaded chunk
-                if not world.get_tile(next_pos[0], next_pos[1]) or not self.valid_position(world, next_pos[0], next_pos[1]):
-                    continue
-
-                movement_cost = hypot(dx, dy)
-                new_cost: float = cost_so_far[current] + movement_cost
-
-                if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
-                    cost_so_far[next_pos] = new_cost
-                    priority: float = new_cost + hypot(end_pos[0] - next_pos[0], end_pos[1] - next_pos[1])
-
-                    # The priority queue: less steps = higher priority
-                    heapq.heappush(frontier, (priority, next_pos))
-
-                    came_from[next_pos] = current
-
-        # Rebuild the path
-        if end_pos not in came_from:
-            return []
-
-        path: list[Vector2] = []
-        current = end_pos
-        while current and current != start_pos:
-            path.append(Vector2(current[0], current[1]))
-            current = came_from[current]
-        path.reverse()
+        """
+            Find a path between two positions, with the points in between (see Pathfinder)
+
+            - The game doesn't call it now (the chasing mobs follow world.flow), it stays
+              for the point to point searches, and the pathfinding benchmark times it
+        """
+        # If the final position is not valid, find the nearest valid position
+        if not (end_pos := Pathfinder.nearest(world, int(end.x), int(end.y))):
+            return [] # No valid path found
+
+        path = Pathfinder.search(world, (int(start.x), int(start.y)), end_pos)
 
         # Add intermediate points for smoother movement
-        return self.interpolate(path)
+        return self.interpolate([Vector2(x, y) for x, y in path])
+
+
+    def chase(self, world: World) -> None:
+        """ Move towards the player, following the shared flow field (see FlowField) """
+        if not (target := world.flow.toward(self.mob.position)):
+            self.state = State.IDLE
+            return
+
+        self.state = State.CHASING
+        self.mob.move(world, target[0], target[1])
+
 
     def water_between(self, world: World, start: Vector2, end: Vector2) -> bool:
         """
@@ -186,8 +127,7 @@ class Brain:
             err = dx / 2.0  # Initial error for Bresenham
             while x != x2:  # Until we reach the end point in X
                 # Check if current tile is water
-                tile = world.get_tile(x, y)
-                if tile and tile.liquid:
+                if Collision.liquid(world, x, y):
                     return True  # Found water, terminate
 
                 # Update error and Y position if needed
@@ -202,8 +142,7 @@ class Brain:
             err = dy / 2.0  # Initial error for Bresenham
             while y != y2:  # Until we reach the end point in Y
                 # Check if current tile is water
-                tile = world.get_tile(x, y)
-                if tile and tile.liquid:
+                if Collision.liquid(world, x, y):
                     return True  # Found water, terminate
 
                 # Update error and X position if needed
@@ -236,15 +175,18 @@ class PassiveBrain(Brain):
         self.mob.speed = self.base_speed
 
         if self.state == State.IDLE:
-            self.wander_timer += 1
+            self.wander_timer += self.updates
             if self.wander_timer >= self.wander_cooldown:
                 self.random_target(world)
                 self.wander_timer = 0
 
         elif self.state == State.MOVING:
-            self.path_timer += 1
+            self.path_timer += self.updates
 
-            if not (self.path_timer % 75 == 0):
+            # The timer passed a multiple of 75 on this update
+            check = self.path_timer % 75 < self.updates
+
+            if not check:
                 if not self.valid_position(world, self.target_pos.x, self.target_pos.y):
                     self.random_target(world)
                     return
@@ -255,7 +197,7 @@ class PassiveBrain(Brain):
             self.mob.move(world, self.target_pos.x, self.target_pos.y)
 
             # Stuck check
-            if (self.path_timer % 75 == 0):
+            if check:
                 if self.last_pos == self.mob.position:
                     self.random_target(world)
                     self.path_timer = 0
@@ -266,6 +208,19 @@ class PassiveBrain(Brain):
                 self.state = State.IDLE
 
 
+    def idle_ticks(self) -> int:
+        if self.state != State.IDLE or self.mob.hurt_time > 0 or self.mob.health <= 0:
+            return 0
+
+        # The idle updates are each 2 ticks, jump to the last one before wandering
+        updates = self.wander_cooldown - self.wander_timer - 1
+        if updates <= 0:
+            return 0
+
+        self.wander_timer += updates
+        return updates * 2
+
+
     def random_target(self, world: World) -> None:
         # Try up to 10 random spots
         for _ in range(10):
@@ -290,7 +245,6 @@ class PassiveBrain(Brain):
 class HostileBrain(Brain):
     def __init__(self, mob: Mob):
         super().__init__(mob)
-        self.path_timer: int = 0
 
         # The range (in tiles) within which the mob will start chasing
         self.path_range: float = 4.50
@@ -298,12 +252,6 @@ class HostileBrain(Brain):
         # Minimal distance to the player
         self.target_dist: float = 0.40
 
-        # How often the mob will update its path (ticks)
-        self.update_rate: int = 10
-
-        # Threshold to consider that we have reached the destination
-        self.move_threshold: float = 0.1
-
         self.passive_brain = PassiveBrain(mob)
 
 
@@ -322,39 +270,11 @@ class HostileBrain(Brain):
         if (player_dist <= self.path_range and
             not world.player.swimming() and
             not self.water_between(world, self.mob.position, player_pos)):
-            self.path_timer += 1
-            if self.path_timer >= self.update_rate or not self.path:
-                self.path = self.find_path(world, self.mob.position, player_pos)
-                self.path_timer = 0
-
-                if not self.path:
-                    self.state = State.IDLE
-                    return
-
-                self.state = State.CHASING
-
-            if self.state == State.CHASING and self.path:
-                next_point: Vector2 = self.path[0]
-
-                if not self.valid_position(world, next_point.x, next_point.y):
-                    self.path = self.find_path(world, self.mob.position, player_pos)
-
-                    # If no path, well, let’s wander
-                    if not self.path:
-                        self.state = State.IDLE
-                        self.passive_brain.update(world)
-                        return
-
-                # We move directly to the next point
-                self.mob.move(world, next_point.x, next_point.y)
-
-                # We check if we reach the point using the threshold
-                if abs(self.mob.position.x - next_point.x) < self.move_threshold and \
-                   abs(self.mob.position.y - next_point.y) < self.move_threshold:
-                    self.path.pop(0) # Move to the next point
+            self.chase(world)
         else:
             # If we're not chasing, let's just wander randomly
             self.state = State.MOVING
+            self.passive_brain.updates = self.updates
             self.passive_brain.update(world)
 
 
@@ -362,7 +282,6 @@ class HostileBrain(Brain):
 class NeutralBrain(Brain):
     def __init__(self, mob: Mob):
         super().__init__(mob)
-        self.path_timer: int = 0
 
         # The range (in tiles) within which the mob will detect player
         self.path_range: float = 4.50
@@ -370,11 +289,6 @@ class NeutralBrain(Brain):
         # Minimal distance to the player
         self.target_dist: float = 0.40
 
-        # How often the mob will update its path (ticks)
-        self.update_rate: int = 10
-
-        self.move_threshold: float = 0.1
-
         # For movement detection
         self.last_target: Vector2 = None
 
@@ -395,17 +309,19 @@ class NeutralBrain(Brain):
         player_dist = self.mob.position.distance_to(player_pos)
 
         # Check if player is moving
-        target_moving = False
         if self.last_target:
             target_moving = player_pos != self.last_target
-        self.last_target = Vector2(player_pos)
+            self.last_target.update(player_pos)
+        else:
+            target_moving = False
+            self.last_target = Vector2(player_pos)
 
         # Update memory
         if target_moving:
             self.current_memory = self.memory_time
             self.current_wait = 0 # Reset wait timer if player moves
         elif self.current_memory > 0:
-            self.current_memory -= 1
+            self.current_memory = max(0, self.current_memory - self.updates)
             if self.current_memory == 0: # Memory just ran out
                 self.current_wait = self.wait_time # Start waiting period
 
@@ -425,40 +341,14 @@ class NeutralBrain(Brain):
 
             # Increase speed while chasing
             self.mob.speed = self.base_speed * 2.00
-
-            self.path_timer += 1
-            if self.path_timer >= self.update_rate or not self.path:
-                self.path = self.find_path(world, self.mob.position, player_pos)
-                self.path_timer = 0
-
-                if not self.path:
-                    self.state = State.IDLE
-                    return
-
-                self.state = State.CHASING
-
-            if self.state == State.CHASING and self.path:
-                next_point: Vector2 = self.path[0]
-
-                if not self.valid_position(world, next_point.x, next_point.y):
-                    self.path = self.find_path(world, self.mob.position, player_pos)
-
-                    if not self.path:
-                        self.state = State.IDLE
-                        self.passive_brain.update(world)
-                        return
-
-                self.mob.move(world, next_point.x, next_point.y)
-
-                if abs(self.mob.position.x - next_point.x) < self.move_threshold and \
-                   abs(self.mob.position.y - next_point.y) < self.move_threshold:
-                    self.path.pop(0)
+            self.chase(world)
         else:
             # Check if we should wait or move
             if self.current_wait > 0:
-                self.current_wait -= 1
+                self.current_wait = max(0, self.current_wait - self.updates)
                 self.state = State.WAITING
             else:
                 # If waiting period is over and no player movement ...
                 self.state = State.MOVING
+                self.passive_brain.updates = self.updates
                 self.passive_brain.update(world)
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from pygame import Surface, Vector2
 
 from source.utils.autoslots import auto_slots
+from source.utils.constants import SCREEN_HALF_H, SCREEN_HALF_W, TILE_SIZE
 
 if TYPE_CHECKING:
     from source.world.world import World
@@ -15,15 +16,34 @@ if TYPE_CHECKING:
 class Entity:
 
     def __init__(self):
-        # Entity ID
+        # Entity ID (the type, see Entities)
         self.eid = -1
 
+        # Runtime ID, unique in the world (set by World.add)
+        self.uid: int = None
+
         self.world: World = None
         self.sprites: Sprites = None
 
         self.facing: Vector2 = Vector2(0, 1)
         self.position: Vector2 = Vector2(0, 0)
 
+        # Position on the previous tick, for the render interpolation
+        self.previous: Vector2 = Vector2(0, 0)
+
+        # Screen position
+        self.rx: int = 0
+        self.ry: int = 0
+
+        # Chunk bucket in the world spatial index
+        self.cell: tuple[int, int] = None
+
+        # Ticks covered by the current update (0 = skipped), see World.tier
+        self.step: int = 1
+
+        # Ticks left without updates (nothing to do until then)
+        self.sleeping: int = 0
+
 
     def initialize(self, world: World):
         self.world = world
@@ -42,11 +62,21 @@ class Entity:
         pass
 
 
+    def project(self) -> None:
+        """ Update the screen position, interpolated between the last two ticks """
+        alpha = self.world.alpha
+        camera = self.world.camera
+
+        x = self.previous.x + (self.position.x - self.previous.x) * alpha
+        y = self.previous.y + (self.position.y - self.previous.y) * alpha
+
+        self.rx = int(SCREEN_HALF_W - ((camera.x - x) * TILE_SIZE))
+        self.ry = int(SCREEN_HALF_H - ((camera.y - y) * TILE_SIZE))
+
+
     def remove(self) -> None:
-        self.world.entities = [
-            entity for entity in self.world.entities
-            if entity.position != self.position
-        ]
+        """ Despawn the entity (the world removes it at the end of the tick) """
+        self.world.remove(self)
 
 
     def data(self) -> dict:
@@ -1,16 +1,12 @@
 from __future__ import annotations
 
-from math import hypot
 from typing import TYPE_CHECKING
 
 from pygame import Surface, Vector2
 from source.entity.entity import Entity
+from source.world.collision import Collision
 
-from source.utils.constants import (
-    CHUNK_SIZE, POSITION_SHIFT, SCREEN_HEIGHT,
-    SCREEN_WIDTH, SCREEN_HALF_H, SCREEN_HALF_W,
-    TILE_BITS, TILE_SIZE
-)
+from source.utils.constants import SCREEN_HEIGHT, SCREEN_WIDTH, TILE_SIZE
 
 from source.utils.autoslots import auto_slots
 
@@ -39,68 +35,14 @@ class Furniture(Entity):
         self.cx = 0
         self.cy = 0
 
-        self.rx = 0
-        self.ry = 0
-
 
     def move(self, world: World, mx: float, my: float) -> None:
-        """ Move the mob towards a target position using grid-based movement """
-        # Convert current and target positions to tile coordinates
-        dx = mx - self.position.x
-        dy = my - self.position.y
-
-        if dx != 0 or dy != 0:
-            # Normalize the movement vector and apply speed uniformly
-            length = hypot(dx, dy)
-            if length > 0:
-                dx = (dx / length) * self.speed
-                dy = (dy / length) * self.speed
-
-            # Convert movement to bit-shifted format
-            new_x = int((self.position.x + dx) * TILE_BITS)
-            new_y = int((self.position.y + dy) * TILE_BITS)
-
-            # Convert to tile coordinates for collision
-            tile_x = new_x >> POSITION_SHIFT
-            tile_y = new_y >> POSITION_SHIFT
-
-            # Get current tile position
-            current_x = int(self.position.x)
-            current_y = int(self.position.y)
-
-            # For diagonal movement, check both intermediate tiles
-            if current_x != tile_x and current_y != tile_y:
-                # Check horizontal movement
-                tile_h = world.get_tile(tile_x, current_y)
-                if not tile_h or tile_h.solid or tile_h.liquid:
-                    dx = 0  # Block horizontal movement
-
-                # Check vertical movement
-                tile_v = world.get_tile(current_x, tile_y)
-                if not tile_v or tile_v.solid or tile_v.liquid:
-                    dy = 0  # Block vertical movement
+        """ Move the furniture towards a target position using grid-based movement """
+        Collision.move(world, self, mx, my, self.speed)
 
-            # Check final tile
-            tile = world.get_tile(tile_x, tile_y)
 
-            # If the tile doesnt exist ...
-            if not tile:
-                return # We dont move
-
-            # If the tile is solid or liquid ...
-            if tile.solid or tile.liquid:
-                return # We dont move
-
-            # Now yes, we move (if there's any movement left)
-            if dx != 0 or dy != 0:
-                self.position.x += dx
-                self.position.y += dy
-
-                self.facing = Vector2(dx, dy).normalize()
-
-                # Update chunk position
-                self.cx = tile_x // CHUNK_SIZE
-                self.cy = tile_y // CHUNK_SIZE
+    def can_swim(self) -> bool:
+        return False
 
 
     def update(self):
@@ -110,16 +52,14 @@ class Furniture(Entity):
             target_y = self.position.y + self.push_dir.y
             self.move(self.world, target_x, target_y)
 
-            self.push_dir = Vector2(0, 0)
+            self.push_dir.update(0, 0)
             self.push_time -= 1
 
-        self.rx = int(SCREEN_HALF_W - ((self.world.player.position.x - self.position.x) * TILE_SIZE))
-        self.ry = int(SCREEN_HALF_H - ((self.world.player.position.y - self.position.y) * TILE_SIZE))
-
 
     def touched_by(self, player: Player):
         if (self.push_time == 0):
-            self.push_dir = player.facing
+            # A copy, the player facing changes in place
+            self.push_dir.update(player.facing)
             self.push_time = 10
 
 
@@ -128,5 +68,7 @@ class Furniture(Entity):
 
 
     def render(self, screen: Surface):
+        self.project()
+
         if not (-TILE_SIZE <= self.rx <= SCREEN_WIDTH and -TILE_SIZE <= self.ry <= SCREEN_HEIGHT):
             return
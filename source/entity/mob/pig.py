@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from pygame import Surface, Vector2
+from pygame import Surface
 
 from source.entity.brain import PassiveBrain
 from source.entity.mob.mob import Mob
@@ -36,17 +36,18 @@ class Pig(Mob):
     def update(self) -> None:
         super().update()
 
-        # Update sprite
-        movement = self.position - self.last_pos
+        # Update sprite (without temporary vectors, this runs every tick)
+        mx = self.position.x - self.last_pos.x
+        my = self.position.y - self.last_pos.y
 
-        if movement.length() > 0:
+        if mx or my:
             # Determine sprite direction based on movement
-            if abs(movement.x) > abs(movement.y):
-                sprite_row = 3 if movement.x > 0 else 2  # Right or Left
-                self.facing = Vector2(1, 0) if movement.x > 0 else Vector2(-1, 0)
+            if abs(mx) > abs(my):
+                sprite_row = 3 if mx > 0 else 2  # Right or Left
+                self.facing.update(1 if mx > 0 else -1, 0)
             else:
-                sprite_row = 1 if movement.y > 0 else 0  # Down or Up
-                self.facing = Vector2(0, 1) if movement.y > 0 else Vector2(0, -1)
+                sprite_row = 1 if my > 0 else 0  # Down or Up
+                self.facing.update(0, 1 if my > 0 else -1)
 
             self.sprite = self.sprites[sprite_row][self.walk_dist % 2]
         else:
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import random
+from array import array
+from typing import TYPE_CHECKING
+
+import pygame
+from pygame import Surface
+
+from source.screen.color import Color
+from source.utils.profiler import Profiler
+
+from source.utils.constants import (
+    SCREEN_HALF_H, SCREEN_HALF_W, SCREEN_HEIGHT,
+    SCREEN_WIDTH, TILE_SIZE
+)
+
+if TYPE_CHECKING:
+    from source.screen.screen import Screen
+    from source.world.world import World
+
+
+class Particles:
+    """
+        All the world particles, a struct of arrays (one array per field, not entities)
+
+        - A plain Python loop updates them on each tick (no per-particle objects nor method calls),
+          and they render as one draw list
+        - Each particle has a glyph, the surfaces shared by the ones with the same text and color,
+          the least recently used ones get replaced past GLYPH_CACHE
+    """
+
+    # Lifetimes (in ticks)
+    TEXT_LIFE: int = 60
+    SMASH_LIFE: int = 10
+
+    # Only the texts fall (and bounce)
+    GRAVITY: float = 0.16
+
+    # Glyph of the smash particles (its sprite can change with the custom atlas)
+    SMASH: int = 0
+
+    # Max glyphs kept (more only while all of them are on screen)
+    GLYPH_CACHE: int = 64
+
+    def __init__(self, world: World) -> None:
+        self.world: World = world
+
+        # Positions, and on the previous tick (for the render interpolation)
+        self.x = array('d')
+        self.y = array('d')
+        self.px = array('d')
+        self.py = array('d')
+
+        # Height over the ground, velocities and gravity
+        self.z = array('d')
+        self.xa = array('d')
+        self.ya = array('d')
+        self.za = array('d')
+        self.gravity = array('d')
+
+        # Ticks lived, lifetime and glyph index
+        self.age = array('i')
+        self.life = array('i')
+        self.glyph = array('i')
+
+        # Glyph keys (least recently used first), and their surfaces (made on the first render):
+        # (front, shadow, half width)
+        self.glyphs: dict[tuple, int] = {('smash',): Particles.SMASH}
+        self.keys: list[tuple] = [('smash',)]
+        self.surfaces: list[tuple[Surface, Surface, int]] = [None]
+
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+
+    def add(self, x: float, y: float, z: float, xa: float, ya: float, za: float, gravity: float, life: int, key: tuple) -> None:
+        """ Add a particle, with the glyph of a key (a new one if not cached) """
+        if (glyph := self.glyphs.pop(key, None)) is None:
+            glyph = self.new_glyph(key)
+
+        # Move it to the end (most recently used)
+        self.glyphs[key] = glyph
+
+        self.x.append(x)
+        self.y.append(y)
+        self.px.append(x)
+        self.py.append(y)
+
+        self.z.append(z)
+        self.xa.append(xa)
+        self.ya.append(ya)
+        self.za.append(za)
+        self.gravity.append(gravity)
+
+        self.age.append(0)
+        self.life.append(life)
+        self.glyph.append(glyph)
+
+
+    def new_glyph(self, key: tuple) -> int:
+        """ Get a glyph for a key, replacing the least recently used one if the cache is full """
+        if len(self.glyphs) >= Particles.GLYPH_CACHE:
+            used = set(self.glyph)
+
+            # The glyphs of the living particles (and the smash one) stay
+            for old, index in self.glyphs.items():
+                if index != Particles.SMASH and index not in used:
+                    del self.glyphs[old]
+                    self.keys[index] = key
+                    self.surfaces[index] = None
+                    return index
+
+        self.keys.append(key)
+        self.surfaces.append(None)
+        return len(self.keys) - 1
+
+
+    def text(self, message: str, x: float, y: float, color: tuple) -> None:
+        """ Add a bouncing text (like the damage numbers) """
+        self.add(
+            x, y, 2.0,
+            random.gauss() * 0.03,
+            random.gauss() * 0.02,
+            random.uniform(0, 1) * 0.7 + 2,
+            Particles.GRAVITY, Particles.TEXT_LIFE,
+            ('text', message, tuple(color))
+        )
+
+
+    def smash(self, x: float, y: float) -> None:
+        """ Add a smash (when a solid tile gets hurt) """
+        self.add(x, y, 0.0, 0.0, 0.0, 0.0, 0.0, Particles.SMASH_LIFE, ('smash',))
+
+
+    def clear(self) -> None:
+        for column in (self.x, self.y, self.px, self.py, self.z, self.xa, self.ya, self.za, self.gravity, self.age, self.life, self.glyph):
+            del column[:]
+
+
+    @Profiler.timed('particles')
+    def update(self) -> None:
+        x, y, px, py = self.x, self.y, self.px, self.py
+        z, xa, ya, za, gravity = self.z, self.xa, self.ya, self.za, self.gravity
+        age, life, glyph = self.age, self.life, self.glyph
+
+        # Move the living particles to the front, and drop the rest
+        alive = 0
+        for i in range(len(x)):
+            ticks = age[i] + 1
+            if ticks > life[i]:
+                continue
+
+            px[alive] = x[i]
+            py[alive] = y[i]
+
+            x[alive] = x[i] + xa[i] * 1.1
+            y[alive] = y[i] + ya[i] * 1.1
+            height = z[i] + za[i] * 2
+
+            if height < 0:
+                height = 0.0
+                za[alive] = za[i] * -0.55 - gravity[i]
+                xa[alive] = xa[i] * 0.60
+                ya[alive] = ya[i] * 0.60
+            else:
+                za[alive] = za[i] - gravity[i]
+                xa[alive] = xa[i]
+                ya[alive] = ya[i]
+
+            z[alive] = height
+            gravity[alive] = gravity[i]
+            age[alive] = ticks
+            life[alive] = life[i]
+            glyph[alive] = glyph[i]
+
+            alive += 1
+
+        if alive < len(x):
+            for column in (x, y, px, py, z, xa, ya, za, gravity, age, life, glyph):
+                del column[alive:]
+
+
+    def make_glyph(self, screen: Screen, index: int) -> tuple[Surface, Surface, int]:
+        """ Render the text surfaces of a glyph (scaled, with the shadow) """
+        _, message, color = self.keys[index]
+        width = len(message) * 16
+
+        text = pygame.transform.scale(screen.text(screen.chars, message, color), (width, 16))
+        back = pygame.transform.scale(screen.text(screen.chars, message, Color.BLACK), (width, 16))
+
+        self.surfaces[index] = (text, back, width // 2)
+        return self.surfaces[index]
+
+
+    def render(self, screen: Screen) -> None:
+        """ Add the visible particles to the world draw list """
+        world = self.world
+        alpha = world.alpha
+
+        # Same as Entity.project, but for all of them
+        left = SCREEN_HALF_W - world.camera.x * TILE_SIZE
+        top = SCREEN_HALF_H - world.camera.y * TILE_SIZE
+
+        self.surfaces[Particles.SMASH] = (world.sprites.SMASH_PARTICLE, None, 0)
+        surfaces = self.surfaces
+
+        x, y, px, py, z, glyph = self.x, self.y, self.px, self.py, self.z, self.glyph
+        draw = []
+
+        for i in range(len(x)):
+            front, back, half = surfaces[glyph[i]] or self.make_glyph(screen, glyph[i])
+
+            rx = int(left + (px[i] + (x[i] - px[i]) * alpha) * TILE_SIZE) - half
+            ry = int(top + (py[i] + (y[i] - py[i]) * alpha) * TILE_SIZE) - int(z[i])
+
+            if not (-TILE_SIZE - 2 * half <= rx <= SCREEN_WIDTH and -TILE_SIZE <= ry <= SCREEN_HEIGHT):
+                continue
+
+            if back:
+                draw.append((back, (rx + 2, ry + 2, ry + 24)))
+            draw.append((front, (rx, ry, ry + 24)))
+
+        world.surfaces.extend(draw)
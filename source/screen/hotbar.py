@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from source.screen.screen import Screen
 from source.screen.sprites import Sprites
 from source.utils.constants import SCREEN_SIZE
+from source.utils.profiler import Profiler
 
 if TYPE_CHECKING:
     from source.world.world import Player
@@ -38,6 +39,7 @@ class Hotbar:
     def update(self) -> None:
         pass
 
+    @Profiler.timed('hud')
     def render(self, screen: Screen) -> None:
         self.buffer.clear()
 
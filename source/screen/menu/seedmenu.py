@@ -92,9 +92,9 @@ class SeedMenu(Menu):
         self.buffer.extend(self.texts)
 
         # Render input text
-        input_text = screen.font.render(
-            self.seed_input + ("█" if self.cursor_visible else " "), False, Color.WHITE
-        ).convert()
+        input_text = screen.text(
+            screen.font, self.seed_input + ("█" if self.cursor_visible else " "), Color.WHITE
+        )
         self.buffer.append((input_text, input_text.get_rect(center=self.seed_input_rect.center)))
 
         screen.buffer.blits(self.buffer)
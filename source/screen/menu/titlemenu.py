@@ -136,11 +136,7 @@ class TitleMenu(Menu):
                 msg = "> " + msg + " <"
                 col = Color.WHITE
 
-            shadow = screen.font.render(msg, False, Color.BLACK).convert()
-            shadow_rect = shadow.get_rect(center = (SCREEN_HALF[0] + 1, 280 + i * 16))
-            self.buffer.append((shadow, shadow_rect))
-
-            text = screen.font.render(msg, False, col, None).convert()
+            text = screen.shadowed(screen.font, msg, col)
             text_rect = text.get_rect(center = (SCREEN_HALF[0], 280 + i * 16))
 
             self.buffer.append((text, text_rect))
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import os
 from typing import TYPE_CHECKING
 
 from pygame import Font, Surface
 import pygame
 
 from source.screen.color import Color
-from source.utils.constants import SCREEN_HALF, SCREEN_SIZE
+from source.screen.textures import Textures
+from source.utils.constants import NATIVE_SIZE, SCREEN_HALF, SCREEN_SIZE, TILE_SCALE
+from source.utils.profiler import Profiler
 
 if TYPE_CHECKING:
     from source.screen.sprites import Sprites
@@ -26,56 +29,93 @@ class Screen:
         pygame.display.set_caption("Minicraft Potato Edition")
 
         self.buffer = pygame.display.get_surface() # get_surface is a pointer to the main window surface, is FASTER!
-        self.overlay: Surface = pygame.Surface((200, 200), pygame.SRCALPHA, 32).convert_alpha()
+
+        # Native resolution mode, the world is drawn with unscaled sprites
+        # into a small canvas, and then upscaled once to the window
+        self.native: bool = False
+        self.canvas: Surface = pygame.Surface(NATIVE_SIZE).convert(self.buffer)
+
+        self.overlay: Surface = None
         self.darkness: Surface = pygame.Surface(self.buffer.get_size(), pygame.SRCALPHA, 32).convert_alpha()
 
+        # Composited darkness surfaces by light level, the least recently used
+        # levels are dropped (each one is a full screen surface, ~2 MB)
+        self.LIGHT_CACHE: int = 8
+        self.lights: dict[int, Surface] = {}
+
         self.font: Font = pygame.font.Font("./assets/fonts/IBM_VGA.ttf", 16) # Used for game texts
         self.chars: Font = pygame.font.Font("./assets/fonts/IBM_BIOS.ttf", 8) # Used for game particles
 
+        # Rendered texts, by (font, message, color, background[, shadow, offsets]).
+        # The least recently used ones are dropped
+        self.TEXT_CACHE: int = 512
+        self.texts: dict[tuple, Surface] = {}
+
         self.sprites: Sprites = None
 
 
     def initialize(self, sprites: Sprites) -> None:
 
         # We generate the dither for the lightning system
-        self.overlay.fill((255, 255, 255, 0))
+        self.overlay = Textures.light_overlay(200)
         self.darkness.fill((0, 0, 0, 255))
 
-        # Dithering pattern
-        dither = [
-            [0,  8,  2, 10],
-            [12, 4, 14,  6],
-            [3, 11,  1,  9],
-            [15, 7, 13,  5],
-        ]
+        # The player light hole never moves, so we carve it only once. Every
+        # pixel touched by the overlay gets fully lit, just like the repeated
+        # BLEND_RGBA_SUB of the overlay did after a few frames
+        pygame.mask.from_surface(self.overlay, 0).to_surface(
+            self.darkness,
+            setcolor = (0, 0, 0, 0),
+            unsetcolor = None,
+            dest = ((SCREEN_HALF[0] - 96), (SCREEN_HALF[1] - 92) - 16)
+        )
+        self.lights.clear()
+
+        # Assing sprites reference
+        self.sprites = sprites
 
-        for y in range(200):
-            dy = y - 100
-            yy = dy * dy  # (y - 100)^2
 
-            for x in range(200):
-                dx = x - 100
-                xx = dx * dx  # (x - 100)^2
+    def toggle_native(self) -> None:
+        """ Switch between the scaled and the native resolution rendering """
+        self.native = not self.native
 
-                distance = xx + yy
-                if distance < 10000:  # 100^2
-                    alpha = max(0, 255 - (distance * 0.0255) - (dither[y % 4][x % 4] * 13))
-                    self.overlay.set_at((x, y), (0, 0, 0, int(alpha)))
 
-        # Assing sprites reference
-        self.sprites = sprites
+    def render_world(self, surfaces: list) -> None:
+        """ Draw the sorted world sprites buffer ([(surface, (x, y, z))]) """
 
+        if not self.native:
+            self.buffer.fblits([(sprite, (pos[0], pos[1])) for sprite, pos in surfaces])
+            return
 
+        # Same layout, but scaled down to the atlas resolution
+        native = self.sprites.native
+        self.canvas.fill(0)
+        self.canvas.fblits([(native(sprite), (pos[0] // TILE_SCALE, pos[1] // TILE_SCALE)) for sprite, pos in surfaces])
+
+        # Nearest-neighbour upscale, straight into the window surface
+        pygame.transform.scale(self.canvas, SCREEN_SIZE, self.buffer)
+
+
+    @Profiler.timed('light')
     def update_light(self, daylight: int):
-        self.darkness.set_alpha(255 - daylight)
+        # Full daylight, there is nothing to darken
+        if daylight >= 255:
+            return
 
-        self.darkness.blit(
-            self.overlay,
-            ((SCREEN_HALF[0] - 96), (SCREEN_HALF[1] - 92) - 16),
-            special_flags = pygame.BLEND_RGBA_SUB
-        )
+        darkness = self.lights.pop(daylight, None)
+
+        if darkness is None:
+            # Bake the light level into the per-pixel alpha
+            darkness = self.darkness.copy()
+            darkness.fill((255, 255, 255, 255 - daylight), special_flags = pygame.BLEND_RGBA_MULT)
 
-        self.buffer.blit(self.darkness)
+            if len(self.lights) >= self.LIGHT_CACHE:
+                del self.lights[next(iter(self.lights))]
+
+        # Re-insert it as the most recently used
+        self.lights[daylight] = darkness
+
+        self.buffer.blit(darkness)
 
 
     def draw_box(self, x: int, y: int, width: int, height: int) -> list:
@@ -109,6 +149,57 @@ class Screen:
         return buffer
 
 
+    def _cached(self, key: tuple) -> (Surface | None):
+        """ Get a cached text surface, marking it as the most recently used """
+        if (surface := self.texts.pop(key, None)) is not None:
+            self.texts[key] = surface
+        return surface
+
+
+    def _cache(self, key: tuple, surface: Surface) -> Surface:
+        """ Store a text surface, dropping the least recently used one if full """
+        if len(self.texts) >= self.TEXT_CACHE:
+            del self.texts[next(iter(self.texts))]
+
+        self.texts[key] = surface
+        return surface
+
+
+    def text(self, font: Font, message: str, color: tuple, background: tuple = None) -> Surface:
+        """ Render a text (without antialias), or get it from the cache """
+        key = (font, message, color, background)
+
+        if (surface := self._cached(key)) is not None:
+            return surface
+
+        return self._cache(key, font.render(message, False, color, background).convert())
+
+
+    def shadowed(self, font: Font, message: str, color: tuple, shadow: tuple = Color.BLACK, offsets: tuple = ((1, 1),)) -> Surface:
+        """
+            Render a text with its shadow copies already composed, or get it from the cache
+
+            - The surface has 1 pixel of padding on each side for the shadows (offsets
+              go from -1 to 1), so blit it at (x - 1, y - 1). Centered rects are the same
+        """
+        key = (font, message, color, None, shadow, offsets)
+
+        if (surface := self._cached(key)) is not None:
+            return surface
+
+        text = self.text(font, message, color)
+        back = self.text(font, message, shadow)
+
+        surface = Surface((text.get_width() + 2, text.get_height() + 2)).convert()
+        surface.fill((255, 0, 255))
+        surface.set_colorkey((255, 0, 255))
+
+        surface.fblits([(back, (1 + xo, 1 + yo)) for xo, yo in offsets])
+        surface.blit(text, (1, 1))
+
+        return self._cache(key, surface)
+
+
     def draw_text(self, text: str, x: int, y: int, fore: Color, back: Color, shadow: bool):
         buffer = []
 
@@ -119,3 +210,14 @@ class Screen:
     def draw_frame(x, y, width, height, title):
         pass
     """
+
+
+class NullScreen(Screen):
+    """ A screen without window (for headless runs), rendering still works offscreen """
+
+    def __init__(self):
+        # SDL dummy drivers, pygame.init() also wakes up the mixer
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+        super().__init__()
@@ -1,3 +1,5 @@
+from weakref import WeakKeyDictionary
+
 import pygame
 
 from source.utils.constants import TILE_SCALE, TILE_SIZE
@@ -10,10 +12,21 @@ class Sprites:
         self.atlas = pygame.image.load('assets/atlas.png').convert()
         self.atlas.set_colorkey((255, 0, 255))
 
+        # Scaled sprite -> unscaled (atlas resolution) sprite, for native rendering (weak, so
+        # the scaled down glyphs and texts go with them)
+        self.natives: WeakKeyDictionary[pygame.Surface, pygame.Surface] = WeakKeyDictionary()
+
+        # Sprite -> its top half (the swimming player)
+        self.halves: dict[pygame.Surface, pygame.Surface] = {}
+
 
     def initialize(self) -> None:
         """ Initialize all sprites """
 
+        # Forget the natives from a previous atlas
+        self.natives.clear()
+        self.halves.clear()
+
         self.NULL = [self.get_tiled(0, 31, 16)]
         self.GREEN_EYE = self.get_tiled(0, 29, 16)
         self.A_POTATOE = self.get_tiled(1, 29, 16)
@@ -276,13 +289,35 @@ class Sprites:
     def get_tiled(self, x: int, y: int, size) -> pygame.Surface:
         """ Extract and scale a sprite from the atlas """
         scale = size * TILE_SCALE
-        return pygame.transform.scale(
-            self.atlas.subsurface((x * size, y * size, size, size)), (scale, scale)
-        )
+        native = self.atlas.subsurface((x * size, y * size, size, size))
+
+        sprite = pygame.transform.scale(native, (scale, scale))
+        self.natives[sprite] = native
+        return sprite
 
 
     def get_px(self, x: int, y: int, width: int, height: int, scale: int) -> pygame.Surface:
         """ Extract and scale a sprite from the atlas """
-        return pygame.transform.scale(
-            self.atlas.subsurface((x, y, width, height)), (scale, scale)
-        )
+        native = self.atlas.subsurface((x, y, width, height))
+
+        sprite = pygame.transform.scale(native, (scale, scale))
+        self.natives[sprite] = pygame.transform.scale(native, (scale // TILE_SCALE, scale // TILE_SCALE))
+        return sprite
+
+
+    def native(self, sprite: pygame.Surface) -> pygame.Surface:
+        """ Get the unscaled version of a sprite (scaling down the unknown ones, once) """
+        if (native := self.natives.get(sprite)) is None:
+            native = self.natives[sprite] = pygame.transform.scale_by(sprite, 1 / TILE_SCALE)
+        return native
+
+
+    def top_half(self, sprite: pygame.Surface) -> pygame.Surface:
+        """ Get the top half of a sprite (the same surface each time, with its native one) """
+        if (half := self.halves.get(sprite)) is None:
+            half = self.halves[sprite] = sprite.subsurface((0, 0, sprite.get_width(), sprite.get_height() // 2))
+
+            if (native := self.natives.get(sprite)) is not None:
+                self.natives[half] = native.subsurface((0, 0, native.get_width(), native.get_height() // 2))
+
+        return half
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+from hashlib import sha1
+from math import isqrt
+from typing import Callable
+
+import pygame
+from pygame import Surface
+
+
+class Textures:
+    """ Procedural textures, built as raw pixel buffers (and cached on disk) """
+
+    CACHE_DIR: str = './cache'
+
+    # Version of the buffers format and generators, bump it when they change (old files are ignored)
+    VERSION: int = 1
+
+    # Dithering pattern
+    DITHER: tuple = (
+        ( 0,  8,  2, 10),
+        (12,  4, 14,  6),
+        ( 3, 11,  1,  9),
+        (15,  7, 13,  5),
+    )
+
+    @staticmethod
+    def cached(name: str, params: tuple, generate: Callable[..., bytes], length: int) -> bytes:
+        """
+            Get a raw pixel buffer from the cache, or generate (and store) it
+
+            Arguments:
+                name: Texture name, used for the file name
+                params: Everything the texture depends on, hashed for the file name (with the VERSION)
+                generate: Called with the params when there is no cached buffer (or a broken one)
+                length: Size of the buffer in bytes, a cached file of any other size is regenerated
+
+            Returns:
+                The raw pixel buffer
+        """
+        key = sha1(repr((Textures.VERSION, params)).encode()).hexdigest()[:16]
+        path = os.path.join(Textures.CACHE_DIR, f'{name}.{key}.raw')
+
+        try:
+            with open(path, 'rb') as file:
+                # Cut short by a crash or a full disk, make it again
+                if len(data := file.read()) == length:
+                    return data
+        except OSError:
+            pass
+
+        data = generate(*params)
+
+        # The cache is optional, a read-only install just generates it every time. Written
+        # aside and then moved in place, so the file is either whole or missing
+        temporary = f'{path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(Textures.CACHE_DIR, exist_ok = True)
+            with open(temporary, 'wb') as file:
+                file.write(data)
+            os.replace(temporary, path)
+        except OSError:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+
+        return data
+
+
+    @staticmethod
+    def light_overlay(size: int, cache: bool = True) -> Surface:
+        """ The dithered circle (RGBA) used to carve the player light """
+        params = (size, Textures.DITHER, 0.0255, 13)
+
+        if cache:
+            data = Textures.cached('overlay', params, Textures._light_overlay, size * size * 4)
+        else:
+            data = Textures._light_overlay(*params)
+
+        return pygame.image.frombytes(data, (size, size), 'RGBA').convert_alpha()
+
+
+    @staticmethod
+    def _light_overlay(size: int, dither: tuple, falloff: float, step: int) -> bytes:
+        half = size // 2
+        limit = half * half
+
+        # Transparent white outside the circle
+        data = bytearray(b'\xff\xff\xff\x00' * (size * size))
+
+        # Squared distances to the center column, and the dither of each column on each pattern row
+        columns = [(x - half) * (x - half) for x in range(size)]
+        shades = [[row[x % 4] * step for x in range(size)] for row in dither]
+
+        for y in range(size):
+            yy = (y - half) * (y - half)
+            if yy >= limit:
+                continue
+
+            # The span of the row inside the circle
+            reach = isqrt(limit - yy - 1)
+            start = max(0, half - reach)
+            end = min(size, half + reach + 1)
+
+            # Black pixels, and their alphas written over each 4th byte
+            index = y * size * 4
+            data[index + start * 4:index + end * 4] = bytes((end - start) * 4)
+            data[index + start * 4 + 3:index + end * 4:4] = bytes([
+                int(alpha) if (alpha := 255 - ((xx + yy) * falloff) - shade) > 0 else 0
+                for xx, shade in zip(columns[start:end], shades[y % 4][start:end])
+            ])
+
+        return bytes(data)
+
+
+    @staticmethod
+    def scanlines(size: tuple[int, int], shade: int, scanline: int) -> Surface:
+        """ A gray (RGB) mask, with vertical scanlines on each even column """
+        width, height = size
+
+        # One row is just two pixels repeated, and the image is one row repeated
+        row = (bytes((scanline,) * 3) + bytes((shade,) * 3)) * (width // 2)
+        if width % 2:
+            row += bytes((scanline,) * 3)
+
+        return pygame.image.frombytes(row * height, size, 'RGB').convert()
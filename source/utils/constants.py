@@ -1,6 +1,12 @@
 """ The gamelay speed is dependent for this """
 GAME_TICKS: float = 32.0 # Yeah, i sucks making games
 
+# Rendering is decoupled from the ticks (0 = use the display refresh rate)
+FRAME_RATE: int = 0
+
+# Max ticks to catch up in a single frame, the rest are dropped
+MAX_TICKS: int = 8
+
 # NOTE: The original Minicraft uses "HEIGHT as 120 * 3" and "WIDTH as 160 * 3"
 
 # Game window dimensions
@@ -16,6 +22,12 @@ RENDER_HEIGHT: int = 2
 
 RENDER_SIZE: tuple[int, int] = (RENDER_WIDTH, RENDER_HEIGHT)
 
+# Entity simulation tiers: full rate up to SIMULATION_NEAR tiles from the player
+# (the screen is 30x17 tiles), every SIMULATION_RATE ticks beyond that, and
+# frozen in the unloaded chunks
+SIMULATION_NEAR: int = 20
+SIMULATION_RATE: int = 4
+
 # NOT CHANGE THESE (OR EVERYTHING WILL BROKE, lol)
 
 TILE_SCALE: int = 2
@@ -32,6 +44,12 @@ TILE_BITS = 1 << POSITION_SHIFT  # 16 pixels = 1 tile
 SCREEN_HALF_W: int = SCREEN_WIDTH // 2
 SCREEN_HALF_H: int = SCREEN_HEIGHT // 2
 
+# Native resolution (unscaled atlas pixels), used by the native render mode
+NATIVE_WIDTH: int = SCREEN_WIDTH // TILE_SCALE
+NATIVE_HEIGHT: int = SCREEN_HEIGHT // TILE_SCALE
+
+NATIVE_SIZE: tuple[int, int] = (NATIVE_WIDTH, NATIVE_HEIGHT)
+
 DIRECTIONS = {
     ( 0,  1), # South
     ( 1,  0), # East
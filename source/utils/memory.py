@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from pygame import Surface
+
+if TYPE_CHECKING:
+    from source.core.game import Game
+    from source.world.world import World
+
+
+class Memory:
+    """
+        Where the memory goes (chunks, tiles, surfaces and entities)
+
+        ## Usage
+        ```python
+        Memory.report(game)  # {'chunks': 48, 'chunk_bytes': ..., 'tiles': ..., ...}
+
+        before = Memory.snapshot()
+        ...
+        print("\\n".join(Memory.diff(before, Memory.snapshot())))
+        ```
+
+        Sizes are estimations (sys.getsizeof and surface pixels), good to compare over time
+    """
+
+    # Stack frames kept by tracemalloc (more frames, more overhead)
+    FRAMES: int = 1
+
+
+    @staticmethod
+    def chunks(world: World) -> tuple[int, int]:
+        """
+            Estimate the loaded chunks memory
+
+            Returns:
+                Tuple of (chunk bytes, tile instances)
+        """
+        size = 0
+        tiles = set()
+
+        for chunk in world.chunks.values():
+            size += sys.getsizeof(chunk) + sys.getsizeof(chunk.tiles)
+
+            for row in chunk.tiles:
+                size += sys.getsizeof(row)
+                tiles.update(id(tile) for tile in row)
+
+                # Clones are per cell, but a tile may be shared
+                size += sum(sys.getsizeof(tile) for tile in row)
+
+        return size, len(tiles)
+
+
+    @staticmethod
+    def surfaces(*sources) -> tuple[int, int]:
+        """
+            Find the surfaces in some objects (attributes, lists and dicts, recursively)
+
+            Returns:
+                Tuple of (surface count, pixel bytes)
+        """
+        found: dict[int, Surface] = {}
+        pending = list(sources)
+        seen = set()
+
+        while pending:
+            value = pending.pop()
+
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+
+            if isinstance(value, Surface):
+                found[id(value)] = value
+            elif isinstance(value, (list, tuple, set)):
+                pending.extend(value)
+            elif isinstance(value, dict):
+                pending.extend(value.keys())
+                pending.extend(value.values())
+            elif hasattr(value, '__dict__'):
+                pending.extend(vars(value).values())
+
+        # Subsurfaces share the pixels of their parent (like the atlas sprites), count it once
+        owners: dict[int, Surface] = {}
+        for surface in found.values():
+            while (parent := surface.get_parent()) is not None:
+                surface = parent
+            owners[id(surface)] = surface
+
+        return len(found), sum(surface.get_pitch() * surface.get_height() for surface in owners.values())
+
+
+    @staticmethod
+    def report(game: Game) -> dict[str, int]:
+        """ Memory accounting of the game (sizes in bytes) """
+        world = game.world
+        screen = game.screen
+
+        chunk_bytes, tiles = Memory.chunks(world)
+
+        # Sprites, natives and the custom atlas (and the original one, if backed up)
+        sprites, sprite_bytes = Memory.surfaces(game.sprites, getattr(game.custom, 'backup_atlas', None))
+
+        # Screen caches (texts and lights) and the particle glyphs (but the smash sprite)
+        cached, cached_bytes = Memory.surfaces(screen.texts, screen.lights, world.particles.surfaces[1:])
+
+        return {
+            'chunks': len(world.chunks),
+            'chunk_bytes': chunk_bytes,
+            'tiles': tiles,
+            'sprites': sprites,
+            'sprite_bytes': sprite_bytes,
+            'screen_cache': cached,
+            'screen_cache_bytes': cached_bytes,
+            'entities': len(world.entities),
+            'particles': len(world.particles),
+            'traced_bytes': tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0,
+        }
+
+
+    @staticmethod
+    def snapshot() -> tracemalloc.Snapshot:
+        """ Take a tracemalloc snapshot (starts tracing on the first call) """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(Memory.FRAMES)
+
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+
+
+    @staticmethod
+    def diff(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, top: int = 10) -> list[str]:
+        """
+            Compare two snapshots
+
+            Returns:
+                The top lines with the biggest growth
+        """
+        stats = after.compare_to(before, 'lineno')
+        return [str(stat) for stat in stats[:top]]
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import cProfile
+import json
+import os
+import pstats
+from collections import deque
+from datetime import datetime
+from functools import wraps
+from time import perf_counter_ns
+from typing import Callable, TypeVar
+
+T = TypeVar('T')
+
+
+class Scope:
+    """ A named timer (context manager), keeps the last durations in milliseconds """
+
+    __slots__ = ('name', 'start', 'count', 'samples')
+
+    def __init__(self, name: str, window: int) -> None:
+        self.name: str = name
+        self.start: int = 0
+        self.count: int = 0
+        self.samples: deque[float] = deque(maxlen = window)
+
+    def __enter__(self) -> Scope:
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *_) -> bool:
+        end = perf_counter_ns()
+        self.samples.append((end - self.start) / 1_000_000)
+        self.count += 1
+
+        if Profiler.trace is not None:
+            Profiler.trace.append((self.name, self.start, end))
+        return False
+
+
+class NullScope:
+    """ Does nothing, used while the profiler is disabled """
+
+    __slots__ = ()
+
+    def __enter__(self) -> NullScope:
+        return self
+
+    def __exit__(self, *_) -> bool:
+        return False
+
+
+class Profiler:
+    """
+        Named scoped timers with rolling percentiles
+
+        ## Usage
+        ```python
+        with Profiler.scope('world.update'):
+            ...
+
+        @Profiler.timed('entity.path')
+        def find_path(...):
+            ...
+
+        Profiler.report()  # {'world.update': {'p50': 0.41, 'p95': ...}, ...}
+        ```
+
+        While disabled, scopes are a shared no-op object, so the cost is just a call
+
+        The scopes can also be recorded as a Chrome trace (chrome://tracing or
+        https://ui.perfetto.dev) with start_trace(), for a window of some seconds,
+        and whole functions with cProfile for some ticks with start_capture()
+    """
+
+    enabled: bool = False
+
+    # Samples kept per scope, for the percentiles
+    WINDOW: int = 512
+
+    NULL: NullScope = NullScope()
+    scopes: dict[str, Scope] = {}
+
+    # Where traces and profiles are written
+    PROFILES_DIR: str = './profiles'
+
+    # Trace recording: spans (name, start, end) and counters (name, time, value)
+    trace: list[tuple] = None
+    counters: list[tuple] = None
+    trace_start: int = 0
+    trace_end: int = 0
+    trace_enabled: bool = False # Profiler state before the trace
+
+    # cProfile capture, for a number of ticks
+    capture: cProfile.Profile = None
+    capture_ticks: int = 0
+
+    # Functions in the capture summary
+    SUMMARY_SIZE: int = 40
+
+
+    @staticmethod
+    def scope(name: str) -> (Scope | NullScope):
+        """ Get the timer of a scope (a no-op one if disabled), scopes must not nest themselves """
+        if not Profiler.enabled:
+            return Profiler.NULL
+
+        if (scope := Profiler.scopes.get(name)) is None:
+            scope = Profiler.scopes[name] = Scope(name, Profiler.WINDOW)
+        return scope
+
+
+    @staticmethod
+    def timed(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+        """ Decorator, times each call of a function into a scope """
+
+        def decorator(function: Callable[..., T]) -> Callable[..., T]:
+            @wraps(function)
+            def wrapper(*args, **kwargs) -> T:
+                if not Profiler.enabled:
+                    return function(*args, **kwargs)
+
+                with Profiler.scope(name):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+
+    @staticmethod
+    def toggle() -> None:
+        Profiler.enabled = not Profiler.enabled
+
+
+    @staticmethod
+    def reset() -> None:
+        """ Forget all the samples """
+        Profiler.scopes.clear()
+
+
+    @staticmethod
+    def percentiles(name: str) -> (dict[str, float] | None):
+        """
+            Get the rolling percentiles of a scope (in milliseconds)
+
+            Returns:
+                {'p50', 'p95', 'p99', 'max', 'count'} or None if the scope has no samples
+        """
+        scope = Profiler.scopes.get(name)
+        if not scope or not scope.samples:
+            return None
+
+        samples = sorted(scope.samples)
+        last = len(samples) - 1
+
+        return {
+            'p50': samples[int(last * 0.50)],
+            'p95': samples[int(last * 0.95)],
+            'p99': samples[int(last * 0.99)],
+            'max': samples[last],
+            'count': scope.count
+        }
+
+
+    @staticmethod
+    def report() -> dict[str, dict[str, float]]:
+        """ Percentiles of every scope, by name """
+        report = {}
+
+        for name in sorted(Profiler.scopes):
+            if stats := Profiler.percentiles(name):
+                report[name] = stats
+
+        return report
+
+
+    @staticmethod
+    def line() -> str:
+        """ A single log line with the p50/p95/p99 of every scope """
+        return "> profile: " + " | ".join(
+            f"{name} {stats['p50']:.2f}/{stats['p95']:.2f}/{stats['p99']:.2f} ms"
+            for name, stats in Profiler.report().items()
+        )
+
+
+    @staticmethod
+    def output(kind: str, extension: str) -> str:
+        """ A new file name in PROFILES_DIR, by the time to the millisecond (numbered if taken) """
+        os.makedirs(Profiler.PROFILES_DIR, exist_ok = True)
+
+        name = f"{kind}-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')[:-3]}"
+        filename = os.path.join(Profiler.PROFILES_DIR, f'{name}.{extension}')
+
+        count = 1
+        while os.path.exists(filename):
+            filename = os.path.join(Profiler.PROFILES_DIR, f'{name}-{count}.{extension}')
+            count += 1
+
+        return filename
+
+
+    @staticmethod
+    def tracing() -> bool:
+        return Profiler.trace is not None
+
+
+    @staticmethod
+    def start_trace(seconds: float = 10.0) -> None:
+        """ Record all the scopes (and counters) for some seconds """
+        if Profiler.trace is not None:
+            return
+
+        Profiler.trace_enabled = Profiler.enabled
+        Profiler.enabled = True
+
+        Profiler.trace = []
+        Profiler.counters = []
+        Profiler.trace_start = perf_counter_ns()
+        Profiler.trace_end = Profiler.trace_start + int(seconds * 1_000_000_000)
+
+
+    @staticmethod
+    def counter(name: str, value: float) -> None:
+        """ Record a value for a counter track (only while tracing) """
+        if Profiler.trace is not None:
+            Profiler.counters.append((name, perf_counter_ns(), value))
+
+
+    @staticmethod
+    def update() -> list[tuple[str, str]]:
+        """
+            Stop the trace and the capture once they are over (call it once per tick)
+
+            Returns:
+                The files that were just saved, as ('trace' or 'profile', filename)
+        """
+        saved = []
+
+        if Profiler.trace is not None and perf_counter_ns() >= Profiler.trace_end:
+            saved.append(('trace', Profiler.stop_trace()))
+
+        if Profiler.capture is not None:
+            Profiler.capture_ticks -= 1
+            if Profiler.capture_ticks <= 0:
+                saved.append(('profile', Profiler.stop_capture()))
+
+        return saved
+
+
+    @staticmethod
+    def stop_trace(filename: str = None) -> (str | None):
+        """
+            Stop the trace and save it as Chrome trace event JSON
+
+            Arguments:
+                filename: Where to save it, a timestamped file in the profiles directory if not given
+
+            Returns:
+                The trace filename, or None if there was no trace
+        """
+        if Profiler.trace is None:
+            return None
+
+        start = Profiler.trace_start
+
+        # Timestamps are in microseconds since the trace start
+        events = [
+            {'name': 'process_name', 'ph': 'M', 'pid': 0, 'tid': 0, 'args': {'name': "Minicraft Potato Edition"}},
+            {'name': 'thread_name', 'ph': 'M', 'pid': 0, 'tid': 0, 'args': {'name': "Game loop"}},
+        ]
+
+        events.extend(
+            {'name': name, 'ph': 'X', 'pid': 0, 'tid': 0, 'ts': (begin - start) / 1000, 'dur': (end - begin) / 1000}
+            for name, begin, end in Profiler.trace
+        )
+
+        events.extend(
+            {'name': name, 'ph': 'C', 'pid': 0, 'tid': 0, 'ts': (time - start) / 1000, 'args': {name: value}}
+            for name, time, value in Profiler.counters
+        )
+
+        Profiler.trace = None
+        Profiler.counters = None
+        Profiler.enabled = Profiler.trace_enabled
+
+        if filename is None:
+            filename = Profiler.output('trace', 'json')
+
+        with open(filename, 'w') as file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file)
+
+        return filename
+
+
+    @staticmethod
+    def capturing() -> bool:
+        return Profiler.capture is not None
+
+
+    @staticmethod
+    def start_capture(ticks: int) -> None:
+        """ Run cProfile for the next ticks (everything: updates and frames) """
+        if Profiler.capture is not None:
+            return
+
+        Profiler.capture_ticks = ticks
+        Profiler.capture = cProfile.Profile()
+        Profiler.capture.enable()
+
+
+    @staticmethod
+    def stop_capture(filename: str = None) -> (str | None):
+        """
+            Stop the capture, save its stats and a summary of the top functions (same name, but .txt)
+
+            Arguments:
+                filename: Where to save the .pstats, a timestamped file in the profiles directory if not given
+
+            Returns:
+                The .pstats filename, or None if there was no capture
+        """
+        if Profiler.capture is None:
+            return None
+
+        capture = Profiler.capture
+        capture.disable()
+        Profiler.capture = None
+
+        if filename is None:
+            filename = Profiler.output('profile', 'pstats')
+
+        capture.dump_stats(filename)
+
+        # Top functions, by their own time and with their callees
+        with open(os.path.splitext(filename)[0] + '.txt', 'w') as file:
+            stats = pstats.Stats(capture, stream = file).strip_dirs()
+            stats.sort_stats(pstats.SortKey.TIME).print_stats(Profiler.SUMMARY_SIZE)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(Profiler.SUMMARY_SIZE)
+
+        return filename
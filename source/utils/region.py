@@ -5,6 +5,8 @@ import pickletools
 
 from pickle import dumps, loads
 
+from source.utils.profiler import Profiler
+
 # A humble attempt at chunk storage. It’s not Minecraft, but at least it fits in your pocket.
 # If you were looking for performance or advanced features, you may want to try something else.
 # But hey, it works... just don't tell anyone it’s a bit less impressive than the original.
@@ -17,7 +19,7 @@ class Region:
     SECTOR_SIZE = 4096 # Disks quickly access 4096 byte sectors, so we can load things much faster
     HEADER_SIZE = (REGION_SIZE * REGION_SIZE) * 8  # 16x16 chunks * 8 bytes per entry
 
-    __slots__ = ('chunks_dir', 'filename', 'positions')
+    __slots__ = ('chunks_dir', 'filename', 'positions', 'capacity', 'free', 'end')
 
     def __init__(self, world_dir, rx, ry): # type: (str, int, int) -> None
         """
@@ -34,8 +36,15 @@ class Region:
         self.filename = os.path.join(self.chunks_dir, f'r.{rx}.{ry}.mcr')
         self.positions: dict[tuple[int, int], tuple[int, int]] = {}  # (x, y) -> (offset, size)
 
+        # Room of each chunk slot (whole sectors, the data can be smaller), the
+        # slots left by the chunks that outgrew them, and the end of the last slot
+        self.capacity: dict[tuple[int, int], int] = {}
+        self.free: list[tuple[int, int]] = []
+        self.end: int = Region.HEADER_SIZE
+
         if os.path.exists(self.filename):
             self._load_header()
+            self._layout()
         else:
             self._create_new()
 
@@ -62,6 +71,42 @@ class Region:
                     self.positions[(x, y)] = (offset, size)
 
 
+    def _layout(self) -> None:
+        """ Get the capacity of each slot from the file layout (up to the next slot) """
+        slots = sorted(self.positions.items(), key = lambda item: item[1][0])
+
+        self.capacity.clear()
+        self.free.clear()
+        self.end = Region.HEADER_SIZE
+
+        for index, (position, (offset, size)) in enumerate(slots):
+            if index + 1 < len(slots):
+                self.capacity[position] = slots[index + 1][1][0] - offset
+            else:
+                self.capacity[position] = Region.sectors(size)
+
+            self.end = max(self.end, offset + self.capacity[position])
+
+
+    def _allocate(self, size: int) -> tuple[int, int]:
+        """ Get a slot for some bytes, a free one if big enough, or a new one at the end """
+        needed = Region.sectors(size)
+
+        for index, (offset, capacity) in enumerate(self.free):
+            if capacity >= needed:
+                return self.free.pop(index)
+
+        offset = self.end
+        self.end += needed
+        return offset, needed
+
+
+    @staticmethod
+    def sectors(size: int) -> int:
+        """ Round a size up to whole sectors """
+        return -(-size // Region.SECTOR_SIZE) * Region.SECTOR_SIZE
+
+
     def _write_header(self) -> None:
         """ Update the region file header with current chunk positions """
         header_data = bytearray(Region.HEADER_SIZE)
@@ -75,6 +120,7 @@ class Region:
             file.write(header_data)
 
 
+    @Profiler.timed('region.write')
     def write_chunk(self, cx, cy, data): # type: (int, int, dict) -> None
         """
             Write a chunk to the region file
@@ -88,18 +134,20 @@ class Region:
         chunk_size = len(chunk_data)
 
         with open(self.filename, 'r+b') as file:
-            # Determine write position
-            if (cx, cy) not in self.positions:
-                file.seek(0, 2)  # Seek to end
-                current_pos = max(file.tell(), Region.HEADER_SIZE)
-            else:
+            # Rewrite in place if it fits, or move to another slot (and free this one)
+            if chunk_size <= self.capacity.get((cx, cy), 0):
                 current_pos = self.positions[(cx, cy)][0]
+            else:
+                if (cx, cy) in self.capacity:
+                    self.free.append((self.positions[(cx, cy)][0], self.capacity[(cx, cy)]))
+
+                current_pos, self.capacity[(cx, cy)] = self._allocate(chunk_size)
 
             # Write chunk data
             file.seek(current_pos)
             file.write(chunk_data)
 
-            # Update positions
+            # Update positions (the size of the data, the slot keeps its capacity)
             self.positions[(cx, cy)] = (current_pos, chunk_size)
 
             # Update header
@@ -108,6 +156,7 @@ class Region:
             file.write(current_pos.to_bytes(4, 'big') + chunk_size.to_bytes(4, 'big'))
 
 
+    @Profiler.timed('region.read')
     def read_chunk(self, cx, cy): # type: (int, int) -> dict | None
         """
             Read a chunk from the region file
@@ -147,8 +196,9 @@ class Region:
         if (cx, cy) not in self.positions:
             return False
 
-        # Remove chunk position from tracked positions
-        del self.positions[(cx, cy)]
+        # Remove chunk position from tracked positions (its slot can be reused)
+        offset, _ = self.positions.pop((cx, cy))
+        self.free.append((offset, self.capacity.pop((cx, cy))))
 
         # Rewrite the header to reflect chunk removal
         self._write_header()
@@ -214,6 +264,7 @@ class Region:
 
         # Update header with new positions
         self._write_header()
+        self._layout()
 
         return True
 
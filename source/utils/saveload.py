@@ -8,16 +8,19 @@ from typing import TYPE_CHECKING
 
 from pygame import Vector2
 
-from source.entity.entities import Entities
+from source.utils.constants import CHUNK_SIZE
+from source.utils.profiler import Profiler
 from source.utils.region import Region
 
 if TYPE_CHECKING:
     from source.core.updater import Updater
+    from source.world.world import World
 
 
 class Saveload:
 
     @staticmethod
+    @Profiler.timed('save')
     def save(updater: Updater) -> None:
         """ Save the game state including mobs """
         world = updater.world
@@ -25,7 +28,7 @@ class Saveload:
         custom = updater.game.custom
 
         # Determine save directory based on custom mode
-        save_dir = './mods/saves' if custom.custom_world else './saves'
+        save_dir = './mods/saves' if custom.custom_world else world.save_dir
         os.makedirs(save_dir, exist_ok=True)
 
         # Prepare data for saving
@@ -34,7 +37,10 @@ class Saveload:
                 'seed': world.seed,
                 'perm': world.perm,
                 'spawn': world.spawn,
-                'ticks': updater.ticks
+                'ticks': updater.ticks,
+
+                # The entities are saved with their chunks (not in entities.dat)
+                'chunk_entities': True
             },
 
             'player': {
@@ -58,22 +64,19 @@ class Saveload:
             level.write(b'MCPY')  # Magic number for security
             level.write(pickletools.optimize(pickle.dumps(data, protocol=5)))
 
-        # Save entities to separate file
-        entities_data = [entity.data() for entity in world.entities]
-        with open(f'{save_dir}/entities.dat', 'wb') as entities:
-            entities.write(pickletools.optimize(pickle.dumps(entities_data, protocol=5)))
-
         # Save modified chunks to their region files
+        Saveload.save_chunks(world, save_dir)
+
+
+    @staticmethod
+    def save_chunks(world: World, save_dir: str) -> None:
+        """ Save the loaded chunks that are modified, or with other entities """
         for (cx, cy), chunk in world.chunks.items():
-            if chunk.modified:
+            if world.store_entities(chunk) or chunk.modified:
                 rx, ry, lcx, lcy = Region.get_region(cx, cy)
                 region = Region(save_dir, rx, ry)
 
-                data = {
-                    'tiles': chunk.data()
-                }
-
-                region.write_chunk(lcx, lcy, data)
+                region.write_chunk(lcx, lcy, world.chunk_data(chunk))
                 chunk.modified = False
 
 
@@ -85,7 +88,7 @@ class Saveload:
         custom = updater.game.custom
 
         # Determine save directory based on custom mode
-        save_dir = './mods/saves' if custom.custom_world else './saves'
+        save_dir = './mods/saves' if custom.custom_world else world.save_dir
 
         with open(f'{save_dir}/level.dat', 'rb') as level:
             # Verify magic number
@@ -119,34 +122,41 @@ class Saveload:
             player.health = player_data['health']
             player.energy = player_data['energy']
 
+            # The saved entities come with the chunks, so reload them too
+            world.clear_entities()
+            world.chunks.clear()
             world.initialize(world.seed, False)
             player.initialize(world, Vector2(float(player_data['x']), float(player_data['y'])))
 
-        # Load entities
-        try:
-            with open(f'{save_dir}/entities.dat', 'rb') as entities_file:
-                entities = pickle.load(entities_file)
-                world.entities.clear()
+        # Old saves keep all the entities in entities.dat
+        if os.path.exists(f'{save_dir}/entities.dat'):
+            Saveload.migrate(world, save_dir)
 
-                for entity_data in entities:
-                    eid = entity_data['eid']
-                    # For avoid load particles and invalid entities
-                    if (eid < 0):
-                        continue
+        # If we not are running a custom world ...
+        elif not header.get('chunk_entities') and not custom.custom_world:
+            # Handle case where entities file doesn't exist
+            world.populate()
 
-                    # Create new entity instance from saved EID
-                    entity = Entities.get(eid)
+        world.loaded = True
+        world.from_save = True
 
-                    # Restore mob state
-                    entity.position = Vector2(entity_data['x'], entity_data['y'])
-                    entity.facing = Vector2(entity_data['fx'], entity_data['fy'])
 
-                    world.add(entity)
+    @staticmethod
+    def migrate(world: World, save_dir: str) -> None:
+        """ Move the entities of entities.dat to their chunks (kept as entities.dat.old) """
+        with open(f'{save_dir}/entities.dat', 'rb') as entities_file:
+            # Invalid entities (EID -1) aren't loaded, so don't load their chunks either
+            entities = [data for data in pickle.load(entities_file) if data['eid'] >= 0]
 
-        except FileNotFoundError:
-            # If we not are running a custom world ...
-            if not custom.custom_world:
-                # Handle case where entities file doesn't exist
-                world.populate()
+        # Load the chunk of each entity, and add it there
+        for entity_data in entities:
+            world.load_chunk(int(entity_data['x'] // CHUNK_SIZE), int(entity_data['y'] // CHUNK_SIZE))
 
-        world.loaded = True
+        world.load_entities(entities)
+
+        # Unload the far chunks (with their entities), and save the rest
+        world.save_chunks(world.player.cx, world.player.cy)
+        Saveload.save_chunks(world, save_dir)
+
+        os.replace(f'{save_dir}/entities.dat', f'{save_dir}/entities.dat.old')
+        print(f"> {len(entities)} entities moved from entities.dat to their chunks")
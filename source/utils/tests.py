@@ -7,7 +7,6 @@ from random import choice, randint
 from pygame import Vector2
 
 from source.entity.entities import Entities
-from source.entity.particle.text import TextParticle
 
 if TYPE_CHECKING:
     from source.core.player import Player
@@ -32,8 +31,8 @@ class Tests:
 
     @staticmethod
     def clear_mobs(world: World, player: Player) -> None:
-        world.entities.clear()
-        world.add(TextParticle("LOL", player.position.x, player.position.y, (255, 0, 255)))
+        world.clear_entities()
+        world.particles.text("LOL", player.position.x, player.position.y, (255, 0, 255))
 
 
     @staticmethod
@@ -6,6 +6,7 @@ from source.utils.constants import (
     CHUNK_SIZE, SCREEN_HEIGHT, SCREEN_WIDTH,
     TILE_HALF, TILE_MULT, TILE_SIZE
 )
+from source.utils.profiler import Profiler
 
 if TYPE_CHECKING:
     from source.world.tile import Tile
@@ -14,7 +15,7 @@ if TYPE_CHECKING:
 
 class Chunk:
     """ Represents a chunk of tiles in the world """
-    __slots__ = ('tiles', 'modified', 'x', 'y')
+    __slots__ = ('tiles', 'modified', 'entities', 'solid', 'liquid', 'walkable', 'x', 'y')
 
     # Screen boundaries for regular tiles culling
     BOUNDS = (
@@ -23,6 +24,13 @@ class Chunk:
         SCREEN_HEIGHT - TILE_HALF
     )
 
+    # Bitmap masks: all the tiles, and the borders (their neighbors are on other chunks)
+    FULL: int = (1 << (CHUNK_SIZE * CHUNK_SIZE)) - 1
+    LEFT: int = sum(1 << (y * CHUNK_SIZE) for y in range(CHUNK_SIZE))
+    RIGHT: int = LEFT << (CHUNK_SIZE - 1)
+    TOP: int = (1 << CHUNK_SIZE) - 1
+    BOTTOM: int = TOP << (CHUNK_SIZE * (CHUNK_SIZE - 1))
+
     def __init__(self, x: int, y: int, tiles: list) -> None:
         self.x: int = x
         self.y: int = y
@@ -31,6 +39,48 @@ class Chunk:
         # New chunks are considered modified until saved
         self.modified: bool = True
 
+        # Saved entities of the chunk (as their data), see World.store_entities
+        self.entities: list[dict] = []
+
+        # Collision bitmaps, the bit (y * CHUNK_SIZE + x) of each tile
+        self.solid: int = 0
+        self.liquid: int = 0
+
+        # Where a mob can stand: not solid or liquid, and the 4 tiles around not
+        # solid (the ones on other chunks are checked by World.walkable)
+        self.walkable: int = 0
+        self.masks()
+
+    def masks(self) -> None:
+        """ Rebuild the collision bitmaps from the tiles """
+        solid = liquid = 0
+        bit = 1
+
+        for row in self.tiles:
+            for tile in row:
+                if tile.solid:
+                    solid |= bit
+                if tile.liquid:
+                    liquid |= bit
+                bit <<= 1
+
+        self.solid = solid
+        self.liquid = liquid
+        self.clearance()
+
+    def clearance(self) -> None:
+        """ Derive the walkable bitmap from the solid and liquid ones """
+        free = ~self.solid & Chunk.FULL
+
+        # A bit shift moves each tile over its neighbor, the borders pass
+        self.walkable = (
+            free & ~self.liquid
+            & ((free << 1) | Chunk.LEFT)
+            & ((free >> 1) | Chunk.RIGHT)
+            & ((free << CHUNK_SIZE) | Chunk.TOP)
+            & ((free >> CHUNK_SIZE) | Chunk.BOTTOM)
+        )
+
     def get(self, x: int, y: int) -> Tile:
         """ Get a tile at local coordinates """
         return self.tiles[y][x]
@@ -40,6 +90,11 @@ class Chunk:
         self.tiles[y][x] = tile
         self.modified = True
 
+        bit = 1 << (y * CHUNK_SIZE + x)
+        self.solid = (self.solid | bit) if tile.solid else (self.solid & ~bit)
+        self.liquid = (self.liquid | bit) if tile.liquid else (self.liquid & ~bit)
+        self.clearance()
+
     def copy(self) -> list[list[Tile]]:
         """ Create a copy of the chunk tiles """
         return [row[:] for row in self.tiles]
@@ -48,6 +103,7 @@ class Chunk:
         """ Fill the chunk with new tiles """
         self.tiles = tiles
         self.modified = True
+        self.masks()
 
     def data(self) -> list[list[int]]:
         """ Get serializable tile data for saving """
@@ -75,6 +131,7 @@ class Chunk:
         return dist_x <= 3 and dist_y <= 3
 
 
+    @Profiler.timed('chunk.render')
     def render(self, world: World, camera_x: int, camera_y: int) -> None:
         """ Render this chunk's tiles """
         cx = self.x * CHUNK_SIZE * TILE_SIZE + camera_x  # Chunk base x
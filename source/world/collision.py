@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from math import hypot
+from typing import TYPE_CHECKING
+
+from pygame import Vector2
+
+from source.utils.constants import CHUNK_SIZE, POSITION_SHIFT, TILE_BITS
+
+if TYPE_CHECKING:
+    from source.entity.entity import Entity
+    from source.world.world import World
+
+
+class Collision:
+    """
+        Movement and tile collision of the player, mobs and furniture, against the chunk bitmaps
+
+        - The steps are in fixed point (TILE_BITS per tile), like the old movement code
+        - Each body has its rules: liquids block the ones that can't swim, and the
+          player adds its own ones (cactus, furniture) around these pieces
+    """
+
+    @staticmethod
+    def blocked(world: World, x: int, y: int, liquid: bool = True) -> bool:
+        """
+            Check if a tile blocks the bodies (solid, not loaded, or liquid)
+
+            Arguments:
+                x, y: Tile coordinates
+                liquid: If the liquids block too (for the bodies that can't swim)
+        """
+        chunk = world.chunks.get((x // CHUNK_SIZE, y // CHUNK_SIZE))
+        if not chunk:
+            return True
+
+        bit = 1 << ((y % CHUNK_SIZE) * CHUNK_SIZE + x % CHUNK_SIZE)
+        return bool(chunk.solid & bit or (liquid and chunk.liquid & bit))
+
+
+    @staticmethod
+    def liquid(world: World, x: int, y: int) -> bool:
+        """ Check if a tile is liquid (False if not loaded) """
+        chunk = world.chunks.get((x // CHUNK_SIZE, y // CHUNK_SIZE))
+        if not chunk:
+            return False
+
+        return bool(chunk.liquid >> ((y % CHUNK_SIZE) * CHUNK_SIZE + x % CHUNK_SIZE) & 1)
+
+
+    @staticmethod
+    def step(position: Vector2, mx: float, my: float, speed: float) -> (tuple[float, float, int, int] | None):
+        """
+            A step towards a target
+
+            Returns:
+                The movement (dx, dy) and the tile where it lands, None if already there
+        """
+        dx = mx - position.x
+        dy = my - position.y
+
+        if dx == 0 and dy == 0:
+            return None
+
+        # Normalize the movement vector and apply speed uniformly
+        length = hypot(dx, dy)
+        dx = (dx / length) * speed
+        dy = (dy / length) * speed
+
+        # Bit-shifted format to tile coordinates
+        tile_x = int((position.x + dx) * TILE_BITS) >> POSITION_SHIFT
+        tile_y = int((position.y + dy) * TILE_BITS) >> POSITION_SHIFT
+
+        return dx, dy, tile_x, tile_y
+
+
+    @staticmethod
+    def slide(world: World, position: Vector2, dx: float, dy: float, tile_x: int, tile_y: int, liquid: bool = True) -> tuple[float, float]:
+        """ On a diagonal step, drop the movement axis blocked by the tile on that side """
+        current_x = int(position.x)
+        current_y = int(position.y)
+
+        if current_x != tile_x and current_y != tile_y:
+            if Collision.blocked(world, tile_x, current_y, liquid):
+                dx = 0 # Block horizontal movement
+
+            if Collision.blocked(world, current_x, tile_y, liquid):
+                dy = 0 # Block vertical movement
+
+        return dx, dy
+
+
+    @staticmethod
+    def apply(body: Entity, dx: float, dy: float, tile_x: int, tile_y: int) -> None:
+        """ Move a body, and update its facing and chunk position """
+        body.position.x += dx
+        body.position.y += dy
+
+        body.facing.update(dx, dy)
+        body.facing.normalize_ip()
+
+        body.cx = tile_x // CHUNK_SIZE
+        body.cy = tile_y // CHUNK_SIZE
+
+
+    @staticmethod
+    def move(world: World, body: Entity, mx: float, my: float, speed: float) -> bool:
+        """
+            Move a body towards a target with the common rules (the ones of the furniture)
+
+            Returns:
+                If the body moved
+        """
+        if not (step := Collision.step(body.position, mx, my, speed)):
+            return False
+
+        dx, dy, tile_x, tile_y = step
+        liquid = not body.can_swim()
+
+        dx, dy = Collision.slide(world, body.position, dx, dy, tile_x, tile_y, liquid)
+
+        if Collision.blocked(world, tile_x, tile_y, liquid) or (dx == 0 and dy == 0):
+            return False
+
+        Collision.apply(body, dx, dy, tile_x, tile_y)
+        return True
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from math import inf
+from typing import TYPE_CHECKING
+
+from source.utils.constants import CHUNK_SIZE
+from source.utils.profiler import Profiler
+from source.world.pathfinder import Pathfinder
+
+if TYPE_CHECKING:
+    from pygame import Vector2
+    from source.world.world import World
+
+
+class FlowField:
+    """
+        Distances to the player over the tiles where a mob can stand, shared by all the chasing mobs
+
+        - A Dijkstra from the player tile (or the nearest walkable one), on a window around it
+        - Rebuilt on the next query when the player changes of tile, or the terrain around changes
+        - Each mob then moves to the neighbor closer to the player, the same cost for any number of mobs
+    """
+
+    # Tiles from the player covered by the field (the chase range, plus room for the detours)
+    RADIUS: int = 12
+
+    def __init__(self, world: World) -> None:
+        self.world: World = world
+
+        # Player tile of the field, and if it needs a rebuild
+        self.x: int = None
+        self.y: int = None
+        self.dirty: bool = True
+
+        # Window of the field, with a blocked border (like the Pathfinder one)
+        self.size: int = FlowField.RADIUS * 2 + 3
+        self.left: int = 0
+        self.top: int = 0
+
+        # Distance of each tile to the player, and the next tile towards it (flat indices, x-major)
+        self.distance = array('d', [inf]) * (self.size * self.size)
+        self.parent = array('i', [-1]) * (self.size * self.size)
+
+        # Chunks under the window, and their bitmaps on the last build (-1 if not loaded)
+        self.keys: list[tuple[int, int]] = []
+        self.solid: list[int] = []
+        self.liquid: list[int] = []
+
+
+    def update(self) -> None:
+        """ Check if the field is out of date, each tick (the rebuild waits for a query) """
+        if self.dirty:
+            return
+
+        position = self.world.player.position
+        if int(position.x) != self.x or int(position.y) != self.y or self.changed():
+            self.dirty = True
+
+
+    def changed(self) -> bool:
+        """ Check if the terrain under the window changed since the last build """
+        chunks = self.world.chunks
+
+        for key, solid, liquid in zip(self.keys, self.solid, self.liquid):
+            chunk = chunks.get(key)
+
+            if chunk is None:
+                if solid != -1:
+                    return True
+
+            elif chunk.solid != solid or chunk.liquid != liquid:
+                return True
+
+        return False
+
+
+    @Profiler.timed('entity.flow')
+    def build(self) -> None:
+        """ Compute the distances from the player tile """
+        world = self.world
+        position = world.player.position
+        size = self.size
+
+        self.x = int(position.x)
+        self.y = int(position.y)
+        self.left = self.x - FlowField.RADIUS - 1
+        self.top = self.y - FlowField.RADIUS - 1
+        self.dirty = False
+
+        # Terrain under the window, the walkable tiles on its edges depend on the next chunks
+        self.keys = [
+            (cx, cy)
+            for cx in range((self.left - 1) // CHUNK_SIZE, (self.left + size) // CHUNK_SIZE + 1)
+            for cy in range((self.top - 1) // CHUNK_SIZE, (self.top + size) // CHUNK_SIZE + 1)
+        ]
+
+        chunks = [world.chunks.get(key) for key in self.keys]
+        self.solid = [chunk.solid if chunk else -1 for chunk in chunks]
+        self.liquid = [chunk.liquid if chunk else -1 for chunk in chunks]
+
+        distance = self.distance = array('d', [inf]) * (size * size)
+        parent = self.parent = array('i', [-1]) * (size * size)
+
+        if not (source := Pathfinder.nearest(world, self.x, self.y)):
+            return
+
+        # Tile states: 0 not checked yet, 1 walkable, 2 blocked, 3 done
+        state = bytearray(size * size)
+        for lx in range(size):
+            state[lx * size] = state[lx * size + size - 1] = 2
+        state[:size] = state[-size:] = b'\x02' * size
+
+        neighbors = [(dx * size + dy, dx, dy, cost) for dx, dy, cost in Pathfinder.NEIGHBORS]
+        left, top = self.left, self.top
+        walkable = world.walkable
+        push = heapq.heappush
+        pop = heapq.heappop
+
+        first = (source[0] - left) * size + (source[1] - top)
+        distance[first] = 0.0
+        frontier = [(0.0, first)]
+
+        while frontier:
+            cost, current = pop(frontier)
+
+            if state[current] == 3:
+                continue
+            state[current] = 3
+
+            cx, cy = divmod(current, size)
+
+            for offset, dx, dy, step in neighbors:
+                node = current + offset
+                walk = state[node]
+
+                if walk == 0:
+                    walk = state[node] = 1 if walkable(left + cx + dx, top + cy + dy) else 2
+
+                if walk != 1:
+                    continue
+
+                new_cost = cost + step
+                if new_cost < distance[node]:
+                    distance[node] = new_cost
+                    parent[node] = current
+                    push(frontier, (new_cost, node))
+
+
+    def toward(self, position: Vector2) -> (tuple[float, float] | None):
+        """
+            Where a mob should move to get closer to the player
+
+            Returns:
+                The next tile, None if the player can't be reached (or the mob is on its tile)
+        """
+        if self.dirty:
+            self.build()
+
+        size = self.size
+        lx = int(position.x) - self.left
+        ly = int(position.y) - self.top
+
+        if not (0 < lx < size - 1 and 0 < ly < size - 1):
+            return None
+
+        index = lx * size + ly
+        distance = self.distance
+
+        # Already on the player tile, nothing to follow (like an empty path)
+        if distance[index] == 0.0:
+            return None
+
+        # Mobs on a tile out of the field (like next to a wall) step to the best neighbor
+        if (node := self.parent[index]) < 0:
+            best = inf
+            for dx, dy, cost in Pathfinder.NEIGHBORS:
+                around = index + dx * size + dy
+                if distance[around] + cost < best:
+                    best = distance[around] + cost
+                    node = around
+
+            if node < 0:
+                return None
+
+        x, y = divmod(node, size)
+        return float(self.left + x), float(self.top + y)
@@ -7,6 +7,7 @@ from pygame import Vector2  # Add Vector2 import
 from source.world.noise import Noise
 from source.world.chunk import Chunk
 from source.utils.constants import CHUNK_SIZE
+from source.utils.profiler import Profiler
 
 if TYPE_CHECKING:
     from source.world.tiles import Tiles
@@ -28,6 +29,7 @@ class Generator:
         }
 
 
+    @Profiler.timed('chunk.generate')
     def make_chunk(self, cx: int, cy: int, perm: list) -> list[list[Tile]]:
         """
             Generate terrain for a single chunk.
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from math import cos, hypot, inf, pi, sin, sqrt
+from typing import TYPE_CHECKING
+
+from source.utils.constants import CHUNK_SIZE
+
+if TYPE_CHECKING:
+    from source.world.world import World
+
+
+class Pathfinder:
+    """
+        A* over a window of the world, the tiles where a mob can stand (see World.walkable)
+
+        - The window is the box of the loaded chunks (only their tiles can be walkable), cut down
+          to the tiles LIMIT expansions can reach from the start
+        - Nodes are flat indices on the window (x-major, so the ties break like (x, y) tuples)
+          with array scores, and the walkability of each tile is checked once
+        - The arrays are shared by all the searches, each one only resets the part its window uses
+        - 8 directions, diagonals cost sqrt(2), and the heuristic is the octile distance
+    """
+
+    # Max nodes expanded on a search (no path after that)
+    LIMIT: int = 4096
+
+    # Search buffers: tile states (0 not checked yet, 1 walkable, 2 blocked, 3 expanded), cost
+    # from the start and parent, and blank copies to reset them (they grow with the biggest window)
+    state = bytearray()
+    g = array('d')
+    came = array('i')
+    blank: tuple[bytes, array, array] = (b'', array('d'), array('i'))
+
+    # Neighbors (dx, dy, cost), in the order of the old angle loop (0, 45 ... 315 degrees)
+    NEIGHBORS: tuple[tuple[int, int, float], ...] = (
+        ( 1,  0, 1.0), ( 1,  1, sqrt(2)),
+        ( 0,  1, 1.0), (-1,  1, sqrt(2)),
+        (-1,  0, 1.0), (-1, -1, sqrt(2)),
+        ( 0, -1, 1.0), ( 1, -1, sqrt(2)),
+    )
+
+    # Spots around an unreachable end, to find the nearest one where a mob can stand
+    AROUND: tuple[tuple[int, int], ...] = tuple(
+        (int(cos(angle * pi / 180) * dist), int(sin(angle * pi / 180) * dist))
+        for angle in range(0, 360, 45)
+        for dist in range(1, 4)
+    )
+
+    DIAGONAL: float = sqrt(2) - 2
+
+
+    @staticmethod
+    def nearest(world: World, x: int, y: int) -> (tuple[int, int] | None):
+        """ The closest spot around a tile where a mob can stand (the tile itself if it can) """
+        if world.walkable(x, y):
+            return x, y
+
+        best = None
+        min_distance = inf
+
+        for dx, dy in Pathfinder.AROUND:
+            if world.walkable(x + dx, y + dy):
+                distance = hypot(dx, dy)
+
+                if distance < min_distance:
+                    min_distance = distance
+                    best = (x + dx, y + dy)
+
+        return best
+
+
+    @staticmethod
+    def search(world: World, start: tuple[int, int], end: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+            Find the shortest path between two tiles
+
+            Returns:
+                The tiles of the path (without the start), empty if there is none
+        """
+        sx, sy = start
+        ex, ey = end
+
+        # The start must be loaded, the end walkable
+        if (sx // CHUNK_SIZE, sy // CHUNK_SIZE) not in world.chunks or not world.walkable(ex, ey):
+            return []
+
+        if start == end:
+            return []
+
+        # Too far for LIMIT expansions (and out of the window)
+        if max(abs(ex - sx), abs(ey - sy)) > Pathfinder.LIMIT + 1:
+            return []
+
+        # The window, the loaded area with a blocked border so the neighbors never leave it. Each
+        # expansion goes one tile further at most, so nothing past LIMIT tiles from the start is
+        # ever reached
+        xs = [cx for cx, _ in world.chunks]
+        ys = [cy for _, cy in world.chunks]
+        reach = Pathfinder.LIMIT + 1
+
+        left = max(min(xs) * CHUNK_SIZE, sx - reach) - 1
+        top = max(min(ys) * CHUNK_SIZE, sy - reach) - 1
+        width = min((max(xs) + 1) * CHUNK_SIZE, sx + reach + 1) - left + 1
+        height = min((max(ys) + 1) * CHUNK_SIZE, sy + reach + 1) - top + 1
+
+        state, g, came = Pathfinder.buffers(width * height)
+
+        for lx in range(width):
+            state[lx * height] = state[lx * height + height - 1] = 2
+        state[:height] = b'\x02' * height
+        state[(width - 1) * height:width * height] = b'\x02' * height
+
+        neighbors = [(dx * height + dy, dx, dy, cost) for dx, dy, cost in Pathfinder.NEIGHBORS]
+        diagonal = Pathfinder.DIAGONAL
+        walkable = world.walkable
+        push = heapq.heappush
+        pop = heapq.heappop
+
+        first = (sx - left) * height + (sy - top)
+        goal = (ex - left) * height + (ey - top)
+        gx, gy = ex - left, ey - top
+
+        g[first] = 0.0
+        frontier = [(0.0, first)]
+        expanded = 0
+
+        while frontier:
+            _, current = pop(frontier)
+
+            if current == goal:
+                break
+
+            # Stale entry, the node was already expanded with a lower cost
+            if state[current] == 3:
+                continue
+            state[current] = 3
+
+            expanded += 1
+            if expanded > Pathfinder.LIMIT:
+                return []
+
+            cost = g[current]
+            cx, cy = divmod(current, height)
+
+            for offset, dx, dy, step in neighbors:
+                node = current + offset
+                walk = state[node]
+
+                if walk == 0:
+                    walk = state[node] = 1 if walkable(left + cx + dx, top + cy + dy) else 2
+
+                if walk != 1:
+                    continue
+
+                new_cost = cost + step
+                if new_cost < g[node]:
+                    g[node] = new_cost
+                    came[node] = current
+
+                    # Octile distance to the end
+                    hx = abs(gx - cx - dx)
+                    hy = abs(gy - cy - dy)
+                    push(frontier, (new_cost + hx + hy + diagonal * (hx if hx < hy else hy), node))
+
+        if g[goal] == inf:
+            return []
+
+        # Rebuild the path
+        path = []
+        current = goal
+        while current != first:
+            x, y = divmod(current, height)
+            path.append((left + x, top + y))
+            current = came[current]
+
+        path.reverse()
+        return path
+
+
+    @staticmethod
+    def buffers(size: int) -> tuple[bytearray, array, array]:
+        """ The search buffers, reset on their first size tiles (grown if needed) """
+        if len(Pathfinder.state) < size:
+            Pathfinder.blank = (bytes(size), array('d', [inf]) * size, array('i', [-1]) * size)
+            Pathfinder.state = bytearray(size)
+            Pathfinder.g = array('d', [inf]) * size
+            Pathfinder.came = array('i', [-1]) * size
+
+        else:
+            # Copies between views, nothing new to allocate
+            for buffer, blank in zip((Pathfinder.state, Pathfinder.g, Pathfinder.came), Pathfinder.blank):
+                with memoryview(buffer) as target, memoryview(blank) as source:
+                    target[:size] = source[:size]
+
+        return Pathfinder.state, Pathfinder.g, Pathfinder.came
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator
+
+from pygame import Vector2
+
+from source.utils.constants import CHUNK_SIZE
+
+if TYPE_CHECKING:
+    from source.entity.entity import Entity
+
+
+class SpatialIndex:
+    """
+        Entities bucketed by the chunk they are in, so we only look at the nearby ones
+
+        - The world keeps it updated on add, remove and after each entity update
+        - Queries are in tile coordinates
+    """
+
+    __slots__ = ('buckets',)
+
+    def __init__(self) -> None:
+        # Each bucket is keyed by the entity runtime ID, so removing is O(1)
+        self.buckets: dict[tuple[int, int], dict[int, Entity]] = {}
+
+
+    @staticmethod
+    def cell(position: Vector2) -> tuple[int, int]:
+        """ Chunk coordinates of a position (floored, also for negative positions) """
+        return int(position.x // CHUNK_SIZE), int(position.y // CHUNK_SIZE)
+
+
+    def add(self, entity: Entity) -> None:
+        entity.cell = SpatialIndex.cell(entity.position)
+
+        if bucket := self.buckets.get(entity.cell):
+            bucket[entity.uid] = entity
+        else:
+            self.buckets[entity.cell] = {entity.uid: entity}
+
+
+    def remove(self, entity: Entity) -> None:
+        bucket = self.buckets.get(entity.cell)
+        if not bucket or entity.uid not in bucket:
+            return
+
+        del bucket[entity.uid]
+        if not bucket:
+            del self.buckets[entity.cell]
+
+        entity.cell = None
+
+
+    def move(self, entity: Entity) -> None:
+        """ Update the bucket of an entity that may have moved (if it wasn't removed) """
+        if entity.cell is not None and SpatialIndex.cell(entity.position) != entity.cell:
+            self.remove(entity)
+            self.add(entity)
+
+
+    def clear(self) -> None:
+        for bucket in self.buckets.values():
+            for entity in bucket.values():
+                entity.cell = None
+
+        self.buckets.clear()
+
+
+    def query_chunks(self, xs: range, ys: range) -> Iterator[Entity]:
+        """ All the entities in a range of chunks """
+        for cx in xs:
+            for cy in ys:
+                if bucket := self.buckets.get((cx, cy)):
+                    yield from bucket.values()
+
+
+    def query_rect(self, x0: float, y0: float, x1: float, y1: float) -> Iterator[Entity]:
+        """ Entities inside a rectangle (borders included) """
+        xs = range(int(x0 // CHUNK_SIZE), int(x1 // CHUNK_SIZE) + 1)
+        ys = range(int(y0 // CHUNK_SIZE), int(y1 // CHUNK_SIZE) + 1)
+
+        for entity in self.query_chunks(xs, ys):
+            if x0 <= entity.position.x <= x1 and y0 <= entity.position.y <= y1:
+                yield entity
+
+
+    def query_radius(self, position: Vector2, radius: float) -> Iterator[Entity]:
+        """ Entities closer than radius to a position """
+        x, y = position.x, position.y
+        squared = radius * radius
+
+        for entity in self.query_rect(x - radius, y - radius, x + radius, y + radius):
+            dx = entity.position.x - x
+            dy = entity.position.y - y
+            if dx * dx + dy * dy < squared:
+                yield entity
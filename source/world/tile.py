@@ -5,8 +5,6 @@ from typing import TYPE_CHECKING
 
 from pygame import Surface
 
-from source.entity.particle.smash import SmashParticle
-from source.entity.particle.text import TextParticle
 from source.screen.color import Color
 from source.utils.constants import TILE_HALF, TILE_SIZE
 from source.utils.autoslots import auto_slots
@@ -54,8 +52,8 @@ class Tile:
             world.game.sound.play("genericHurt")
 
             if self.solid:
-                world.add(SmashParticle(x, y))
-                world.add(TextParticle(str(damage), x + 0.40, y + 0.40, Color.RED))
+                world.particles.smash(x, y)
+                world.particles.text(str(damage), x + 0.40, y + 0.40, Color.RED)
 
             if (self.health <= 0) and (self.parent > -1):
                 world.set_tile(x, y, self.parent)
@@ -7,16 +7,22 @@ from pygame import Vector2
 import pygame
 
 from source.entity.entities import Entities
+from source.entity.particle.particles import Particles
 
 from source.screen.tilemap import Tilemap
+from source.utils.profiler import Profiler
 from source.utils.region import Region
 from source.world.chunk import Chunk
+from source.world.collision import Collision
+from source.world.flowfield import FlowField
 from source.world.generator import Generator
 from source.world.noise import Noise
+from source.world.spatial import SpatialIndex
 
 from source.utils.constants import (
     TILE_SIZE, CHUNK_SIZE, RENDER_SIZE,
-    SCREEN_HALF, DIRECTIONS
+    SCREEN_HALF, DIRECTIONS, SIMULATION_NEAR,
+    SIMULATION_RATE
 )
 
 if TYPE_CHECKING:
@@ -38,12 +44,36 @@ class World:
 
         self.is_custom = False
 
+        # Where the world regions and data are saved
+        self.save_dir: str = './saves'
+
         # Permutation matrix for noise generation
         self.perm: list = []
 
         # Storage for entities and chunks
         self.chunks: dict = {}
-        self.entities: list[Entity] = []
+        self.entities: dict[int, Entity] = {}
+
+        # Last runtime ID given to an entity
+        self.uid: int = 0
+
+        # Entities to remove at the end of the tick
+        self.removed: dict[int, Entity] = {}
+
+        # Entities by chunk, for the nearby queries
+        self.index: SpatialIndex = SpatialIndex()
+
+        # Particles aren't entities, they have their own arrays
+        self.particles: Particles = Particles(self)
+
+        # Shared paths of the chasing mobs towards the player
+        self.flow: FlowField = FlowField(self)
+
+        # Hostile mobs touching the player on this tick
+        self.touching: list[Entity] = []
+
+        # Entities on each simulation tier (on the last tick)
+        self.tiers: dict[str, int] = {'near': 0, 'mid': 0, 'sleeping': 0, 'frozen': 0}
 
         self.ticks: int = 0
 
@@ -55,11 +85,18 @@ class World:
         self.sprites: Sprites = sprites
         self.loaded: bool = False
 
+        # Loaded from a save (not generated from the seed alone, so it can't be replayed)
+        self.from_save: bool = False
+
         self.generator = Generator(tiles)
         self.tilemap = Tilemap(tiles)
 
         self.surfaces = []
 
+        # Render interpolation between the last two ticks
+        self.alpha: float = 1.0
+        self.camera: Vector2 = Vector2(0, 0)
+
 
     def initialize(self, worldseed, populate: bool) -> None:
         """ Initialize the world with a seed and optionally populate it with entities """
@@ -70,6 +107,8 @@ class World:
         self.seed = worldseed
         seed(self.seed)
 
+        self.from_save = False
+
         self.perm = Noise.permutation()
 
         self.tiles.initialize()
@@ -104,52 +143,56 @@ class World:
         if (cx, cy) in self.chunks:
             return
 
-        if self.is_custom:
-            if chunk := self.game.custom.get_chunk(cx, cy):
-                self.chunks[(cx, cy)] = chunk
+        with Profiler.scope('chunk.load'):
+            if self.is_custom:
+                if chunk := self.game.custom.get_chunk(cx, cy):
+                    self.chunks[(cx, cy)] = chunk
+                    self.load_entities(chunk.entities)
                 return
-            return
 
-        # Try to load from region file first
-        rx, ry, lcx, lcy = Region.get_region(cx, cy)
-        region = Region('./saves', rx, ry)
-        chunk_data = region.read_chunk(lcx, lcy)
+            # Try to load from region file first
+            rx, ry, lcx, lcy = Region.get_region(cx, cy)
+            region = Region(self.save_dir, rx, ry)
+            chunk_data = region.read_chunk(lcx, lcy)
 
-        if chunk_data:
-            # Reconstruct chunk from saved data
-            chunk_tiles = [
-                [self.tiles.get(tile_id).clone() for tile_id in row]
-                for row in chunk_data['tiles']
-            ]
+            if chunk_data:
+                # Reconstruct chunk from saved data
+                chunk_tiles = [
+                    [self.tiles.get(tile_id).clone() for tile_id in row]
+                    for row in chunk_data['tiles']
+                ]
 
-            chunk: Chunk = Chunk(cx, cy, chunk_tiles)
-            chunk.modified = False # Loaded chunks start unmodified
+                chunk: Chunk = Chunk(cx, cy, chunk_tiles)
+                chunk.modified = False # Loaded chunks start unmodified
+                chunk.entities = chunk_data.get('entities', [])
 
-            self.chunks[(cx, cy)] = chunk
-            return
+                self.chunks[(cx, cy)] = chunk
+                self.load_entities(chunk.entities)
+                return
 
-        # Generate new chunk
-        chunk_tiles = self.generator.make_chunk(cx, cy, self.perm)
+            # Generate new chunk
+            chunk_tiles = self.generator.make_chunk(cx, cy, self.perm)
 
-        # Set a spawn point
-        if self.spawn.x == 0 and self.spawn.y == 0:
-            for h in range(CHUNK_SIZE):
-                for w in range(CHUNK_SIZE):
-                    tile = chunk_tiles[h][w]
-                    world_x = cx * CHUNK_SIZE + w
-                    world_y = cy * CHUNK_SIZE + h
+            # Set a spawn point
+            if self.spawn.x == 0 and self.spawn.y == 0:
+                for h in range(CHUNK_SIZE):
+                    for w in range(CHUNK_SIZE):
+                        tile = chunk_tiles[h][w]
+                        world_x = cx * CHUNK_SIZE + w
+                        world_y = cy * CHUNK_SIZE + h
 
-                    if not tile.solid and not tile.liquid:
-                        self.spawn.x = world_x
-                        self.spawn.y = world_y
-                        break
+                        if not tile.solid and not tile.liquid:
+                            self.spawn.x = world_x
+                            self.spawn.y = world_y
+                            break
 
-                if self.spawn.x != 0:
-                    break
+                    if self.spawn.x != 0:
+                        break
 
-        self.chunks[(cx, cy)] = Chunk(cx, cy, chunk_tiles)
+            self.chunks[(cx, cy)] = Chunk(cx, cy, chunk_tiles)
 
 
+    @Profiler.timed('chunk.unload')
     def save_chunks(self, center_x: int, center_y: int) -> None:
         """ Save and unload chunks that are too far from the center """
 
@@ -159,25 +202,63 @@ class World:
 
                 chunk: Chunk = self.chunks[(cx, cy)]
 
-                if self.is_custom:
-                    if chunk.modified:
+                # Save modified chunks (or with other entities) before unloading
+                if self.store_entities(chunk) or chunk.modified:
+                    if self.is_custom:
                         self.game.custom.save_chunk(chunk)
-                else:
-                    # Save modified chunks before unloading
-                    if chunk.modified:
+                    else:
                         rx, ry, lcx, lcy = Region.get_region(cx, cy)
-                        save_dir = './mods/saves' if self.game.custom.enabled else './saves'
-                        region = Region(save_dir, rx, ry)
+                        region = Region(self.save_dir, rx, ry)
 
-                        chunk_data = {
-                            'tiles': chunk.data()
-                        }
+                        region.write_chunk(lcx, lcy, self.chunk_data(chunk))
 
-                        region.write_chunk(lcx, lcy, chunk_data)
+                # The entities unload with their chunk
+                if bucket := self.index.buckets.get((cx, cy)):
+                    for entity in list(bucket.values()):
+                        self.discard(entity)
 
                 del self.chunks[(cx, cy)]
 
 
+    def store_entities(self, chunk: Chunk) -> bool:
+        """ Update the saved entities of a chunk with the ones in it, True if they changed """
+        bucket = self.index.buckets.get((chunk.x, chunk.y))
+
+        # Invalid entities (EID -1) aren't saved
+        entities = [entity.data() for entity in bucket.values() if entity.eid >= 0] if bucket else []
+
+        if entities == chunk.entities:
+            return False
+
+        chunk.entities = entities
+        return True
+
+
+    def chunk_data(self, chunk: Chunk) -> dict:
+        """ Get the chunk record for its region file """
+        return {
+            'tiles': chunk.data(),
+            'entities': chunk.entities
+        }
+
+
+    def load_entities(self, entities: list[dict]) -> None:
+        """ Add saved entities to the world (from their data) """
+        for data in entities:
+            # For avoid load particles and invalid entities
+            if data['eid'] < 0:
+                continue
+
+            # Create new entity instance from saved EID
+            entity = Entities.get(data['eid'])
+
+            # Restore mob state
+            entity.position = Vector2(data['x'], data['y'])
+            entity.facing = Vector2(data['fx'], data['fy'])
+
+            self.add(entity)
+
+
     def get_tile(self, x: int, y: int) -> (Tile | None):
         """ Get a tile at coordinates in the world  """
         if chunk := self.chunks.get((x // CHUNK_SIZE, y // CHUNK_SIZE)):
@@ -185,6 +266,31 @@ class World:
         return None
 
 
+    def walkable(self, x: int, y: int) -> bool:
+        """ Check if a mob can stand on a tile (not solid or liquid, and the 4 tiles around loaded and not solid) """
+        chunk = self.chunks.get((x // CHUNK_SIZE, y // CHUNK_SIZE))
+        if not chunk:
+            return False
+
+        lx = x % CHUNK_SIZE
+        ly = y % CHUNK_SIZE
+
+        if not chunk.walkable >> (ly * CHUNK_SIZE + lx) & 1:
+            return False
+
+        # The chunk bitmap can't see its neighbors, so check the borders here
+        last = CHUNK_SIZE - 1
+        if 0 < lx < last and 0 < ly < last:
+            return True
+
+        return not (
+            (lx == 0 and Collision.blocked(self, x - 1, y, False)) or
+            (lx == last and Collision.blocked(self, x + 1, y, False)) or
+            (ly == 0 and Collision.blocked(self, x, y - 1, False)) or
+            (ly == last and Collision.blocked(self, x, y + 1, False))
+        )
+
+
     def set_tile(self, x: int, y: int, tile: int) -> None:
         """ Set a tile at coordinates in the world """
         # Get chunk coordinates
@@ -208,7 +314,48 @@ class World:
     def add(self, entity: Entity) -> None:
         """ Add an entity to the World """
         entity.initialize(self)
-        self.entities.append(entity)
+        entity.previous.update(entity.position)
+
+        self.uid += 1
+        entity.uid = self.uid
+
+        self.entities[entity.uid] = entity
+        self.index.add(entity)
+
+
+    def remove(self, entity: Entity) -> None:
+        """ Queue an entity for removal, it keeps updating until the end of the tick """
+        if entity.uid in self.entities:
+            self.removed[entity.uid] = entity
+
+
+    def despawn(self) -> None:
+        """ Remove the queued entities """
+        for entity in self.removed.values():
+            self.discard(entity)
+
+        self.removed.clear()
+
+
+    def discard(self, entity: Entity) -> None:
+        """ Remove an entity right away (not while the entities update, use remove) """
+        if self.entities.pop(entity.uid, None) is not None:
+            self.index.remove(entity)
+
+
+    def clear_entities(self) -> None:
+        """ Remove all the entities right away """
+        self.entities.clear()
+        self.removed.clear()
+        self.index.clear()
+
+
+    def snapshot(self) -> None:
+        """ Keep the current positions as the previous tick ones (for interpolation) """
+        self.player.previous.update(self.player.position)
+
+        for entity in self.entities.values():
+            entity.previous.update(entity.position)
 
 
     def daylight(self) -> int:
@@ -229,10 +376,15 @@ class World:
             return 24
 
 
-    def render(self, screen: Screen) -> None:
+    @Profiler.timed('world.render')
+    def render(self, screen: Screen, alpha: float = 1.0) -> None:
         # Clear draw buffer at start
         self.surfaces.clear()
 
+        # Between the previous tick (0.0) and the current one (1.0)
+        self.alpha = alpha
+        self.camera = self.player.previous.lerp(self.player.position, alpha)
+
         # NOTE: All world elements are 2D, positioned using the X and Y axes.
         # They also have a Z axis representing sprite depth, which influences
         # the drawing order.
@@ -245,8 +397,8 @@ class World:
         # exception, typically having a Z value minor to -8.
 
         # Pre-calculate camera position
-        camera_x = int(SCREEN_HALF[0] - (self.player.position.x * TILE_SIZE))
-        camera_y = int(SCREEN_HALF[1] - (self.player.position.y * TILE_SIZE))
+        camera_x = int(SCREEN_HALF[0] - (self.camera.x * TILE_SIZE))
+        camera_y = int(SCREEN_HALF[1] - (self.camera.y * TILE_SIZE))
 
         # Calculate visible chunk range
         chunk_range = (
@@ -261,21 +413,24 @@ class World:
                 if chunk := self.chunks.get((chunk_x, chunk_y)):
                     chunk.render(self, camera_x, camera_y)
 
-        # Add mobs to draw
-        for entity in self.entities:
+        # Add mobs to draw (only the ones in the visible chunks)
+        for entity in self.index.query_chunks(*chunk_range):
             entity.render(screen)
 
+        self.particles.render(screen)
+
         # And the player ...
         self.surfaces.extend(self.player.render(screen))
 
         # Sort and render sprite buffers!
         self.surfaces.sort(key = lambda x: x[1][2])
-        screen.buffer.fblits([(sprite, (pos[0], pos[1])) for sprite, pos in self.surfaces])
+        screen.render_world(self.surfaces)
 
         # Also render the light dither
         screen.update_light(self.daylight())
 
 
+    @Profiler.timed('world.update')
     def update(self, ticks) -> None:
         """ Update the world events """
 
@@ -290,14 +445,58 @@ class World:
                 self.load_chunk(cx, cy)
                 self.update_chunk(cx, cy)
 
-        # Update mobs
-        for entity in self.entities:
-            entity.update()
+        # Mobs positions are the same until they update, so we can look for them here
+        self.touching = list(self.index.query_radius(self.player.position, 0.60))
+        self.flow.update()
+
+        # Update mobs (the ones spawned meanwhile start on the next tick)
+        with Profiler.scope('entity.update'):
+            tiers = dict.fromkeys(self.tiers, 0)
+
+            for entity in list(self.entities.values()):
+                tiers[self.tier(entity, ticks)] += 1
+
+                if entity.step:
+                    entity.update()
+                    self.index.move(entity)
+
+            self.tiers = tiers
+            self.despawn()
+
+        self.particles.update()
 
         if ticks % 512 == 0:
             # Unload distant chunks
             self.save_chunks(self.player.cx, self.player.cy)
 
+        # Counter tracks for the traces
+        Profiler.counter('entities', len(self.entities))
+        Profiler.counter('particles', len(self.particles))
+        Profiler.counter('chunks', len(self.chunks))
+
+
+    def tier(self, entity: Entity, ticks: int) -> str:
+        """ Get the simulation tier of an entity, and set its step (0 to skip it on this tick) """
+
+        # Nothing around to collide with, until the chunk loads again
+        if entity.cell not in self.chunks:
+            entity.step = 0
+            return 'frozen'
+
+        if entity.sleeping > 0:
+            entity.sleeping -= 1
+            entity.step = 0
+            return 'sleeping'
+
+        if (abs(entity.position.x - self.player.position.x) <= SIMULATION_NEAR and
+            abs(entity.position.y - self.player.position.y) <= SIMULATION_NEAR):
+            entity.step = 1
+            return 'near'
+
+        # Staggered by the ID, so the mid-range ones don't update all on the same tick
+        entity.step = SIMULATION_RATE if (ticks + entity.uid) % SIMULATION_RATE == 0 else 0
+        return 'mid'
+
 
     def update_chunk(self, cx: int, cy: int) -> None:
         chunk = self.chunks.get((cx, cy))
@@ -324,6 +523,7 @@ class World:
                 )
 
 
+    @Profiler.timed('world.tiles')
     def update_tiles(self, chunk: Chunk, target: Tile, parent: Tile, influences: list) -> None:
         replace = parent.clone()
         modified = False
@@ -0,0 +1,71 @@
+""" Shared fixtures: a headless game, and tile maps to test on """
+
+import os
+import sys
+
+# No window nor sound
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from source.core.headless import Headless
+from source.utils.constants import CHUNK_SIZE
+from source.world.chunk import Chunk
+from source.world.world import World
+
+
+@pytest.fixture(scope = 'session')
+def headless() -> Headless:
+    headless = Headless()
+    headless.initialize(12345, populate = False)
+    yield headless
+    headless.quit()
+
+
+@pytest.fixture
+def world(headless: Headless) -> World:
+    """ The world without entities nor particles (each test lays its own map) """
+    world = headless.world
+    world.clear_entities()
+    world.particles.clear()
+    world.flow.dirty = True
+
+    player = world.player
+    player.health = player.MAX_STAT
+    player.hurt_time = 0
+    player.swim_time = 0
+    player.facing.update(0, 1)
+
+    return world
+
+
+def layout(world: World, rows: list[str]) -> None:
+    """
+        Replace the world chunks with a map, its top-left corner at (0, 0), padded with stone
+
+        - '.' grass, '#' stone, '~' water, 'c' cactus
+    """
+    tiles = {
+        '.': world.tiles.grass,
+        '#': world.tiles.stone,
+        '~': world.tiles.water,
+        'c': world.tiles.cactus,
+    }
+
+    height = -(-len(rows) // CHUNK_SIZE)
+    width = -(-max(len(row) for row in rows) // CHUNK_SIZE)
+
+    world.chunks.clear()
+
+    for cy in range(height):
+        for cx in range(width):
+            world.chunks[(cx, cy)] = Chunk(cx, cy, [
+                [
+                    tiles[rows[y][x] if y < len(rows) and x < len(rows[y]) else '#'].clone()
+                    for x in range(cx * CHUNK_SIZE, (cx + 1) * CHUNK_SIZE)
+                ]
+                for y in range(cy * CHUNK_SIZE, (cy + 1) * CHUNK_SIZE)
+            ])
@@ -0,0 +1,257 @@
+""" The shared movement code (Collision) against the rules of the player, mobs and furniture """
+
+import random
+from math import hypot
+
+import pytest
+from pygame import Vector2
+
+from conftest import layout
+from source.entity.furniture.chest import Chest
+from source.entity.mob.pig import Pig
+from source.utils.constants import CHUNK_SIZE, POSITION_SHIFT, TILE_BITS
+from source.world.collision import Collision
+
+
+class Swimmer(Pig):
+    """ A pig that can swim (no mob can yet) """
+
+    def can_swim(self) -> bool:
+        return True
+
+
+# The map of most tests, walled around
+ROWS = [
+    "################",
+    "#..............#",
+    "#..............#",
+    "#....#.........#",
+    "#..............#",
+    "#......~~~~....#",
+    "#......~~~~....#",
+    "#......~~~~..c.#",
+    "#..............#",
+    "################",
+]
+
+
+def spawn(world, entity, x: float, y: float):
+    entity.position = Vector2(x, y)
+    world.add(entity)
+    return entity
+
+
+def place(player, x: float, y: float) -> None:
+    player.position.update(x, y)
+    player.cx = int(x) // CHUNK_SIZE
+    player.cy = int(y) // CHUNK_SIZE
+
+
+# The movement code from before Collision, to compare with
+
+def old_step(position: Vector2, mx: float, my: float, speed: float):
+    dx = mx - position.x
+    dy = my - position.y
+
+    if dx == 0 and dy == 0:
+        return None
+
+    length = hypot(dx, dy)
+    dx = (dx / length) * speed
+    dy = (dy / length) * speed
+
+    return dx, dy, int((position.x + dx) * TILE_BITS) >> POSITION_SHIFT, int((position.y + dy) * TILE_BITS) >> POSITION_SHIFT
+
+
+def old_body_move(world, body, mx: float, my: float, swims: bool, mob: bool) -> None:
+    if not (step := old_step(body.position, mx, my, body.speed)):
+        return
+
+    dx, dy, tile_x, tile_y = step
+    current_x = int(body.position.x)
+    current_y = int(body.position.y)
+
+    if current_x != tile_x and current_y != tile_y:
+        tile_h = world.get_tile(tile_x, current_y)
+        if not tile_h or tile_h.solid or (tile_h.liquid and not swims):
+            dx = 0
+
+        tile_v = world.get_tile(current_x, tile_y)
+        if not tile_v or tile_v.solid or (tile_v.liquid and not swims):
+            dy = 0
+
+    tile = world.get_tile(tile_x, tile_y)
+    if not tile or tile.solid or (tile.liquid and not swims):
+        return
+
+    if mob:
+        if body.hurt_time > 0:
+            return
+
+        here = world.get_tile(int(body.position.x), int(body.position.y))
+        if here and here.liquid:
+            body.swim_time += 1
+            if body.swim_time % 2 == 0:
+                return
+
+    if dx != 0 or dy != 0:
+        body.position.x += dx
+        body.position.y += dy
+
+        body.facing.update(dx, dy)
+        body.facing.normalize_ip()
+
+
+def test_solid_tiles_block(world):
+    layout(world, ROWS)
+    player = world.player
+
+    pig = spawn(world, Pig(), 4.5, 3.5)
+    chest = spawn(world, Chest(), 4.5, 4.5)
+    place(player, 6.5, 3.5)
+
+    for _ in range(60):
+        pig.move(world, 6.5, 3.5)
+        chest.move(world, 6.5, 4.0)
+        player.move(4.5, 3.5)
+
+    # Up to the stone at (5, 3), never into it
+    assert int(pig.position.x) == 4
+    assert int(player.position.x) == 6
+    assert pig.position.x > 4.9 and player.position.x < 6.1
+
+    # The chest is on the row below, nothing stops it
+    assert chest.position.x > 6.0
+
+
+def test_player_swims_slower(world):
+    layout(world, ROWS)
+    player = world.player
+
+    place(player, 7.5, 5.5)
+    for _ in range(10):
+        player.move(7.5, 9.0)
+
+    # Half of the steps are skipped in the water
+    assert player.position.y == pytest.approx(5.5 + 5 * player.speed)
+
+
+def test_walkers_stay_out_of_water(world):
+    layout(world, ROWS)
+
+    pig = spawn(world, Pig(), 5.5, 5.5)
+    chest = spawn(world, Chest(), 5.5, 6.5)
+
+    for _ in range(40):
+        pig.move(world, 9.5, 5.5)
+        chest.move(world, 9.5, 6.5)
+
+    assert int(pig.position.x) == 6
+    assert int(chest.position.x) == 6
+
+
+def test_swimmers_enter_water_slower(world):
+    layout(world, ROWS)
+
+    swimmer = spawn(world, Swimmer(), 7.5, 5.5)
+    start = swimmer.position.x
+
+    for _ in range(10):
+        swimmer.move(world, 12.5, 5.5)
+
+    assert swimmer.swimming()
+    assert swimmer.position.x == pytest.approx(start + 5 * swimmer.speed)
+
+
+def test_cactus_hurts_the_player(world):
+    layout(world, ROWS)
+    player = world.player
+
+    place(player, 12.5, 7.5)
+    health = player.health
+
+    for _ in range(20):
+        player.move(14.5, 7.5)
+
+    assert player.health == health - 1
+    assert int(player.position.x) != 13
+
+
+def test_diagonal_slides_along_walls(world):
+    layout(world, ROWS)
+
+    # Stone at (5, 3), right of the pig: only the vertical part is left
+    pig = spawn(world, Pig(), 4.99, 3.99)
+    pig.move(world, 6.0, 5.0)
+
+    assert pig.position.x == 4.99
+    assert pig.position.y > 3.99
+
+    # Same for the furniture, from the other side
+    chest = spawn(world, Chest(), 6.01, 3.99)
+    chest.move(world, 5.0, 5.0)
+
+    assert chest.position.x == 6.01
+    assert chest.position.y > 3.99
+
+
+def test_player_pushes_furniture(world):
+    layout(world, ROWS)
+    player = world.player
+
+    chest = spawn(world, Chest(), 3.5, 2.5)
+    place(player, 2.95, 2.5)
+    player.facing.update(1, 0)
+
+    # The player stops at the chest, and gives it a push
+    player.move(3.5, 2.5)
+    assert player.position.x == 2.95
+    assert chest.push_time == 10
+
+    for _ in range(10):
+        chest.update()
+
+    assert chest.position.x > 3.5
+    assert chest.push_time == 0
+
+
+def test_can_swim_rules_liquids(world):
+    layout(world, ROWS)
+
+    assert Collision.blocked(world, 8, 6)
+    assert not Collision.blocked(world, 8, 6, liquid = False)
+    assert Collision.blocked(world, 5, 3, liquid = False)
+
+    # Not loaded tiles block too
+    assert Collision.blocked(world, -20, -20, liquid = False)
+
+    assert Collision.move(world, spawn(world, Swimmer(), 6.98, 5.5), 8.5, 5.5, 0.06)
+    assert not Collision.move(world, spawn(world, Pig(), 6.98, 6.5), 8.5, 6.5, 0.06)
+
+
+@pytest.mark.parametrize('kind', ['pig', 'swimmer', 'chest'])
+def test_same_moves_as_the_old_code(world, kind):
+    layout(world, ROWS)
+    rng = random.Random(kind)
+
+    make = {'pig': Pig, 'swimmer': Swimmer, 'chest': Chest}[kind]
+    mob = kind != 'chest'
+
+    for _ in range(40):
+        x, y = rng.uniform(1, 15), rng.uniform(1, 9)
+        if Collision.blocked(world, int(x), int(y), kind != 'swimmer'):
+            continue
+
+        new = spawn(world, make(), x, y)
+        old = make()
+        old.position = Vector2(x, y)
+
+        for step in range(120):
+            if step % 30 == 0:
+                mx, my = rng.uniform(0, 16), rng.uniform(0, 10)
+
+            new.move(world, mx, my)
+            old_body_move(world, old, mx, my, kind == 'swimmer', mob)
+
+            assert new.position == old.position
+            assert new.facing == old.facing
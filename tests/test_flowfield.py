@@ -0,0 +1,115 @@
+""" The flow field the chasing mobs follow (world.flow), and when it gets rebuilt """
+
+from math import hypot
+
+import pytest
+from pygame import Vector2
+
+from conftest import layout
+from source.utils.constants import CHUNK_SIZE
+from test_pathfinder import shortest
+
+
+# A wall between the mob and the player, open at the bottom
+ROWS = [
+    "####################",
+    "#........#.........#",
+    "#........#.........#",
+    "#........#.........#",
+    "#........#.........#",
+    "#........#.........#",
+    "#..................#",
+    "#..................#",
+    "#..................#",
+    "#..................#",
+    "#..................#",
+    "####################",
+]
+
+
+def place(player, x: float, y: float) -> None:
+    player.position.update(x, y)
+    player.cx = int(x) // CHUNK_SIZE
+    player.cy = int(y) // CHUNK_SIZE
+
+
+def follow(world, x: int, y: int) -> list[tuple[int, int]]:
+    """ The tiles a mob goes through, following the field from a tile """
+    tiles = []
+
+    while (target := world.flow.toward(Vector2(x + 0.5, y + 0.5))) and len(tiles) < 100:
+        x, y = int(target[0]), int(target[1])
+        tiles.append((x, y))
+
+    return tiles
+
+
+def check(world, start: tuple[int, int], end: tuple[int, int]) -> list[tuple[int, int]]:
+    """ Follow the field, all the way to the player and as short as it gets """
+    tiles = follow(world, *start)
+    assert tiles and tiles[-1] == end
+
+    cost = 0.0
+    for (x0, y0), (x1, y1) in zip([start] + tiles, tiles):
+        assert max(abs(x1 - x0), abs(y1 - y0)) == 1
+        assert world.walkable(x1, y1)
+        cost += hypot(x1 - x0, y1 - y0)
+
+    assert cost == pytest.approx(shortest(world, start, end))
+    return tiles
+
+
+def test_reaches_the_player_around_a_wall(world):
+    layout(world, ROWS)
+    place(world.player, 14.5, 3.5)
+
+    tiles = check(world, (4, 3), (14, 3))
+
+    # Under the wall
+    assert max(y for _, y in tiles) >= 7
+
+
+def test_unreachable(world):
+    rows = [row[:9] + '#' + row[10:] for row in ROWS]
+    layout(world, rows)
+    place(world.player, 14.5, 3.5)
+
+    assert world.flow.toward(Vector2(4.5, 3.5)) is None
+
+    # And out of the field
+    assert world.flow.toward(Vector2(14.5 + 40, 3.5)) is None
+
+
+def test_rebuilds(world):
+    layout(world, ROWS)
+    flow = world.flow
+    place(world.player, 14.5, 3.5)
+
+    flow.toward(Vector2(4.5, 3.5))
+    assert not flow.dirty
+
+    # Moving in the same tile keeps it
+    place(world.player, 14.9, 3.1)
+    flow.update()
+    assert not flow.dirty
+
+    # Another tile, rebuilt on the next query
+    place(world.player, 15.5, 3.5)
+    flow.update()
+    assert flow.dirty
+
+    tiles = check(world, (4, 3), (15, 3))
+    assert not flow.dirty and (flow.x, flow.y) == (15, 3)
+
+    # A tile that doesn't change the walls keeps it
+    world.chunks[(0, 0)].set(2, 2, world.tiles.grass.clone())
+    flow.update()
+    assert not flow.dirty
+
+    # A new wall in the way of the mob
+    x, y = tiles[len(tiles) // 2]
+    world.chunks[(x // CHUNK_SIZE, y // CHUNK_SIZE)].set(x % CHUNK_SIZE, y % CHUNK_SIZE, world.tiles.stone.clone())
+    flow.update()
+    assert flow.dirty
+
+    assert (x, y) not in check(world, (4, 3), (15, 3))
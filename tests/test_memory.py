@@ -0,0 +1,23 @@
+""" Memory accounting: the pixels of the surfaces, counted once """
+
+from pygame import Surface
+
+from source.utils.memory import Memory
+
+
+def test_subsurfaces_share_their_parent(headless):
+    atlas = Surface((64, 32)).convert()
+    sprites = {'a': atlas.subsurface((0, 0, 8, 8)), 'b': [atlas.subsurface((8, 0, 8, 8)), atlas]}
+
+    count, size = Memory.surfaces(sprites)
+
+    assert count == 3
+    assert size == atlas.get_pitch() * atlas.get_height()
+
+
+def test_nested_subsurfaces(headless):
+    atlas = Surface((64, 32)).convert()
+    tile = atlas.subsurface((0, 0, 16, 16)).subsurface((0, 0, 8, 8))
+    other = Surface((8, 8)).convert()
+
+    assert Memory.surfaces([tile, other])[1] == atlas.get_pitch() * 32 + other.get_pitch() * 8
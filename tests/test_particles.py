@@ -0,0 +1,39 @@
+""" Particles: the glyph cache stays bounded, without replacing the glyphs still on screen """
+
+from source.entity.particle.particles import Particles
+from source.screen.color import Color
+
+
+def test_glyphs_are_bounded(world):
+    particles = world.particles
+
+    for damage in range(Particles.GLYPH_CACHE * 4):
+        particles.text(str(damage), 1.0, 1.0, Color.RED)
+
+        # Gone before the next one
+        for _ in range(Particles.TEXT_LIFE):
+            particles.update()
+
+    assert len(particles.glyphs) == Particles.GLYPH_CACHE
+    assert len(particles.keys) == Particles.GLYPH_CACHE
+
+    # The newest ones are kept, and the smash glyph never goes
+    assert ('text', str(Particles.GLYPH_CACHE * 4 - 1), tuple(Color.RED)) in particles.glyphs
+    assert particles.glyphs[('smash',)] == Particles.SMASH
+
+
+def test_living_glyphs_stay(world):
+    particles = world.particles
+    particles.text("first", 1.0, 1.0, Color.RED)
+
+    for damage in range(Particles.GLYPH_CACHE * 2):
+        particles.text(str(damage), 1.0, 1.0, Color.RED)
+
+        # Only the first one lives on
+        for column in (particles.x, particles.y, particles.px, particles.py, particles.z, particles.xa,
+                       particles.ya, particles.za, particles.gravity, particles.age, particles.life, particles.glyph):
+            del column[1:]
+
+    # The first particle still has its own glyph
+    assert particles.keys[particles.glyph[0]] == ('text', "first", tuple(Color.RED))
+    assert len(particles.keys) == Particles.GLYPH_CACHE
@@ -0,0 +1,98 @@
+""" Point to point paths (Brain.find_path and the Pathfinder), against a plain Dijkstra """
+
+import heapq
+from math import hypot, inf
+
+import pytest
+from pygame import Vector2
+
+from benchmarks import maps
+from source.entity.mob.zombie import Zombie
+from source.world.pathfinder import Pathfinder
+
+
+def shortest(world, start: tuple[int, int], end: tuple[int, int]) -> float:
+    """ The cost of the shortest path, over the walkable tiles """
+    costs = {start: 0.0}
+    frontier = [(0.0, start)]
+
+    while frontier:
+        cost, (x, y) = heapq.heappop(frontier)
+        if (x, y) == end:
+            return cost
+
+        for dx, dy, step in Pathfinder.NEIGHBORS:
+            node = (x + dx, y + dy)
+            if world.walkable(*node) and cost + step < costs.get(node, inf):
+                costs[node] = cost + step
+                heapq.heappush(frontier, (cost + step, node))
+
+    return inf
+
+
+def check(world, start: tuple[int, int], end: tuple[int, int]) -> None:
+    path = Pathfinder.search(world, start, end)
+    best = shortest(world, start, end)
+
+    if best == inf:
+        assert path == []
+        return
+
+    # Steps to the next tiles, all walkable, and as short as it gets
+    assert path[-1] == end
+    cost = 0.0
+    for (x0, y0), (x1, y1) in zip([start] + path, path):
+        assert max(abs(x1 - x0), abs(y1 - y0)) == 1
+        assert world.walkable(x1, y1)
+        cost += hypot(x1 - x0, y1 - y0)
+
+    assert cost == pytest.approx(best)
+
+
+def test_open_map(world):
+    maps.load(world, maps.open_map(48))
+
+    for start, end in (((2, 2), (45, 45)), ((2, 45), (45, 2)), ((20, 20), (28, 28)), ((5, 24), (42, 24))):
+        check(world, start, end)
+
+
+def test_maze(world):
+    maps.load(world, maps.maze_map(10, 12345))
+
+    for start, end in (((2, 2), (38, 38)), ((2, 38), (38, 2)), ((18, 18), (2, 2)), ((6, 2), (30, 34))):
+        check(world, start, end)
+
+
+def test_unreachable(world):
+    rows = maps.open_map(24)
+    rows[12] = '#' * 24
+    maps.load(world, rows)
+
+    assert Pathfinder.search(world, (4, 4), (4, 20)) == []
+
+
+def test_find_path(world):
+    maps.load(world, maps.open_map(24))
+    brain = Zombie().brain
+
+    # The end is in the wall, so the path goes to the nearest spot where a mob can stand
+    path = brain.find_path(world, Vector2(4.5, 4.5), Vector2(23.5, 4.5))
+    end = Pathfinder.nearest(world, 23, 4)
+
+    assert path[-1] == Vector2(end)
+    assert len(path) == len(Pathfinder.search(world, (4, 4), end)) * 4 - 3
+
+    # Already there
+    assert brain.find_path(world, Vector2(4.5, 4.5), Vector2(4.2, 4.7)) == []
+
+
+def test_wall_detour(world):
+    # A wall across most of the map, the path goes all the way around its end
+    rows = maps.open_map(120)[:40]
+    rows[-1] = '#' * 120
+    rows[20] = '#' * 100 + rows[20][100:]
+    maps.load(world, rows)
+
+    for start, end in (((50, 10), (50, 30)), ((4, 10), (4, 30))):
+        assert Pathfinder.search(world, start, end)
+        check(world, start, end)
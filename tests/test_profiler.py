@@ -0,0 +1,30 @@
+""" Profiler: traces and captures that stop by themselves, saved under their own names """
+
+import os
+
+from source.utils.profiler import Profiler
+
+
+def test_update_tells_the_kinds_apart(tmp_path, monkeypatch):
+    monkeypatch.setattr(Profiler, 'PROFILES_DIR', str(tmp_path))
+
+    Profiler.start_trace(0)
+    Profiler.start_capture(1)
+
+    saved = dict(Profiler.update())
+
+    assert saved['trace'].endswith('.json') and os.path.basename(saved['trace']).startswith('trace-')
+    assert saved['profile'].endswith('.pstats') and os.path.basename(saved['profile']).startswith('profile-')
+    assert not Profiler.tracing() and not Profiler.capturing()
+
+
+def test_stops_in_the_same_second(tmp_path, monkeypatch):
+    monkeypatch.setattr(Profiler, 'PROFILES_DIR', str(tmp_path))
+    names = set()
+
+    for _ in range(5):
+        Profiler.start_trace(10)
+        names.add(Profiler.stop_trace())
+
+    assert len(names) == 5
+    assert len(list(tmp_path.glob('trace-*.json'))) == 5
@@ -0,0 +1,62 @@
+""" Region files: chunk slots keep their room, so rewrites don't grow the file """
+
+import os
+
+import pytest
+
+from source.utils.region import Region
+
+
+@pytest.fixture
+def region(tmp_path) -> Region:
+    yield Region(str(tmp_path), 0, 0)
+
+
+def record(entities: int) -> dict:
+    return {
+        'tiles': [[1] * 8 for _ in range(8)],
+        'entities': [{'eid': 1, 'x': float(index), 'y': 2.0, 'fx': 0.0, 'fy': 1.0} for index in range(entities)]
+    }
+
+
+def test_rewrites_reuse_the_slot(region):
+    region.write_chunk(0, 0, record(4))
+    region.write_chunk(1, 0, record(4))
+    size = os.path.getsize(region.filename)
+
+    # Like the autosaves, the entities come and go
+    for count in (0, 20, 3, 12, 0, 20) * 10:
+        region.write_chunk(0, 0, record(count))
+
+    assert os.path.getsize(region.filename) == size
+    assert region.read_chunk(0, 0) == record(20)
+    assert region.read_chunk(1, 0) == record(4)
+
+
+def test_outgrown_slots_are_reused(region):
+    region.write_chunk(0, 0, record(1))
+    region.write_chunk(1, 0, record(1))
+
+    # Bigger than a sector, it moves to a new slot and frees the old one
+    region.write_chunk(0, 0, record(200))
+    end = region.end
+
+    region.write_chunk(2, 0, record(1))
+    assert region.end == end
+
+    for position, count in (((0, 0), 200), ((1, 0), 1), ((2, 0), 1)):
+        assert region.read_chunk(*position) == record(count)
+
+
+def test_capacity_survives_reopening(region, tmp_path):
+    region.write_chunk(0, 0, record(20))
+    region.write_chunk(1, 0, record(1))
+    region.write_chunk(0, 0, record(0))
+
+    reopened = Region(str(tmp_path), 0, 0)
+    assert reopened.capacity == region.capacity
+
+    reopened.write_chunk(0, 0, record(20))
+    assert reopened.end == region.end
+    assert reopened.read_chunk(0, 0) == record(20)
+    assert reopened.read_chunk(1, 0) == record(1)
@@ -0,0 +1,16 @@
+""" Saves: a loaded world is marked, so it isn't recorded as a new one (see main.py --record) """
+
+from source.utils.saveload import Saveload
+
+
+def test_loaded_worlds_are_marked(headless, world):
+    updater = headless.game.updater
+    assert not world.from_save
+
+    Saveload.save(updater)
+    Saveload.load(updater)
+    assert world.from_save
+
+    # A new world from the seed can be replayed again
+    world.initialize(world.seed, False)
+    assert not world.from_save
@@ -0,0 +1,72 @@
+""" Procedural textures: the row-based light overlay, and the versioned disk cache """
+
+import os
+
+import pytest
+
+from source.screen.textures import Textures
+
+
+def reference(size: int, dither: tuple, falloff: float, step: int) -> bytes:
+    """ The overlay pixel by pixel """
+    half = size // 2
+    data = bytearray(b'\xff\xff\xff\x00' * (size * size))
+
+    for y in range(size):
+        for x in range(size):
+            distance = (x - half) * (x - half) + (y - half) * (y - half)
+
+            if distance < half * half:
+                alpha = max(0, 255 - (distance * falloff) - (dither[y % 4][x % 4] * step))
+                index = (y * size + x) * 4
+                data[index:index + 4] = (0, 0, 0, int(alpha))
+
+    return bytes(data)
+
+
+@pytest.mark.parametrize('size', [1, 2, 7, 64, 101])
+def test_overlay_matches_the_pixels(size):
+    params = (size, Textures.DITHER, 0.0255, 13)
+    assert Textures._light_overlay(*params) == reference(*params)
+
+
+def test_cache_is_versioned(tmp_path, monkeypatch):
+    monkeypatch.setattr(Textures, 'CACHE_DIR', str(tmp_path))
+    calls = []
+
+    def generate(size: int) -> bytes:
+        calls.append(size)
+        return bytes(size)
+
+    assert Textures.cached('test', (4,), generate, 4) == bytes(4)
+    assert Textures.cached('test', (4,), generate, 4) == bytes(4)
+    assert calls == [4]
+
+    # A new generator version doesn't read the old files
+    monkeypatch.setattr(Textures, 'VERSION', Textures.VERSION + 1)
+    Textures.cached('test', (4,), generate, 4)
+
+    assert calls == [4, 4]
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_broken_files_are_made_again(headless, tmp_path, monkeypatch):
+    monkeypatch.setattr(Textures, 'CACHE_DIR', str(tmp_path))
+    Textures.cached('test', (8,), bytes, 8)
+
+    # Like a write cut short
+    path = tmp_path / os.listdir(tmp_path)[0]
+    path.write_bytes(bytes(3))
+
+    assert Textures.cached('test', (8,), bytes, 8) == bytes(8)
+    assert path.read_bytes() == bytes(8)
+
+    # And the overlay starts anyway
+    monkeypatch.setattr(Textures, 'VERSION', -1)
+    Textures.light_overlay(16)
+    overlay = next(tmp_path.glob('overlay.*'))
+    overlay.write_bytes(b'')
+
+    assert Textures.light_overlay(16).get_size() == (16, 16)
+    assert overlay.stat().st_size == 16 * 16 * 4
+    assert not list(tmp_path.glob('*.tmp'))
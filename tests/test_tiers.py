@@ -0,0 +1,89 @@
+""" Mid-range mobs (see World.tier) update every few ticks, but move and count time like the near ones """
+
+from pygame import Vector2
+
+from conftest import layout
+from source.entity.brain import PassiveBrain, State
+from source.entity.mob.pig import Pig
+from source.utils.constants import SIMULATION_RATE
+
+
+ROWS = [
+    "################",
+    "#..............#",
+    "#......#.......#",
+    "#......#.......#",
+    "#......#.......#",
+    "################",
+]
+
+
+def spawn(world, x: float, y: float, step: int) -> Pig:
+    pig = Pig()
+    pig.position = Vector2(x, y)
+    world.add(pig)
+    pig.step = step
+    return pig
+
+
+def run(pig: Pig, ticks: int) -> int:
+    """ Update the pig like World.tier would, the tick it starts wandering (-1 if it doesn't) """
+    for tick in range(ticks):
+        if pig.sleeping > 0:
+            pig.sleeping -= 1
+            continue
+
+        if tick % pig.step == 0:
+            pig.update()
+
+        if pig.brain.state == State.MOVING:
+            return tick
+
+    return -1
+
+
+def test_same_moves_as_the_near_tier(world):
+    layout(world, ROWS)
+
+    near = spawn(world, 2.5, 3.5, 1)
+    mid = spawn(world, 2.5, 3.5, SIMULATION_RATE)
+
+    for tick in range(40 * SIMULATION_RATE):
+        near.move(world, 12.5, 1.5)
+        if tick % SIMULATION_RATE == 0:
+            mid.move(world, 12.5, 1.5)
+
+    assert mid.position == near.position
+
+
+def test_no_step_over_walls(world):
+    layout(world, ROWS)
+
+    # A whole tile or more on each update, it would jump the wall in one step
+    pig = spawn(world, 6.1, 3.5, SIMULATION_RATE)
+    pig.speed = 0.9
+
+    for _ in range(10):
+        pig.move(world, 9.5, 3.5)
+        assert int(pig.position.x) <= 6
+
+
+def test_timers_count_the_skipped_ticks(world, monkeypatch):
+    layout(world, ROWS)
+
+    # Always a spot to wander to (the random ones can all miss, and restart the timer)
+    monkeypatch.setattr(PassiveBrain, 'random_target', lambda brain, world: setattr(brain, 'state', State.MOVING))
+
+    near = spawn(world, 3.5, 1.5, 1)
+    mid = spawn(world, 11.5, 1.5, SIMULATION_RATE)
+
+    # Both wander after the same time (up to an update)
+    assert abs(run(near, 400) - run(mid, 400)) <= SIMULATION_RATE
+
+    near.hurt_time = mid.hurt_time = 15
+    for tick in range(16):
+        near.update()
+        if tick % SIMULATION_RATE == 0:
+            mid.update()
+
+    assert near.hurt_time == mid.hurt_time == 0